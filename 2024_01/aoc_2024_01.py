@@ -1,30 +1,38 @@
 from typing import List, Dict
 
-def find_similarities(list_left: List[str], list_right: List[str], memo: Dict[str, int] = None) -> int:
+from aoc.inputs import InputFile
+from aoc.phases import phase
+
+def find_similarities(list_left: List[int], list_right: List[int], memo: Dict[int, int] = None) -> int:
     if memo is None:
         memo = {}
     products = []
     for left_value in list_left:
         if left_value in memo:
-            products.append(int(left_value) * memo[left_value])
+            products.append(left_value * memo[left_value])
         else:
             count = list_right.count(left_value)
             memo[left_value] = count
-            products.append(int(left_value) * count)
+            products.append(left_value * count)
     return sum(products)
 
-def main(input_file_path: str) -> Dict[str, int]:
-    with open(input_file_path) as f:
-        data = [line.strip() for line in f]
+def main(input_file_path: str, has_part_2: bool = True) -> Dict[str, int]:
+    with phase("parse"):
+        with InputFile(input_file_path) as data:
+            list_left, list_right = zip(*data.integers(2))
+        list_left, list_right = sorted(list_left), sorted(list_right)
 
-    list_left, list_right = zip(*(line.split('   ') for line in data))
-    list_left, list_right = sorted(list_left), sorted(list_right)
+    with phase("part_1"):
+        differences = [abs(left - right) for left, right in zip(list_left, list_right)]
 
-    differences = [abs(int(left) - int(right)) for left, right in zip(list_left, list_right)]
+    part_2 = None
+    if has_part_2:
+        with phase("part_2"):
+            part_2 = find_similarities(list_left, list_right)
 
     return {
         "part_1": sum(differences),
-        "part_2": find_similarities(list_left, list_right)
+        "part_2": part_2
     }
 
 if __name__ == "__main__":
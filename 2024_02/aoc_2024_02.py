@@ -1,24 +1,31 @@
 from typing import List, Dict
 
-def main(input_file_path: str) -> Dict[str, int]:
-    data = read_input(input_file_path)
+from aoc.inputs import InputFile
+from aoc.phases import phase
+
+def main(input_file_path: str, has_part_2: bool = True) -> Dict[str, int]:
+    with phase("parse"):
+        data = read_input(input_file_path)
+    with phase("part_1"):
+        part_1 = count_safe_sequences(data)
+    part_2 = None
+    if has_part_2:
+        with phase("part_2"):
+            part_2 = count_safe_sequences_with_damper(data)
     return {
-        "part_1": count_safe_sequences(data),
-        "part_2": count_safe_sequences_with_damper(data)
+        "part_1": part_1,
+        "part_2": part_2
     }
 
-def read_input(input_file_path: str) -> List[str]:
-    with open(input_file_path) as f:
-        return [line.strip() for line in f]
+def read_input(input_file_path: str) -> List[List[int]]:
+    with InputFile(input_file_path) as data:
+        return data.integer_rows()
 
-def count_safe_sequences(data: List[str]) -> int:
-    return sum(1 for line in data if is_safe_sequence(parse_line(line)))
+def count_safe_sequences(data: List[List[int]]) -> int:
+    return sum(1 for sequence in data if is_safe_sequence(sequence))
 
-def count_safe_sequences_with_damper(data: List[str]) -> int:
-    return sum(1 for line in data if is_safe_with_damper(parse_line(line)))
-
-def parse_line(line: str) -> List[int]:
-    return list(map(int, line.split()))
+def count_safe_sequences_with_damper(data: List[List[int]]) -> int:
+    return sum(1 for sequence in data if is_safe_with_damper(sequence))
 
 def is_safe_sequence(sequence: List[int]) -> bool:
     diffs = [y - x for x, y in zip(sequence, sequence[1:])]
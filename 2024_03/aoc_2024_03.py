@@ -1,13 +1,20 @@
 import re
 from typing import Dict, List
 
-def main(input_file_path: str) -> Dict[str, int]:
-    data = read_input_file(input_file_path)
-    string = "".join(data)
+from aoc.phases import phase
+
+def main(input_file_path: str, has_part_2: bool = True) -> Dict[str, int]:
+    with phase("parse"):
+        data = read_input_file(input_file_path)
+        string = "".join(data)
     
-    part_1_result = extract_and_multiply(string)
-    part_2_string = process_string(string)
-    part_2_result = extract_and_multiply(part_2_string)
+    with phase("part_1"):
+        part_1_result = extract_and_multiply(string)
+    part_2_result = None
+    if has_part_2:
+        with phase("part_2"):
+            part_2_string = process_string(string)
+            part_2_result = extract_and_multiply(part_2_string)
     
     return {"part_1": part_1_result, "part_2": part_2_result}
 
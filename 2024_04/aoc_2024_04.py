@@ -1,50 +1,49 @@
-from typing import List, Dict
+from typing import Dict
 
+from aoc.grid import Grid
+from aoc.phases import phase
 
-def extract_diagonal_slices(data: List[str]) -> List[str]:
-    if not data:
-        return []
+TARGET = b"XMAS"
+DIAGONAL_ENDS = {ord("M"), ord("S")}
 
-    rows, cols = len(data), len(data[0])
-    diagonals = []
 
-    for d in range(rows + cols - 1):
-        diagonal = [data[row][d - row] for row in range(max(0, d - cols + 1), min(rows, d + 1))]
-        diagonals.append("".join(diagonal))
+def calculate_part_1(grid: Grid) -> int:
+    # Rows, columns and both diagonals, each read forwards and backwards.
+    reversed_target = TARGET[::-1]
+    return sum(
+        line.count(TARGET) + line.count(reversed_target)
+        for step in (1, grid.stride, grid.stride + 1, grid.stride - 1)
+        for line in grid.lines(step)
+    )
 
-    return diagonals
 
-def calculate_part_1(data: List[str]) -> int:
-    target = "XMAS"
-    counts = sum(line.count(target) + line[::-1].count(target) for line in data)
-    columns = ["".join(col) for col in zip(*data)]
-    counts += sum(col.count(target) + col[::-1].count(target) for col in columns)
-    diagonals = extract_diagonal_slices(data) + extract_diagonal_slices(data[::-1])
-    counts += sum(diagonal.count(target) + diagonal[::-1].count(target) for diagonal in diagonals)
-    return counts
-
-
-def calculate_part_2(data: List[str]) -> int:
-    comparison_set = {"M", "S"}
+def calculate_part_2(grid: Grid) -> int:
+    cells = grid.cells
+    increasing, decreasing = grid.stride + 1, grid.stride - 1
     count = 0
 
-    for row_idx in range(1, len(data) - 1):
-        for col_idx in range(1, len(data[0]) - 1):
-            if data[row_idx][col_idx] == "A":
-                increasing_diagonal = {data[row_idx - 1][col_idx - 1], data[row_idx + 1][col_idx + 1]}
-                decreasing_diagonal = {data[row_idx + 1][col_idx - 1], data[row_idx - 1][col_idx + 1]}
-                if increasing_diagonal == comparison_set and decreasing_diagonal == comparison_set:
-                    count += 1
+    # The border keeps the corners of edge cells inside the array.
+    for index in grid.find_all("A"):
+        increasing_diagonal = {cells[index - increasing], cells[index + increasing]}
+        decreasing_diagonal = {cells[index - decreasing], cells[index + decreasing]}
+        if increasing_diagonal == decreasing_diagonal == DIAGONAL_ENDS:
+            count += 1
 
     return count
 
 
-def main(input_file_path: str) -> Dict[str, int]:
-    with open(input_file_path) as f:
-        data = [line.strip() for line in f.readlines()]
+def main(input_file_path: str, has_part_2: bool = True) -> Dict[str, int]:
+    with phase("parse"):
+        grid = Grid.from_file(input_file_path)
+    with phase("part_1"):
+        part_1 = calculate_part_1(grid)
+    part_2 = None
+    if has_part_2:
+        with phase("part_2"):
+            part_2 = calculate_part_2(grid)
     return {
-        "part_1": calculate_part_1(data),
-        "part_2": calculate_part_2(data)
+        "part_1": part_1,
+        "part_2": part_2
     }
 
 
@@ -1,6 +1,8 @@
 from enum import Enum
 from typing import List, Dict, Tuple
 
+from aoc.phases import phase
+
 class PartType(Enum):
     PART_1 = 1
     PART_2 = 2
@@ -53,9 +55,16 @@ class Printer:
             return update[len(update) // 2]
                         
 
-def main(input_file_path: str):
-    printer = Printer(input_file_path)
-    return {"part_1": printer.process_updates(PartType.PART_1), "part_2": printer.process_updates(PartType.PART_2)}
+def main(input_file_path: str, has_part_2: bool = True):
+    with phase("parse"):
+        printer = Printer(input_file_path)
+    with phase("part_1"):
+        part_1 = printer.process_updates(PartType.PART_1)
+    part_2 = None
+    if has_part_2:
+        with phase("part_2"):
+            part_2 = printer.process_updates(PartType.PART_2)
+    return {"part_1": part_1, "part_2": part_2}
 
 if __name__ == "__main__":
     result = main('./2024_05/2024_05_input.txt')
@@ -1,7 +1,16 @@
+from concurrent.futures import Executor, ProcessPoolExecutor
+from contextlib import nullcontext
 from enum import Enum
-from typing import List, Optional
+from functools import partial
+from itertools import repeat
+from typing import List, Optional, Tuple
 from collections import deque
 
+from aoc.engines import available_cpus
+from aoc.inputs import InputFile
+from aoc.phases import phase
+from aoc.variants import VariantRegistry
+
 
 class Operand(Enum):
     CONCAT = 1
@@ -14,6 +23,24 @@ class PartType(Enum):
     PART_2 = 2
 
 
+# Calibrator methods that find the operators of an equation, fastest first.
+CALIBRATOR_ENGINES = (
+    "backtrace",
+    "roll_up_with_expressions",
+    "depth_first_search",
+    "breadth_first_search",
+)
+# Backtrace on a process pool, which only pays for its startup on big inputs.
+PARALLEL_ENGINE = "backtrace_parallel"
+ENGINES = CALIBRATOR_ENGINES + (PARALLEL_ENGINE,)
+# Engines `aoc.autotune` keeps timing however slow they are on small inputs.
+PARALLEL_ENGINES = (PARALLEL_ENGINE,)
+# Input statistic `aoc.engines` picks the engine by.
+TUNING_STATISTIC = "lines"
+
+Equation = Tuple[int, List[int]]
+
+
 class Calibrator:
     def __init__(self, part: PartType):
         self.part = part
@@ -133,29 +160,80 @@ class Calibrator:
         return helper(expected, nums, [])
 
 
-def main(input_file_path: str):
-    with open(input_file_path) as f:
-        data = [line.strip().split(":") for line in f.readlines()]
-        lines = [(int(line[0]), list(map(int, line[1].split()))) for line in data]
-
-    pt_1_calibrator = Calibrator(PartType.PART_1)
-    part_1_results = [
-        (pt_1_calibrator.backtrace(expected, nums), expected, nums)
-        for expected, nums in lines
-    ]
-    part_1_sum = sum(
-        expected for operator, expected, nums in part_1_results if operator is not None
-    )
-
-    pt_2_calibrator = Calibrator(PartType.PART_2)
-    part_2_results = [
-        (pt_2_calibrator.backtrace(expected, nums), expected, nums)
-        for operator, expected, nums in part_1_results
-        if operator is None
-    ]
-    part_2_sum = part_1_sum + sum(
-        expected for operator, expected, nums in part_2_results if operator is not None
-    )
+def parse_equations(input_file_path: str) -> List[Equation]:
+    with InputFile(input_file_path) as data:
+        return [(row[0], row[1:]) for row in data.integer_rows()]
+
+
+def engine_pool(engine: str):
+    """A process pool for the parallel engine, to share between both parts."""
+    if engine == PARALLEL_ENGINE:
+        return ProcessPoolExecutor(max_workers=len(available_cpus()))
+    return nullcontext()
+
+
+def solvable(
+    lines: List[Equation],
+    part: PartType,
+    engine: str,
+    pool: Optional[Executor] = None,
+) -> List[bool]:
+    """Whether some operators make each equation true.
+
+    The parallel engine runs on `pool`, or on a pool of its own without one.
+    """
+    if engine == PARALLEL_ENGINE:
+        if pool is None:
+            with engine_pool(engine) as pool:
+                return solvable(lines, part, engine, pool)
+        # A few chunks per worker, so one slow chunk does not hold up the rest.
+        chunk_size = max(1, len(lines) // (4 * len(available_cpus())))
+        chunks = [lines[i : i + chunk_size] for i in range(0, len(lines), chunk_size)]
+        results = pool.map(solvable, chunks, repeat(part), repeat("backtrace"))
+        return [flag for chunk in results for flag in chunk]
+    solve = getattr(Calibrator(part), engine)
+    return [solve(expected, nums) is not None for expected, nums in lines]
+
+
+def calibration_total(
+    lines: List[Equation],
+    part: PartType,
+    engine: str,
+    pool: Optional[Executor] = None,
+) -> int:
+    solved = solvable(lines, part, engine, pool)
+    return sum(expected for (expected, _), ok in zip(lines, solved) if ok)
+
+
+# Each engine solving each part on its own, for `aoc.variants.compare_variants`.
+VARIANTS = VariantRegistry(parse_equations)
+for engine in ENGINES:
+    for name, part in [("part_1", PartType.PART_1), ("part_2", PartType.PART_2)]:
+        VARIANTS.register(
+            name, engine, partial(calibration_total, part=part, engine=engine)
+        )
+
+
+def main(input_file_path: str, has_part_2: bool = True, engine: str = ENGINES[0]):
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown engine {engine}, expected one of {ENGINES}")
+    with phase("parse"):
+        lines = parse_equations(input_file_path)
+
+    with engine_pool(engine) as pool:
+        with phase("part_1"):
+            solved = solvable(lines, PartType.PART_1, engine, pool)
+            part_1_sum = sum(
+                expected for (expected, _), ok in zip(lines, solved) if ok
+            )
+
+        part_2_sum = None
+        if has_part_2:
+            with phase("part_2"):
+                unsolved = [line for line, ok in zip(lines, solved) if not ok]
+                part_2_sum = part_1_sum + calibration_total(
+                    unsolved, PartType.PART_2, engine, pool
+                )
 
     return {"part_1": part_1_sum, "part_2": part_2_sum}
 
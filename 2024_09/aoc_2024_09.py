@@ -2,6 +2,8 @@ from typing import Deque, Dict, Optional
 from enum import Enum
 from collections import defaultdict, deque
 
+from aoc.phases import phase
+
 
 class BlockType(Enum):
     FREE = 1
@@ -231,14 +233,19 @@ def part_1(
             first_empty_node = first_empty_node.next.next
 
 
-def main(input_file_path: str) -> dict:
-    with open(input_file_path) as f:
-        data = f.read().strip()
+def main(input_file_path: str, has_part_2: bool = True) -> dict:
+    with phase("parse"):
+        with open(input_file_path) as f:
+            data = f.read().strip()
+    with phase("part_1"):
         blocks = process_blocks(data, part=PartType.PART_1)
         part_1_result = aggregate_block_values(blocks)
-        blocks = process_blocks(data, part=PartType.PART_2)
-        part_2_result = aggregate_block_values(blocks)
-        return {"part_1": part_1_result, "part_2": part_2_result}
+    part_2_result = None
+    if has_part_2:
+        with phase("part_2"):
+            blocks = process_blocks(data, part=PartType.PART_2)
+            part_2_result = aggregate_block_values(blocks)
+    return {"part_1": part_1_result, "part_2": part_2_result}
 
 
 if __name__ == "__main__":
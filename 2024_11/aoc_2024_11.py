@@ -1,5 +1,7 @@
 from typing import Dict, List, Tuple
 
+from aoc.phases import phase
+
 Memo = Dict[Tuple[str, int], int]
 
 
@@ -30,13 +32,20 @@ def solve_recursively(data: List[str], rounds: int, memo: Memo) -> int:
     return total_result
 
 
-def main(input_file_path: str) -> Dict[str, int]:
-    with open(input_file_path) as f:
-        data = f.read().strip().split()
+def main(input_file_path: str, has_part_2: bool = True) -> Dict[str, int]:
+    with phase("parse"):
+        with open(input_file_path) as f:
+            data = f.read().strip().split()
     memo = {}
+    with phase("part_1"):
+        part_1 = solve_recursively(data, 25, memo)
+    part_2 = None
+    if has_part_2:
+        with phase("part_2"):
+            part_2 = solve_recursively(data, 75, memo)
     return {
-        "part_1": solve_recursively(data, 25, memo),
-        "part_2": solve_recursively(data, 75, memo),
+        "part_1": part_1,
+        "part_2": part_2,
     }
 
 
@@ -1,12 +1,8 @@
 from enum import Enum
-from typing import List, Set, Tuple
+from typing import Set
 
-
-class Sides(Enum):
-    TOP = 0
-    RIGHT = 1
-    BOTTOM = 2
-    LEFT = 3
+from aoc.grid import DOWN, LEFT, RIGHT, UP, Grid
+from aoc.phases import phase
 
 
 class PartType(Enum):
@@ -14,91 +10,78 @@ class PartType(Enum):
     PART_2 = 2
 
 
-DIRECTIONS = [
-    (Sides.BOTTOM, 0, 1),
-    (Sides.RIGHT, 1, 0),
-    (Sides.TOP, 0, -1),
-    (Sides.LEFT, -1, 0),
-]
-
-SeenSet = Set[Tuple[int, int]]
-WallPiece = Set[Tuple[Sides, int, int]]
-
+SIDES = (UP, RIGHT, DOWN, LEFT)
 
-def is_out_of_bounds(col: int, row: int, width: int, height: int) -> bool:
-    return col < 0 or row < 0 or col >= width or row >= height
+# A wall piece is `cell index * 4 + side`, so pieces of the same side of
+# neighbouring cells are one `offset * 4` apart.
+WallPieces = Set[int]
 
 
 def process_area(
-    map: List[List[str]], initial: Tuple[int, int], seen: SeenSet, part_type: PartType
+    grid: Grid, initial: int, seen: bytearray, part_type: PartType
 ) -> int:
-    width, height = len(map[0]), len(map)
-    col, row = initial
-    char = map[row][col]
+    cells, offsets = grid.cells, grid.offsets
+    char = cells[initial]
     stack = [initial]
-    seen.add((col, row))
+    seen[initial] = 1
     area = 0
-    walls_pieces: WallPiece = set()
+    walls_pieces: WallPieces = set()
 
     while stack:
-        col, row = stack.pop()
+        current = stack.pop()
         area += 1
-        for side, dx, dy in DIRECTIONS:
-            new_col, new_row = col + dx, row + dy
-            if (
-                is_out_of_bounds(new_col, new_row, width, height)
-                or map[new_row][new_col] != char
-            ):
-                walls_pieces.add((side, col, row))
-            elif (new_col, new_row) not in seen:
-                stack.append((new_col, new_row))
-                seen.add((new_col, new_row))
+        for side in SIDES:
+            neighbor = current + offsets[side]
+            if cells[neighbor] != char:
+                walls_pieces.add(current * 4 + side)
+            elif not seen[neighbor]:
+                stack.append(neighbor)
+                seen[neighbor] = 1
 
     if part_type == PartType.PART_1:
         return area * len(walls_pieces)
     else:
-        return area * len(merge_wall_pieces(walls_pieces))
+        return area * count_walls(walls_pieces, offsets)
 
 
-def merge_wall_pieces(wall_pieces: List[WallPiece]) -> List[List[WallPiece]]:
-    walls: List[List[WallPiece]] = []
+def count_walls(wall_pieces: WallPieces, offsets) -> int:
+    """Number of straight walls left after joining adjacent pieces of a side."""
+    piece_steps = [offset * 4 for offset in offsets]
+    walls = 0
     while wall_pieces:
-        side, col, row = wall_pieces.pop()
-        stack = [(side, col, row)]
-        wall = set()
+        stack = [wall_pieces.pop()]
         while stack:
-            side, col, row = stack.pop()
-            wall.add((side, col, row))
-            for _, dx, dy in DIRECTIONS:
-                new_col, new_row = col + dx, row + dy
-                if (side, new_col, new_row) in wall_pieces:
-                    stack.append((side, new_col, new_row))
-                    wall_pieces.remove((side, new_col, new_row))
-        walls.append(list(wall))
+            piece = stack.pop()
+            for step in piece_steps:
+                if piece + step in wall_pieces:
+                    stack.append(piece + step)
+                    wall_pieces.remove(piece + step)
+        walls += 1
     return walls
 
 
-def main(input_file_path: str):
-    with open(input_file_path) as f:
-        map = [list(line.strip()) for line in f.readlines()]
+def total_price(grid: Grid, part_type: PartType) -> int:
+    seen = bytearray(len(grid.cells))
+    return sum(
+        process_area(grid, index, seen, part_type)
+        for index in grid.indices()
+        if not seen[index]
+    )
+
+
+def main(input_file_path: str, has_part_2: bool = True):
+    with phase("parse"):
+        grid = Grid.from_file(input_file_path)
 
-        seen: SeenSet = set()
-        part_1 = sum(
-            process_area(map, (col, row), seen, PartType.PART_1)
-            for row in range(len(map))
-            for col in range(len(map[0]))
-            if (col, row) not in seen
-        )
+    with phase("part_1"):
+        part_1 = total_price(grid, PartType.PART_1)
 
-        seen.clear()
-        part_2 = sum(
-            process_area(map, (col, row), seen, PartType.PART_2)
-            for row in range(len(map))
-            for col in range(len(map[0]))
-            if (col, row) not in seen
-        )
+    part_2 = None
+    if has_part_2:
+        with phase("part_2"):
+            part_2 = total_price(grid, PartType.PART_2)
 
-        return {"part_1": part_1, "part_2": part_2}
+    return {"part_1": part_1, "part_2": part_2}
 
 
 if __name__ == "__main__":
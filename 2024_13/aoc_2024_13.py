@@ -1,7 +1,10 @@
 from enum import Enum
-import re
 from typing import Dict, Tuple, List
 
+from aoc.inputs import InputFile
+from aoc.parse_cache import cached_parse
+from aoc.phases import phase
+
 
 class PartType(Enum):
     PART_1 = 1
@@ -15,22 +18,9 @@ BUTTON_COSTS = {
 
 
 class ClawMachine:
-    def __init__(self, machine_str: str):
-        self.buttons = self._parse_buttons(machine_str)
-        self.prize = self._parse_prize(machine_str)
-
-    @staticmethod
-    def _parse_buttons(machine_str: str) -> Dict[str, Tuple[int, int]]:
-        button_regex = r"Button ([A-Z]): X\+(\d+), Y\+(\d+)"
-        return {
-            button_name: (int(x), int(y))
-            for button_name, x, y in re.findall(button_regex, machine_str)
-        }
-
-    @staticmethod
-    def _parse_prize(machine_str: str) -> Tuple[int, int]:
-        prize_regex = r"Prize: X=(\d+), Y=(\d+)"
-        return tuple(map(int, re.search(prize_regex, machine_str).groups()))
+    def __init__(self, buttons: Dict[str, Tuple[int, int]], prize: Tuple[int, int]):
+        self.buttons = buttons
+        self.prize = prize
 
     def __repr__(self):
         return f"ClawMachine(buttons={self.buttons}, prize={self.prize})"
@@ -59,19 +49,29 @@ class ClawMachine:
         return int(a * BUTTON_COSTS["A"] + b * BUTTON_COSTS["B"])
 
 
+@cached_parse()
 def read_input_file(input_file_path: str) -> List[ClawMachine]:
-    with open(input_file_path) as f:
-        return [ClawMachine(part) for part in f.read().split("\n\n")]
-
-
-def main(input_file_path: str) -> Dict[str, int]:
-    data = read_input_file(input_file_path)
-    part_1 = sum(
-        machine.find_minimum_mathematically(PartType.PART_1) for machine in data
-    )
-    part_2 = sum(
-        machine.find_minimum_mathematically(PartType.PART_2) for machine in data
-    )
+    with InputFile(input_file_path) as data:
+        return [
+            ClawMachine({"A": (ax, ay), "B": (bx, by)}, (x, y))
+            for ax, ay, bx, by, x, y in data.integers(6)
+        ]
+
+
+def main(input_file_path: str, has_part_2: bool = True) -> Dict[str, int]:
+    with phase("parse"):
+        data = read_input_file(input_file_path)
+    with phase("part_1"):
+        part_1 = sum(
+            machine.find_minimum_mathematically(PartType.PART_1) for machine in data
+        )
+    part_2 = None
+    if has_part_2:
+        with phase("part_2"):
+            part_2 = sum(
+                machine.find_minimum_mathematically(PartType.PART_2)
+                for machine in data
+            )
     return {"part_1": part_1, "part_2": part_2}
 
 
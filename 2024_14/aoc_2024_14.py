@@ -1,28 +1,24 @@
-import re
 from typing import Dict, List, Set, Tuple
 from math import gcd, lcm
-import pygame
 import sys
 
+from aoc.inputs import InputFile
+from aoc.lazy import lazy_import
+from aoc.parse_cache import cached_parse
+from aoc.phases import phase
+
+# Only render_grid needs pygame, so solving does not pay for (or require) it.
+pygame = lazy_import("pygame")
+
 
 class Robot:
-    def __init__(self, input_str: str):
-        self.position: Tuple[int, int] = self._parse_position(input_str)
-        self.velocity: Tuple[int, int] = self._parse_velocity(input_str)
+    def __init__(self, position: Tuple[int, int], velocity: Tuple[int, int]):
+        self.position = position
+        self.velocity = velocity
 
     def __repr__(self):
         return f"(p={self.position}, v={self.velocity})"
 
-    @staticmethod
-    def _parse_position(input_str: str) -> Tuple[int, int]:
-        position_regex = r"p=(-?\d+),(-?\d+)"
-        return tuple(map(int, re.search(position_regex, input_str).groups()))
-
-    @staticmethod
-    def _parse_velocity(input_str: str) -> Tuple[int, int]:
-        velocity_regex = r"v=(-?\d+),(-?\d+)"
-        return tuple(map(int, re.search(velocity_regex, input_str).groups()))
-
     def move_with_wrapping(self, time: int, bounds: Tuple[int, int]) -> Tuple[int, int]:
         x, y = self.position
         vx, vy = self.velocity
@@ -151,18 +147,31 @@ def render_grid(
     sys.exit()
 
 
-def main(input_file_path: str, width: int, height: int) -> Dict[str, int]:
-    with open(input_file_path) as f:
-        data = [Robot(line.strip()) for line in f.readlines()]
+@cached_parse()
+def read_robots(input_file_path: str) -> List[Robot]:
+    with InputFile(input_file_path) as data:
+        return [Robot((x, y), (vx, vy)) for x, y, vx, vy in data.integers(4)]
+
+
+def main(
+    input_file_path: str, width: int, height: int, has_part_2: bool = True
+) -> Dict[str, int]:
+    with phase("parse"):
+        data = read_robots(input_file_path)
+
+    with phase("part_1"):
         quadrants = count_robots_in_quadrants(data, width, height, 100)
 
         product = 1
         for value in quadrants.values():
             product *= value
 
-        part_2 = find_tree_shapes(data, width, height)
+    part_2 = None
+    if has_part_2:
+        with phase("part_2"):
+            part_2 = find_tree_shapes(data, width, height)
 
-        return {"part_1": product, "part_2": part_2}
+    return {"part_1": product, "part_2": part_2}
 
 
 if __name__ == "__main__":
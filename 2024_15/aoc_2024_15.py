@@ -1,11 +1,20 @@
-from collections import defaultdict
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Dict, Optional, Set
 
-INSTRUCTION_CONVERSION = {"<": (-1, 0), ">": (1, 0), "^": (0, -1), "v": (0, 1)}
+from aoc.grid import DOWN, LEFT, RIGHT, UP, Grid
+from aoc.phases import phase
+
+INSTRUCTION_CONVERSION = {"<": LEFT, ">": RIGHT, "^": UP, "v": DOWN}
+WIDENED = {"#": "##", ".": "..", "O": "[]", "@": "@."}
+
+WALL = ord("#")
+EMPTY = ord(".")
+BOX = ord("O")
+BOX_LEFT = ord("[")
+BOX_RIGHT = ord("]")
 
 
 class Robot:
-    def __init__(self, pos: Tuple[int, int], instructions: str):
+    def __init__(self, pos: int, instructions: str):
         self.pos = pos
         self.instructions = instructions
         self.instruction_pointer = 0
@@ -13,118 +22,86 @@ class Robot:
     def __repr__(self):
         return f"Robot(at {self.pos}, instr={self.instructions}, intr_pt={self.instruction_pointer})"
 
-    def move(self, map: List[List[str]]):
-        x, y = self.pos
-        dx, dy = INSTRUCTION_CONVERSION[self.instructions[self.instruction_pointer]]
-        new_x, new_y = x + dx, y + dy
-        if map[new_y][new_x] == ".":
-            self.pos = (new_x, new_y)
-        elif map[new_y][new_x] == "O":
-            self._move_box(map, new_x, new_y, dx, dy)
-        elif map[new_y][new_x] in ["[", "]"]:
-            self._move_wider_box(map, new_x, new_y, dx, dy)
+    def move(self, grid: Grid):
+        offset = grid.offsets[
+            INSTRUCTION_CONVERSION[self.instructions[self.instruction_pointer]]
+        ]
+        new_pos = self.pos + offset
+        cell = grid.cells[new_pos]
+        if cell == EMPTY:
+            self.pos = new_pos
+        elif cell == BOX:
+            self._move_box(grid, new_pos, offset)
+        elif cell == BOX_LEFT or cell == BOX_RIGHT:
+            self._move_wider_box(grid, new_pos, offset)
         self.instruction_pointer += 1
 
-    def _move_box(self, map: List[List[str]], new_x: int, new_y: int, dx: int, dy: int):
-        empty = find_in_direction(map, (new_x, new_y), (dx, dy))
+    def _move_box(self, grid: Grid, new_pos: int, offset: int):
+        empty = find_in_direction(grid, new_pos, offset)
         if empty:
-            map[new_y][new_x] = "."
-            map[empty[1]][empty[0]] = "O"
-            self.pos = (new_x, new_y)
-
-    def _move_wider_box(
-        self, map: List[List[str]], new_x: int, new_y: int, dx: int, dy: int
-    ):
-        if dy == 0:
-            self._move_horizontal_box(map, new_x, new_y, dx)
+            grid.cells[new_pos] = EMPTY
+            grid.cells[empty] = BOX
+            self.pos = new_pos
+
+    def _move_wider_box(self, grid: Grid, new_pos: int, offset: int):
+        if offset == 1 or offset == -1:
+            self._move_horizontal_box(grid, new_pos, offset)
         else:
-            self._move_vertical_box(map, new_x, new_y, dx, dy)
+            self._move_vertical_box(grid, new_pos, offset)
 
-    def _move_horizontal_box(
-        self, map: List[List[str]], new_x: int, new_y: int, dx: int
-    ):
-        empty = find_in_direction(map, (new_x, new_y), (dx, 0))
+    def _move_horizontal_box(self, grid: Grid, new_pos: int, offset: int):
+        empty = find_in_direction(grid, new_pos, offset)
         if empty:
-            x_dist = empty[0] - new_x
-            if x_dist > 0:
-                map[new_y] = (
-                    map[new_y][:new_x]
-                    + ["."]
-                    + map[new_y][new_x : new_x + x_dist]
-                    + map[new_y][new_x + x_dist + 1 :]
-                )
+            cells = grid.cells
+            if offset > 0:
+                cells[new_pos + 1 : empty + 1] = cells[new_pos:empty]
             else:
-                map[new_y] = (
-                    map[new_y][: new_x + x_dist]
-                    + map[new_y][new_x + x_dist + 1 : new_x + 1]
-                    + ["."]
-                    + map[new_y][new_x + 1 :]
-                )
-            self.pos = (new_x, new_y)
-            if not check_integrity(map):
+                cells[empty:new_pos] = cells[empty + 1 : new_pos + 1]
+            cells[new_pos] = EMPTY
+            self.pos = new_pos
+            if not check_integrity(grid):
                 raise ValueError("Box not moved correctly")
 
-    def _move_vertical_box(
-        self, map: List[List[str]], new_x: int, new_y: int, dx: int, dy: int
-    ):
-        is_cone_empty = find_unblocked_cone(
-            map, (new_x, new_y), (dx, dy), map[new_y][new_x]
-        )
-        if is_cone_empty:
-            y_to_x = sort_cone_to_list_of_y(is_cone_empty)
-            current = max(y_to_x.keys()) if dy > 0 else min(y_to_x.keys())
-            while current in y_to_x:
-                for x in y_to_x[current]:
-                    map[current + dy][x] = map[current][x]
-                    map[current][x] = "."
-                current -= dy
-            self.pos = (new_x, new_y)
-            if map[new_y][new_x] in ["[", "]"]:
+    def _move_vertical_box(self, grid: Grid, new_pos: int, offset: int):
+        cone = find_unblocked_cone(grid, new_pos, offset, grid.cells[new_pos])
+        if cone:
+            cells = grid.cells
+            # Move the cells farthest along the direction first.
+            for pos in sorted(cone, reverse=offset > 0):
+                cells[pos + offset] = cells[pos]
+                cells[pos] = EMPTY
+            self.pos = new_pos
+            if cells[new_pos] in (BOX_LEFT, BOX_RIGHT):
                 raise ValueError("Box not moved correctly")
-            if not check_integrity(map):
+            if not check_integrity(grid):
                 raise ValueError("Box not moved correctly")
 
-    def execute_instructions(self, map: List[List[str]]):
+    def execute_instructions(self, grid: Grid):
         while self.instruction_pointer < len(self.instructions):
-            self.move(map)
+            self.move(grid)
 
 
-def check_integrity(map: List[List[str]]) -> bool:
-    for row in map:
-        row_str = "".join(row)
-        if "[[" in row_str or "]]" in row_str:
-            return False
-    return True
-
-
-def sort_cone_to_list_of_y(cone: Set[Tuple[int, int]]) -> Dict[int, List[int]]:
-    y_to_x = defaultdict(list)
-    for x, y in cone:
-        y_to_x[y].append(x)
-    return y_to_x
+def check_integrity(grid: Grid) -> bool:
+    return b"[[" not in grid.cells and b"]]" not in grid.cells
 
 
 def find_unblocked_cone(
-    map: List[List[str]],
-    pos: Tuple[int, int],
-    direction: Tuple[int, int],
-    box_part: str,
-) -> Optional[Set[Tuple[int, int]]]:
-    assert box_part in ["[", "]"]
-    dx, dy = direction
-    cone: Set[Tuple[int, int]] = {pos}
-    if box_part == "[":
-        cone.add((pos[0] + 1, pos[1]))
+    grid: Grid, pos: int, offset: int, box_part: int
+) -> Optional[Set[int]]:
+    assert box_part in (BOX_LEFT, BOX_RIGHT)
+    cells = grid.cells
+    cone: Set[int] = {pos}
+    if box_part == BOX_LEFT:
+        cone.add(pos + 1)
     else:
-        cone.add((pos[0] - 1, pos[1]))
+        cone.add(pos - 1)
 
-    for x, y in list(cone):
-        if map[y + dy][x + dx] == "#":
+    for current in list(cone):
+        next_cell = cells[current + offset]
+        if next_cell == WALL:
             return None
-        elif map[y + dy][x + dx] in ["[", "]"]:
-            next_cone = find_unblocked_cone(
-                map, (x + dx, y + dy), direction, map[y + dy][x + dx]
-            )
+        elif next_cell == BOX_LEFT or next_cell == BOX_RIGHT:
+            next_cone = find_unblocked_cone(grid, current + offset, offset, next_cell)
             if next_cone:
                 cone.update(next_cone)
             else:
@@ -132,87 +109,59 @@ def find_unblocked_cone(
     return cone
 
 
-def find_in_direction(
-    map: List[List[str]], pos: Tuple[int, int], direction: Tuple[int, int]
-) -> Optional[Tuple[int, int]]:
-    x, y = pos
-    dx, dy = direction
-    while map[y][x] != "#":
-        x, y = x + dx, y + dy
-        if map[y][x] == ".":
-            return (x, y)
+def find_in_direction(grid: Grid, pos: int, offset: int) -> Optional[int]:
+    cells = grid.cells
+    while cells[pos] != WALL:
+        pos += offset
+        if cells[pos] == EMPTY:
+            return pos
     return None
 
 
-def score_map(map: List[List[str]]) -> int:
+def score_map(grid: Grid, box: str = "O") -> int:
     return sum(
-        r_idx * 100 + c_idx
-        for r_idx, row in enumerate(map)
-        for c_idx, cell in enumerate(row)
-        if cell == "O"
+        y * 100 + x for x, y in (grid.coords(index) for index in grid.find_all(box))
     )
 
 
-def score_box_map(map: List[List[str]]) -> int:
-    return sum(
-        r_idx * 100 + c_idx
-        for r_idx, row in enumerate(map)
-        for c_idx, cell in enumerate(row)
-        if cell == "["
-    )
+def score_box_map(grid: Grid) -> int:
+    return score_map(grid, "[")
 
 
-def main(input_file_path: str) -> Dict[str, int]:
-    with open(input_file_path) as f:
-        input_string = f.read()
-        part_1 = execute_part_1(input_string)
+def main(input_file_path: str, has_part_2: bool = True) -> Dict[str, int]:
+    with phase("parse"):
+        with open(input_file_path) as f:
+            input_string = f.read()
 
-        part_2 = execute_part_2(input_string)
+    with phase("part_1"):
+        part_1 = score_map(execute_part_1(input_string))
 
-        return {"part_1": score_map(part_1), "part_2": score_box_map(part_2)}
+    part_2 = None
+    if has_part_2:
+        with phase("part_2"):
+            part_2 = score_box_map(execute_part_2(input_string))
 
+    return {"part_1": part_1, "part_2": part_2}
 
-def execute_part_2(input_string):
-    map, instructions = [part.strip() for part in input_string.split("\n\n")]
-    map = [list(row.strip()) for row in map.split("\n")]
+
+def execute(map_lines: str, instructions: str) -> Grid:
+    grid = Grid.from_lines(map_lines.split("\n"))
     instructions = instructions.replace("\n", "")
+    start = grid.find("@")
+    grid.cells[start] = EMPTY
+    Robot(start, instructions).execute_instructions(grid)
+    return grid
 
-    robot = None
-    extended_map = []
-    for y, row in enumerate(map):
-        extended_row = []
-        for x, cell in enumerate(row):
-            if cell == "#":
-                extended_row.extend("##")
-            elif cell == ".":
-                extended_row.extend("..")
-            elif cell == "O":
-                extended_row.extend("[]")
-            elif cell == "@":
-                robot = Robot((x * 2, y), instructions)
-                extended_row.extend("..")
-        extended_map.append(extended_row)
-
-    if robot:
-        robot.execute_instructions(extended_map)
-    return extended_map
-
-
-def execute_part_1(input_string: str) -> List[List[str]]:
+
+def execute_part_2(input_string: str) -> Grid:
     map, instructions = [part.strip() for part in input_string.split("\n\n")]
-    map = [list(row.strip()) for row in map.split("\n")]
-    instructions = instructions.replace("\n", "")
+    widened = "".join(WIDENED.get(char, char) for char in map)
+    return execute(widened, instructions)
 
-    robot = None
-    for y, row in enumerate(map):
-        for x, cell in enumerate(row):
-            if cell == "@":
-                robot = Robot((x, y), instructions)
-                map[y][x] = "."
 
-    if robot:
-        robot.execute_instructions(map)
-    return map
+def execute_part_1(input_string: str) -> Grid:
+    map, instructions = [part.strip() for part in input_string.split("\n\n")]
+    return execute(map, instructions)
 
 
 if __name__ == "__main__":
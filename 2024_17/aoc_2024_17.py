@@ -1,15 +1,14 @@
 from typing import List, Tuple, Optional
 
+from aoc.inputs import integers
+from aoc.phases import phase
+
 
 class Machine:
     def __init__(self, input_str: str):
-        registries, instructions = input_str.split("\n\n")
-        self.a, self.b, self.c = [
-            int(line.strip().split()[2]) for line in registries.split("\n")
-        ]
-        self.instructions: List[int] = list(
-            map(int, instructions.split()[1].split(","))
-        )
+        values = integers(input_str.encode())
+        self.a, self.b, self.c = values[:3]
+        self.instructions: List[int] = values[3:]
         self.inst_pointer = 0
 
     def process_from_start_with_a(self, a: int) -> str:
@@ -93,16 +92,20 @@ def convert_to_decimal(octal: str) -> int:
 
 
 def main(input_file_path: str, has_part_2: bool = False) -> dict:
-    with open(input_file_path) as f:
-        input_str = f.read()
-        machine = Machine(input_str)
+    with phase("parse"):
+        with open(input_file_path) as f:
+            input_str = f.read()
+            machine = Machine(input_str)
+
+    with phase("part_1"):
         part_1 = machine.process_instructions()
 
-        part_2: Optional[int] = None
-        if has_part_2:
+    part_2: Optional[int] = None
+    if has_part_2:
+        with phase("part_2"):
             part_2 = find_part_2_solution(machine)
 
-        return {"part_1": part_1, "part_2": part_2}
+    return {"part_1": part_1, "part_2": part_2}
 
 
 def find_part_2_solution(machine: Machine) -> Optional[int]:
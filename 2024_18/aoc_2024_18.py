@@ -1,70 +1,47 @@
-from typing import Deque, List, Tuple, Dict, Optional, Set
-from collections import deque
+from typing import List, Tuple, Dict, Optional
 
+from aoc.coords import Coord
+from aoc.grid import Grid
+from aoc.inputs import InputFile
+from aoc.phases import phase
+from aoc.search import grid_bfs
 
-class Coord:
-    def __init__(self, col: int, row: int):
-        self.col = col
-        self.row = row
-
-    def __repr__(self):
-        return f"C({self.col}, {self.row})"
-
-    @classmethod
-    def from_tuple(cls, input: Tuple[int, int]) -> "Coord":
-        return cls(input[0], input[1])
+CORRUPTED = ord("#")
 
 
 def main(
-    input_file_path: str, dim: Tuple[int, int], rounds: int
+    input_file_path: str, dim: Tuple[int, int], rounds: int, has_part_2: bool = True
 ) -> Dict[str, Optional[int]]:
-    data = read_input(input_file_path)
-    grid = get_grid_at_round(dim, rounds, data)
+    with phase("parse"):
+        data = read_input(input_file_path)
 
-    part_1 = bfs_pathfind(dim, grid)
+    with phase("part_1"):
+        grid = get_grid_at_round(dim, rounds, data)
+        part_1 = bfs_pathfind(dim, grid)
 
-    part_2 = binary_search_for_part_2(dim, rounds, data)
+    part_2 = None
+    if has_part_2:
+        with phase("part_2"):
+            part_2 = binary_search_for_part_2(dim, rounds, data)
 
     return {"part_1": part_1, "part_2": part_2}
 
 
 def read_input(input_file_path: str) -> List[Coord]:
-    with open(input_file_path) as f:
-        return [
-            Coord.from_tuple(tuple(map(int, line.strip().split(","))))
-            for line in f.readlines()
-        ]
+    with InputFile(input_file_path) as data:
+        return [Coord(col, row) for col, row in data.integers(2)]
 
 
-def get_grid_at_round(
-    dim: Tuple[int, int], rounds: int, data: List[Coord]
-) -> List[List[str]]:
-    grid: List[List[str]] = [
-        ["." for _ in range(dim[0] + 1)] for _ in range(dim[1] + 1)
-    ]
+def get_grid_at_round(dim: Tuple[int, int], rounds: int, data: List[Coord]) -> Grid:
+    grid = Grid(dim[0] + 1, dim[1] + 1)
     for coord in data[:rounds]:
-        grid[coord.row][coord.col] = "#"
+        grid.cells[grid.index(coord.col, coord.row)] = CORRUPTED
     return grid
 
 
-def bfs_pathfind(dim: Tuple[int, int], grid: List[List[str]]) -> Optional[int]:
-    queue: Deque[Tuple[int, int, int]] = deque([(0, 0, 0)])  # (row, col, path_length)
-    seen: Set[Tuple[int, int]] = {(0, 0)}
-    while queue:
-        row, col, path_length = queue.popleft()
-        for dr, dc in ((0, 1), (0, -1), (1, 0), (-1, 0)):
-            new_row, new_col = row + dr, col + dc
-            if (
-                0 <= new_row <= dim[1]
-                and 0 <= new_col <= dim[0]
-                and (new_row, new_col) not in seen
-            ):
-                seen.add((new_row, new_col))
-                if new_col == dim[0] and new_row == dim[1]:
-                    return path_length + 1
-                if grid[new_row][new_col] != "#":
-                    queue.append((new_row, new_col, path_length + 1))
-    return None
+def bfs_pathfind(dim: Tuple[int, int], grid: Grid) -> Optional[int]:
+    end = grid.index(dim[0], dim[1])
+    return grid_bfs(grid, [grid.index(0, 0)], "#", target=end).distance(end)
 
 
 def binary_search_for_part_2(
@@ -1,6 +1,8 @@
 from typing import List, Optional, Tuple
 from functools import lru_cache
 
+from aoc.phases import phase
+
 
 @lru_cache(None)
 def dfs(line: str, options: Tuple[str]) -> Optional[int]:
@@ -19,15 +21,17 @@ def dfs(line: str, options: Tuple[str]) -> Optional[int]:
 
 
 def main(input_file_path: str):
-    with open(input_file_path) as f:
-        data = [line.strip() for line in f.readlines()]
-        options = tuple(data[0].split(", "))
-        designs = data[2:]
+    with phase("parse"):
+        with open(input_file_path) as f:
+            data = [line.strip() for line in f.readlines()]
+            options = tuple(data[0].split(", "))
+            designs = data[2:]
+    with phase("part_1_and_2"):
         results = [dfs(line, options) for line in designs]
-        return {
-            "part_1": sum([1 if res > 0 else 0 for res in results]),
-            "part_2": sum(results),
-        }
+    return {
+        "part_1": sum([1 if res > 0 else 0 for res in results]),
+        "part_2": sum(results),
+    }
 
 
 if __name__ == "__main__":
@@ -1,99 +1,83 @@
-from collections import deque
 from typing import Dict, List, Tuple
 from collections import defaultdict
 
+from aoc.grid import Grid
+from aoc.phases import phase
+from aoc.search import UNREACHED, grid_bfs
 
-Coord = Tuple[int, int]
-DistMap = Dict[Coord, int]
-FromTo = Tuple[Coord, Coord]
 
-DIRECTIONS: List[Coord] = [(0, 1), (0, -1), (1, 0), (-1, 0)]
+# Cells are grid indices; walls and unreachable cells are UNREACHED.
+DistMap = List[int]
+FromTo = Tuple[int, int]
+
+PART_1_CHEAT = 2
+PART_2_CHEAT = 20
 
 
 class Map:
-    def __init__(self, data: List[List[str]]):
-        self.map: List[List[str]] = data
-        self.start, self.end = self._find_start_and_end()
+    def __init__(self, grid: Grid):
+        # Cheats jump up to `grid.border` cells, which the border keeps
+        # inside the array without wrapping into neighbouring rows.
+        self.map = grid
+        self.start, self.end = grid.find("S"), grid.find("E")
         self.dist_from_start: DistMap = self._floodfill_from(self.start)
         self.dist_from_end: DistMap = self._floodfill_from(self.end)
         self.shortest_path_len = self.dist_from_start[self.end]
 
-    def _find_start_and_end(self) -> Tuple[Coord, Coord]:
-        for row_idx, row in enumerate(self.map):
-            for col_idx, cell in enumerate(row):
-                if cell == "S":
-                    start = (row_idx, col_idx)
-                elif cell == "E":
-                    end = (row_idx, col_idx)
-        return start, end
-
-    def _floodfill_from(self, start: Coord) -> DistMap:
-        dq = deque([start])
-        dist_map = {start: 0}
-        while dq:
-            x, y = dq.popleft()
-            for dx, dy in DIRECTIONS:
-                new_x, new_y = x + dx, y + dy
-                if (
-                    0 <= new_x < len(self.map)
-                    and 0 <= new_y < len(self.map[0])
-                    and (new_x, new_y) not in dist_map
-                    and self.map[new_x][new_y] != "#"
-                ):
-                    dist_map[(new_x, new_y)] = dist_map[(x, y)] + 1
-                    dq.append((new_x, new_y))
-        return dist_map
+    def _floodfill_from(self, start: int) -> DistMap:
+        return grid_bfs(self.map, [start], "#").distances
 
-    def _find_coords_within_manhattan_distance(
-        self, start: Coord, distance: int
-    ) -> List[Coord]:
-        coords = []
-        for x in range(start[0] - distance, start[0] + distance + 1):
-            for y in range(start[1] - distance, start[1] + distance + 1):
-                if (
-                    abs(x - start[0]) + abs(y - start[1]) <= distance
-                    and (x, y) in self.dist_from_end
-                ):
-                    coords.append((x, y))
-        return coords
+    def _offsets_within_manhattan_distance(
+        self, distance: int
+    ) -> List[Tuple[int, int]]:
+        """(index offset, manhattan distance) of every cell within `distance`."""
+        stride = self.map.stride
+        return [
+            (dy * stride + dx, abs(dx) + abs(dy))
+            for dy in range(-distance, distance + 1)
+            for dx in range(-distance + abs(dy), distance - abs(dy) + 1)
+        ]
 
     def find_shortcuts_over_threshold(
         self, threshhold: int, distance: int
     ) -> Dict[int, List[FromTo]]:
+        assert distance <= self.map.border
+        dist_from_end = self.dist_from_end
+        reach = self._offsets_within_manhattan_distance(distance)
         shortcuts = defaultdict(list)
-        for shortcut_from, start_distance in self.dist_from_start.items():
-            if start_distance > self.shortest_path_len:
+        for shortcut_from, start_distance in enumerate(self.dist_from_start):
+            if start_distance == UNREACHED or start_distance > self.shortest_path_len:
                 continue
-
-            for candidate in self._find_coords_within_manhattan_distance(
-                shortcut_from, distance
-            ):
-                if candidate in self.dist_from_end:
-                    end_distance = self.dist_from_end[candidate]
+            # Saving at least `threshhold` needs a cell this close to the end.
+            max_end_distance = self.shortest_path_len - start_distance - threshhold
+            for offset, cheat_length in reach:
+                candidate = shortcut_from + offset
+                end_distance = dist_from_end[candidate]
+                if 0 <= end_distance <= max_end_distance - cheat_length:
                     time_saved = self.shortest_path_len - (
-                        start_distance
-                        + end_distance
-                        + (
-                            abs(candidate[0] - shortcut_from[0])
-                            + abs(candidate[1] - shortcut_from[1])
-                        )
+                        start_distance + end_distance + cheat_length
                     )
-                    if time_saved >= threshhold:
-                        shortcuts[time_saved].append((shortcut_from, candidate))
+                    shortcuts[time_saved].append((shortcut_from, candidate))
 
         return shortcuts
 
 
-def main(input_file_path: str, threshhold: int) -> dict[str, int]:
-    with open(input_file_path) as f:
-        data = [list(line.strip()) for line in f.readlines()]
-        map = Map(data)
-        part_1 = map.find_shortcuts_over_threshold(threshhold, 2)
-        part_2 = map.find_shortcuts_over_threshold(threshhold, 20)
-        return {
-            "part_1": sum([len(locs) for locs in part_1.values()]),
-            "part_2": sum([len(locs) for locs in part_2.values()]),
-        }
+def main(
+    input_file_path: str, threshhold: int, has_part_2: bool = True
+) -> dict[str, int]:
+    with phase("parse"):
+        map = Map(Grid.from_file(input_file_path, border=PART_2_CHEAT))
+    with phase("part_1"):
+        part_1 = map.find_shortcuts_over_threshold(threshhold, PART_1_CHEAT)
+    part_2 = None
+    if has_part_2:
+        with phase("part_2"):
+            shortcuts = map.find_shortcuts_over_threshold(threshhold, PART_2_CHEAT)
+            part_2 = sum([len(locs) for locs in shortcuts.values()])
+    return {
+        "part_1": sum([len(locs) for locs in part_1.values()]),
+        "part_2": part_2,
+    }
 
 
 if __name__ == "__main__":
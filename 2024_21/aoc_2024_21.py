@@ -1,6 +1,9 @@
 from collections import defaultdict, deque
+from functools import cache
 from typing import Dict, List, Tuple, Optional
 
+from aoc.phases import phase
+
 Coord = Tuple[int, int]
 PathDict = Dict[Tuple[str, str], List[List[str]]]
 
@@ -73,12 +76,14 @@ def path_all_combinations(is_numerical: bool) -> PathDict:
     }
 
 
-NUM_PATHS = path_all_combinations(True)
-PAD_PATHS = path_all_combinations(False)
+@cache
+def keypad_paths(is_numerical: bool) -> PathDict:
+    """Shortest paths between every pair of keys, built on first use."""
+    return path_all_combinations(is_numerical)
 
 
 def find_optimal_expansion(instruction: str, is_num: bool) -> List[str]:
-    pad = NUM_PATHS if is_num else PAD_PATHS
+    pad = keypad_paths(is_num)
     output = []
     for i in range(len(instruction)):
         start = "A" if i == 0 else instruction[i - 1]
@@ -95,8 +100,9 @@ def find_optimal_expansion(instruction: str, is_num: bool) -> List[str]:
 def find_path_len(instruction: str, levels: int) -> int:
     if levels == 0:
         return len(instruction)
+    pad = keypad_paths(False)
     return sum(
-        min(find_path_len("".join(p), levels - 1) for p in PAD_PATHS[(start, end)])
+        min(find_path_len("".join(p), levels - 1) for p in pad[(start, end)])
         for i, (start, end) in enumerate(zip("A" + instruction, instruction))
     )
 
@@ -126,12 +132,17 @@ def calculate_complexity(data: List[List[str]], is_part_2: bool) -> List[int]:
     ]
 
 
-def main(input_file_path: str) -> Dict[str, int]:
-    with open(input_file_path) as f:
-        data: List[List[str]] = [list(line.strip()) for line in f.readlines()]
-    part_1_complexity = calculate_complexity(data, False)
-    part_2_complexity = calculate_complexity(data, True)
-    return {"part_1": sum(part_1_complexity), "part_2": sum(part_2_complexity)}
+def main(input_file_path: str, has_part_2: bool = True) -> Dict[str, int]:
+    with phase("parse"):
+        with open(input_file_path) as f:
+            data: List[List[str]] = [list(line.strip()) for line in f.readlines()]
+    with phase("part_1"):
+        part_1_complexity = calculate_complexity(data, False)
+    part_2 = None
+    if has_part_2:
+        with phase("part_2"):
+            part_2 = sum(calculate_complexity(data, True))
+    return {"part_1": sum(part_1_complexity), "part_2": part_2}
 
 
 if __name__ == "__main__":
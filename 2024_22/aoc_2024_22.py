@@ -1,5 +1,8 @@
 from typing import Dict, Tuple
 
+from aoc.inputs import InputFile
+from aoc.phases import phase
+
 SequenceDict = Dict[Tuple[int, int, int, int], int]
 
 
@@ -26,14 +29,16 @@ def generate_nth_value(num: int, n: int, global_sequences: SequenceDict) -> int:
 
 
 def main(input_file_path: str):
-    with open(input_file_path) as f:
-        data = [int(line.strip()) for line in f.readlines()]
+    with phase("parse"):
+        with InputFile(input_file_path) as f:
+            data = f.integers()
+    with phase("part_1_and_2"):
         global_sequences = {}
         results = [generate_nth_value(num, 2000, global_sequences) for num in data]
-        return {
-            "part_1": sum(results),
-            "part_2": max(global_sequences.values()),
-        }
+    return {
+        "part_1": sum(results),
+        "part_2": max(global_sequences.values()),
+    }
 
 
 if __name__ == "__main__":
@@ -1,5 +1,7 @@
 from typing import Dict, FrozenSet, List, Set
 
+from aoc.phases import phase
+
 
 class Node:
     def __init__(self, id: str):
@@ -17,10 +19,12 @@ class Node:
 
 
 def main(input_file_path: str, has_part_2: bool) -> Dict[str, int | str | None]:
-    data = read_input_file(input_file_path)
-    computers = build_computer_network(data)
-    unique_triplets = find_unique_triplets(computers)
-    filtered_triplets = filter_triplets(unique_triplets)
+    with phase("parse"):
+        data = read_input_file(input_file_path)
+        computers = build_computer_network(data)
+    with phase("part_1"):
+        unique_triplets = find_unique_triplets(computers)
+        filtered_triplets = filter_triplets(unique_triplets)
 
     result = {
         "part_1": len(filtered_triplets),
@@ -28,7 +32,8 @@ def main(input_file_path: str, has_part_2: bool) -> Dict[str, int | str | None]:
     }
 
     if has_part_2:
-        result["part_2"] = find_maximal_intersect(computers, unique_triplets)
+        with phase("part_2"):
+            result["part_2"] = find_maximal_intersect(computers, unique_triplets)
 
     return result
 
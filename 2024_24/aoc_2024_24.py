@@ -3,6 +3,9 @@ from collections import defaultdict, deque
 from enum import Enum, auto
 from typing import Dict, List, Tuple
 
+from aoc.parse_cache import cached_parse
+from aoc.phases import phase
+
 
 class Operand(Enum):
     AND = auto()
@@ -197,43 +200,62 @@ def compute_node_values_hopefully_faster(nodes: Dict[str, int], instructions):
     return int(result, 2)
 
 
-def main(input_file_path: str):
+@cached_parse()
+def read_input_file(
+    input_file_path: str,
+) -> Tuple[Dict[str, int], List[Instruction], int]:
     with open(input_file_path) as f:
         initial, connections = [part.strip() for part in f.read().split("\n\n")]
-        nodes: Dict[str, int] = {}
-
-        max_bit_position: int = None
-        for line in initial.split("\n"):
-            id, value = line.split(": ")
-            nodes[id] = int(value)
-            max_bit_position = int(id[1:]) + 1
-
-        instructions: List[Instruction] = [
-            (
-                i_1,
-                Operand[op],
-                i_2,
-                out,
-                False,
-            )
-            for con in connections.split("\n")
-            for i_1, op, i_2, _, out in [con.split(" ")]
-        ]
+    nodes: Dict[str, int] = {}
 
-        swap_tuples = [("z14", "vss"), ("hjf", "kdh"), ("kpp", "z31"), ("z35", "sgj")]
-        flattened_swaps = [item for sublist in swap_tuples for item in sublist]
-        swapped = swap_outputs(
-            instructions,
-            swap_tuples,
+    max_bit_position: int = None
+    for line in initial.split("\n"):
+        id, value = line.split(": ")
+        nodes[id] = int(value)
+        max_bit_position = int(id[1:]) + 1
+
+    instructions: List[Instruction] = [
+        (
+            i_1,
+            Operand[op],
+            i_2,
+            out,
+            False,
         )
+        for con in connections.split("\n")
+        for i_1, op, i_2, _, out in [con.split(" ")]
+    ]
+    return nodes, instructions, max_bit_position
+
+
+def main(input_file_path: str, has_part_2: bool = True):
+    with phase("parse"):
+        nodes, instructions, max_bit_position = read_input_file(input_file_path)
+
+    part_2 = None
+    if has_part_2:
+        with phase("part_2"):
+            swap_tuples = [
+                ("z14", "vss"),
+                ("hjf", "kdh"),
+                ("kpp", "z31"),
+                ("z35", "sgj"),
+            ]
+            flattened_swaps = [item for sublist in swap_tuples for item in sublist]
+            swapped = swap_outputs(
+                instructions,
+                swap_tuples,
+            )
 
-        diag = perform_diagnostics(list(swapped), max_bit_position)
-        for d in diag[0]:
-            print(d)
-            print()
+            diag = perform_diagnostics(list(swapped), max_bit_position)
+            for d in diag[0]:
+                print(d)
+                print()
+            part_2 = ",".join(sorted(flattened_swaps))
 
+    with phase("part_1"):
         part_1_int = compute_node_values(nodes, instructions)
-        return {"part_1": part_1_int, "part_2": ",".join(sorted(flattened_swaps))}
+    return {"part_1": part_1_int, "part_2": part_2}
 
 
 if __name__ == "__main__":
@@ -1,16 +1,23 @@
 from typing import Dict, List, Tuple
 
+from aoc.inputs import InputFile
+from aoc.phases import phase
+
+
+# Byte value of "#"; zipping rows of bytes yields columns of byte values.
+HASH = ord("#")
+
 
 def parse_input(input_file_path: str) -> Tuple[List[List[int]], List[List[int]]]:
-    with open(input_file_path) as f:
-        data = [part.strip().splitlines() for part in f.read().split("\n\n")]
+    with InputFile(input_file_path) as f:
+        data = [block.splitlines() for block in f.blocks()]
 
     locks, keys = [], []
     for part in data:
-        column_count_of_hash = [col.count("#") - 1 for col in zip(*part)]
-        if part[0] == "#####":
+        column_count_of_hash = [col.count(HASH) - 1 for col in zip(*part)]
+        if part[0] == b"#####":
             locks.append(column_count_of_hash)
-        elif part[0] == ".....":
+        elif part[0] == b".....":
             keys.append(column_count_of_hash)
         else:
             raise ValueError("Invalid input")
@@ -53,9 +60,11 @@ def find_non_overlapping_keys(
 
 
 def main(input_file_path: str) -> Dict[str, int]:
-    locks, keys = parse_input(input_file_path)
-    lock_dict = build_lock_dict(locks)
-    non_overlapping_keys = find_non_overlapping_keys(keys, lock_dict)
+    with phase("parse"):
+        locks, keys = parse_input(input_file_path)
+    with phase("part_1"):
+        lock_dict = build_lock_dict(locks)
+        non_overlapping_keys = find_non_overlapping_keys(keys, lock_dict)
 
     return {"part_1": sum(non_overlapping_keys), "part_2": None}
 
@@ -0,0 +1,123 @@
+import math
+import statistics
+from typing import Any, Dict, List, Optional, Tuple
+
+from .bench import sample_solver
+from .days import import_day, load_solver
+from .engines import Crossovers, input_statistic, machine
+from .generators import workload
+
+# Sizes relative to the real input; the pool engines only pay off on big ones.
+DEFAULT_TUNING_SCALES = [0.1, 1.0, 10.0]
+# Engines this many times slower than the fastest, and not catching up with it
+# as inputs grow, are not timed on larger inputs.
+PRUNE_FACTOR = 10.0
+
+
+def crossovers(sizes_and_fastest: List[Tuple[int, str]]) -> Crossovers:
+    """Where the fastest engine changes between measured sizes.
+
+    A crossover lies between two measured sizes; it is placed at their
+    geometric mean, as runtimes are measured on a logarithmic size scale.
+    """
+    result: Crossovers = []
+    previous_size = None
+    for size, engine in sorted(sizes_and_fastest):
+        if not result:
+            result.append((0, engine))
+        elif engine != result[-1][1]:
+            result.append((math.sqrt(max(previous_size, 1) * size), engine))
+        previous_size = size
+    return result
+
+
+def prune(
+    medians: Dict[str, float],
+    previous_ratios: Dict[str, float],
+    parallel: Tuple[str, ...] = (),
+) -> Tuple[List[str], Dict[str, float]]:
+    """Engines worth timing on the next, larger input, and each one's ratio
+    to the fastest at this size.
+
+    An engine is dropped only when it is over PRUNE_FACTOR times slower and
+    its ratio did not improve since the previous size. Parallel engines are
+    never dropped: they pay a fixed startup cost that only larger inputs hide.
+    """
+    fastest_ms = min(medians.values())
+    ratios = {engine: median / fastest_ms for engine, median in medians.items()}
+    kept = [
+        engine
+        for engine, ratio in ratios.items()
+        if engine in parallel
+        or ratio <= PRUNE_FACTOR
+        or ratio < previous_ratios.get(engine, math.inf)
+    ]
+    return kept, ratios
+
+
+def tune_day(
+    day: str,
+    scales: Optional[List[float]] = None,
+    repeat: int = 3,
+    warmup: int = 1,
+    seed: int = 0,
+) -> Dict[str, Any]:
+    """Time the day's engines on generated inputs of increasing size.
+
+    Engines far behind the fastest and not catching up are skipped at larger
+    sizes, so hopeless engines do not dominate the tuning time; see `prune`.
+    """
+    module = import_day(day)
+    engines = list(getattr(module, "ENGINES", ()))
+    if not engines:
+        raise ValueError(f"{day} has no engines to tune")
+    statistic = getattr(module, "TUNING_STATISTIC", "bytes")
+    parallel = tuple(getattr(module, "PARALLEL_ENGINES", ()))
+    ratios: Dict[str, float] = {}
+    measurements = []
+    for scale in sorted(scales or DEFAULT_TUNING_SCALES):
+        input_file_path, day_args = workload(day, scale, seed)
+        medians = {}
+        for engine in engines:
+            solver = load_solver(day, {**day_args, "engine": engine})
+            samples, _, _ = sample_solver(solver, input_file_path, repeat, warmup)
+            medians[engine] = statistics.median(samples) / 1_000_000
+        engines, ratios = prune(medians, ratios, parallel)
+        measurements.append(
+            {
+                "scale": scale,
+                "size": input_statistic(input_file_path, statistic),
+                "median_ms": medians,
+            }
+        )
+    fastest = [
+        (point["size"], min(point["median_ms"], key=point["median_ms"].get))
+        for point in measurements
+    ]
+    return {
+        "statistic": statistic,
+        "crossovers": crossovers(fastest),
+        "measurements": measurements,
+        **machine(),
+    }
+
+
+def tuning_report(day: str, tuning: Dict[str, Any]) -> str:
+    measurements = tuning["measurements"]
+    engines = list(measurements[0]["median_ms"])
+    width = max(len(engine) for engine in engines)
+    rows = [
+        f"{'scale':>8} {tuning['statistic']:>12}  "
+        + " ".join(f"{engine:>{width}}" for engine in engines)
+    ]
+    for point in measurements:
+        medians = point["median_ms"]
+        cells = [
+            f"{medians[engine]:>{width}.3f}" if engine in medians else f"{'-':>{width}}"
+            for engine in engines
+        ]
+        rows.append(f"{point['scale']:>8g} {point['size']:>12}  " + " ".join(cells))
+    rows.append("")
+    for threshold, engine in tuning["crossovers"]:
+        rows.append(f"{day}: {engine} from {tuning['statistic']} >= {threshold:.0f}")
+    return "\n".join(rows)
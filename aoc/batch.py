@@ -0,0 +1,78 @@
+import glob
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Dict, Iterator, List, Optional
+
+from .days import DAY_ARGS, import_day, load_solver
+from .engines import Profile, available_cpus, load_profile, tuned_day_args
+from .parse_cache import PARSE_CACHE_ENV
+
+BatchResult = Dict[str, Any]
+
+# What a worker solves with, set once by its initializer.
+_day: Optional[str] = None
+_day_args: Dict[str, Any] = {}
+_profile: Profile = {}
+
+
+def expand_inputs(pattern: str) -> List[str]:
+    """Input files of a directory, or the files matching a glob pattern."""
+    if os.path.isdir(pattern):
+        paths = [os.path.join(pattern, name) for name in os.listdir(pattern)]
+    else:
+        paths = glob.glob(pattern)
+    return sorted(path for path in paths if os.path.isfile(path))
+
+
+def _load_worker_solver(day: str, day_args: Optional[Dict[str, Any]]) -> None:
+    global _day, _day_args, _profile
+    # Keep solver prints out of the JSONL stream on stdout.
+    sys.stdout = sys.stderr
+    # Inputs are often solved more than once; AOC_PARSE_CACHE=0 still opts out.
+    os.environ.setdefault(PARSE_CACHE_ENV, "1")
+    import_day(day)
+    _day = day
+    _day_args = DAY_ARGS.get(day, {}) if day_args is None else day_args
+    _profile = load_profile()
+
+
+def solve_input(input_file_path: str) -> BatchResult:
+    """Solve one input with the worker's day, reporting errors as results.
+
+    Days with engines use the one the autotune profile picks for the input.
+    """
+    start = time.perf_counter_ns()
+    try:
+        day_args = tuned_day_args(_day, input_file_path, _day_args, _profile)
+        answers, error = load_solver(_day, day_args)(input_file_path), None
+    except Exception as e:
+        answers, error = None, f"{type(e).__name__}: {e}"
+    return {
+        "input": input_file_path,
+        "answers": answers,
+        "elapsed_ms": (time.perf_counter_ns() - start) / 1_000_000,
+        "error": error,
+    }
+
+
+def run_batch(
+    day: str,
+    inputs: List[str],
+    jobs: Optional[int] = None,
+    day_args: Optional[Dict[str, Any]] = None,
+) -> Iterator[BatchResult]:
+    """Solve every input on a process pool and yield results as they finish.
+
+    Each worker imports the day once, in its initializer, and then only calls
+    `main()` for each input it is handed.
+    """
+    with ProcessPoolExecutor(
+        max_workers=jobs or len(available_cpus()),
+        initializer=_load_worker_solver,
+        initargs=(day, day_args),
+    ) as pool:
+        futures = [pool.submit(solve_input, path) for path in inputs]
+        for future in as_completed(futures):
+            yield future.result()
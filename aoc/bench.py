@@ -0,0 +1,104 @@
+import statistics
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from .days import Solver, load_solver
+from .engines import tuned_day_args
+from .generators import workload
+from .memory import trace_solver
+from .phases import collect_phases, reset_phases
+
+PhaseSamples = Dict[str, List[int]]
+
+
+@dataclass
+class Timing:
+    day: str
+    runs: int
+    min_ms: float
+    median_ms: float
+    p95_ms: float
+    stddev_ms: float
+    error: Optional[str] = None
+    phases: Dict[str, float] = field(default_factory=dict)
+    memory: Dict[str, Any] = field(default_factory=dict)
+    answers: Dict[str, Any] = field(default_factory=dict)
+    # True when replayed from the result cache instead of measured.
+    cached: bool = False
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def percentile(samples: List[float], percent: float) -> float:
+    """Nearest-rank percentile of the samples."""
+    ordered = sorted(samples)
+    rank = max(1, -(-len(ordered) * percent // 100))
+    return ordered[int(rank) - 1]
+
+
+def summarize(
+    day: str, samples_ns: List[int], phase_samples_ns: Optional[PhaseSamples] = None
+) -> Timing:
+    samples_ms = [sample / 1_000_000 for sample in samples_ns]
+    phases = {
+        name: statistics.median(samples) / 1_000_000
+        for name, samples in (phase_samples_ns or {}).items()
+    }
+    return Timing(
+        day=day,
+        runs=len(samples_ms),
+        min_ms=min(samples_ms),
+        median_ms=statistics.median(samples_ms),
+        p95_ms=percentile(samples_ms, 95),
+        stddev_ms=statistics.stdev(samples_ms) if len(samples_ms) > 1 else 0.0,
+        phases=phases,
+    )
+
+
+def sample_solver(
+    solver: Solver, input_file_path: str, repeat: int, warmup: int
+) -> Tuple[List[int], PhaseSamples, Any]:
+    """Timed samples, per-phase samples and the answers of the last run."""
+    for _ in range(warmup):
+        solver(input_file_path)
+    samples = []
+    phase_samples: PhaseSamples = {}
+    answers = None
+    for _ in range(repeat):
+        reset_phases()
+        start = time.perf_counter_ns()
+        answers = solver(input_file_path)
+        samples.append(time.perf_counter_ns() - start)
+        for name, elapsed in collect_phases().items():
+            phase_samples.setdefault(name, []).append(elapsed)
+    return samples, phase_samples, answers
+
+
+def measure_day(
+    day: str,
+    repeat: int,
+    warmup: int,
+    memory: bool = False,
+    scale: Optional[float] = None,
+    seed: int = 0,
+) -> Timing:
+    """Time the day and, with `memory`, trace one extra untimed run.
+
+    With `scale`, the day runs on a generated input instead of the real one.
+    Days with engines use the one the autotune profile picks for the input.
+    """
+    try:
+        input_file_path, day_args = workload(day, scale, seed)
+        solver = load_solver(day, tuned_day_args(day, input_file_path, day_args))
+        samples, phase_samples, answers = sample_solver(
+            solver, input_file_path, repeat, warmup
+        )
+        timing = summarize(day, samples, phase_samples)
+        timing.answers = answers or {}
+        if memory:
+            timing.memory = trace_solver(solver, input_file_path)
+    except Exception as e:
+        return Timing(day, 0, 0.0, 0.0, 0.0, 0.0, error=f"{type(e).__name__}: {e}")
+    return timing
@@ -0,0 +1,186 @@
+import json
+import math
+import multiprocessing
+import resource
+import signal
+import time
+from dataclasses import dataclass, replace
+from typing import Any, Dict, Optional
+
+from .bench import Timing, measure_day
+from .phases import add_listener
+
+# How running out of address space surfaces besides MemoryError: the dynamic
+# loader failing to map an extension module, or mmap failing with ENOMEM.
+OUT_OF_ADDRESS_SPACE = ("failed to map segment", "Cannot allocate memory")
+
+
+@dataclass
+class Budget:
+    """Limits for one day; None means unlimited.
+
+    Time limits are per run of `main()`, so a measurement of `n` runs may
+    take `n` times as long plus `startup_s` for imports and input generation.
+    The memory limit caps the address space of the measuring process, an
+    upper bound on its RSS.
+    """
+
+    wall_s: Optional[float] = 30.0
+    cpu_s: Optional[float] = 30.0
+    rss_mib: Optional[int] = 2048
+    startup_s: float = 10.0
+
+
+# Overrides of the default budget for days that are slow on large inputs.
+DAY_BUDGETS: Dict[str, Dict[str, Any]] = {
+    "2024_14": {"wall_s": 60.0, "cpu_s": 60.0},
+    "2024_19": {"wall_s": 60.0, "cpu_s": 60.0},
+    "2024_22": {"wall_s": 120.0, "cpu_s": 120.0},
+}
+
+
+def load_budgets(path: str) -> Dict[str, Dict[str, Any]]:
+    """Per-day overrides from a JSON file, e.g. `{"2024_23": {"wall_s": 5}}`.
+
+    The "default" entry, if any, overrides the default budget of every day.
+    """
+    with open(path) as f:
+        return json.load(f)
+
+
+def budget_for(
+    day: str, overrides: Optional[Dict[str, Dict[str, Any]]] = None
+) -> Budget:
+    """The default budget with the day's overrides; `overrides` fields take
+    precedence over those of the DAY_BUDGETS entry of the same day."""
+    overrides = overrides or {}
+    budget = replace(Budget(), **overrides.get("default", {}))
+    return replace(budget, **{**DAY_BUDGETS.get(day, {}), **overrides.get(day, {})})
+
+
+class _PhaseReporter:
+    """Tells the parent which phase the child entered, so a killed run can
+    still report how far it got."""
+
+    def __init__(self, conn):
+        self.conn = conn
+
+    def enter(self, name: str) -> None:
+        self.conn.send(("phase", name))
+
+    def exit(self, name: str) -> None:
+        pass
+
+
+def _cpu_limit(budget: Budget, runs: int) -> int:
+    """The soft RLIMIT_CPU, in seconds, for a measurement of `runs` runs."""
+    return math.ceil(budget.cpu_s * runs + budget.startup_s)
+
+
+def _apply_limits(budget: Budget, runs: int) -> None:
+    if budget.cpu_s is not None:
+        seconds = _cpu_limit(budget, runs)
+        # The soft limit sends SIGXCPU; the hard one kills a process that ignores it.
+        resource.setrlimit(resource.RLIMIT_CPU, (seconds, seconds + 1))
+    if budget.rss_mib is not None:
+        limit = budget.rss_mib * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+
+def _measure_child(conn, budget: Budget, runs: int, args: tuple) -> None:
+    _apply_limits(budget, runs)
+    add_listener(_PhaseReporter(conn))
+    conn.send(("done", measure_day(*args)))
+
+
+def _children_cpu_s() -> float:
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return usage.ru_utime + usage.ru_stime
+
+
+def _out_of_memory(budget: Budget, error: Optional[str]) -> bool:
+    if budget.rss_mib is None or not error:
+        return False
+    return error.startswith("MemoryError") or any(
+        sign in error for sign in OUT_OF_ADDRESS_SPACE
+    )
+
+
+def _over_budget(
+    day: str, limit: str, last_phase: Optional[str], error: Optional[str] = None
+) -> Timing:
+    message = f"over budget: {limit}, last phase {last_phase or 'none (startup)'}"
+    if error:
+        message += f" ({error})"
+    return Timing(day, 0, 0.0, 0.0, 0.0, 0.0, error=message)
+
+
+def measure_day_within_budget(
+    day: str,
+    repeat: int,
+    warmup: int,
+    memory: bool = False,
+    scale: Optional[float] = None,
+    seed: int = 0,
+    budget: Optional[Budget] = None,
+) -> Timing:
+    """`measure_day` in a child process that is stopped when over budget.
+
+    CPU time and memory are capped with `setrlimit` in the child, wall time
+    by the parent, which kills the child once its deadline passes.
+    """
+    budget = budget or budget_for(day)
+    runs = warmup + repeat + int(memory)
+    receiver, sender = multiprocessing.Pipe(duplex=False)
+    process = multiprocessing.Process(
+        target=_measure_child,
+        args=(sender, budget, runs, (day, repeat, warmup, memory, scale, seed)),
+    )
+    cpu_before = _children_cpu_s()
+    process.start()
+    sender.close()
+    deadline = None
+    if budget.wall_s is not None:
+        deadline = time.monotonic() + budget.wall_s * runs + budget.startup_s
+
+    last_phase = None
+    timing = None
+    timed_out = False
+    while timing is None:
+        timeout = None if deadline is None else deadline - time.monotonic()
+        if timeout is not None and (timeout <= 0 or not receiver.poll(timeout)):
+            timed_out = True
+            break
+        try:
+            kind, value = receiver.recv()
+        except EOFError:
+            break
+        if kind == "phase":
+            last_phase = value
+        else:
+            timing = value
+    if timing is None:
+        process.kill()
+    process.join()
+    receiver.close()
+
+    if timed_out:
+        limit = f"wall time over {budget.wall_s:g} s per run"
+        return _over_budget(day, limit, last_phase)
+    if timing is None:
+        # A process that ignores SIGXCPU is killed at the hard limit; any other
+        # SIGKILL, such as the OOM killer's, comes before the soft limit is used.
+        cpu_used = _children_cpu_s() - cpu_before
+        if process.exitcode == -signal.SIGXCPU or (
+            process.exitcode == -signal.SIGKILL
+            and budget.cpu_s is not None
+            and cpu_used >= _cpu_limit(budget, runs)
+        ):
+            limit = f"CPU time over {budget.cpu_s:g} s per run"
+            return _over_budget(day, limit, last_phase)
+        error = f"measuring process died with exit code {process.exitcode}"
+        return Timing(day, 0, 0.0, 0.0, 0.0, 0.0, error=error)
+    if _out_of_memory(budget, timing.error):
+        limit = f"memory over {budget.rss_mib} MiB"
+        return _over_budget(day, limit, last_phase, timing.error)
+    return timing
@@ -0,0 +1,191 @@
+import argparse
+import inspect
+import json
+import sys
+import time
+from types import ModuleType
+from typing import Any, Dict, List, Optional, Tuple
+
+from .engines import choose_engine
+from .days import DAY_ARGS, TEST_DAY_ARGS, find_days, import_day, test_input_path
+from .generators import workload
+from .phases import collect_phases, reset_phases
+
+PARTS = ["part_1", "part_2"]
+# Let the autotune profile pick the engine; also what days with engines default to.
+AUTO_ENGINE = "auto"
+
+
+def resolve_day(name: str, days: List[str]) -> str:
+    """Match "2024_07", "07" or "7" against the available days."""
+    for day in days:
+        if name == day or name.lstrip("0") == day.split("_")[1].lstrip("0"):
+            return day
+    raise ValueError(f"No day {name}, expected one of {', '.join(days)}")
+
+
+def parse_override(text: str) -> Tuple[str, Any]:
+    """`key=value`, with the value read as JSON when it parses, e.g. `dim=[6,6]`."""
+    key, separator, value = text.partition("=")
+    if not separator:
+        raise argparse.ArgumentTypeError(f"Expected KEY=VALUE, got {text}")
+    try:
+        return key, json.loads(value)
+    except ValueError:
+        return key, value
+
+
+def engines(module: ModuleType) -> Tuple[str, ...]:
+    return tuple(getattr(module, "ENGINES", ()))
+
+
+def accepts(module: ModuleType, parameter: str) -> bool:
+    return parameter in inspect.signature(module.main).parameters
+
+
+def solver_arguments(
+    day: str,
+    module: ModuleType,
+    day_args: Dict[str, Any],
+    part: Optional[int] = None,
+    engine: Optional[str] = None,
+) -> Dict[str, Any]:
+    """The day's arguments plus what selecting a part or an engine needs.
+
+    Part 1 alone skips part 2 in days whose `main` takes `has_part_2`; the
+    other days, and part 2 alone, still solve both parts.
+    """
+    day_args = dict(day_args)
+    if part == 1 and accepts(module, "has_part_2"):
+        day_args["has_part_2"] = False
+    elif part == 2 and "has_part_2" in day_args:
+        day_args["has_part_2"] = True
+    if engine is not None:
+        if engine not in engines(module):
+            available = ", ".join(engines(module)) or "none"
+            raise ValueError(f"{day} has no engine {engine}, available: {available}")
+        day_args["engine"] = engine
+    return day_args
+
+
+def run_day(
+    module: ModuleType, input_file_path: str, day_args: Dict[str, Any]
+) -> Tuple[Dict[str, Any], float, Dict[str, float]]:
+    """Answers, total milliseconds and per-phase milliseconds of one run."""
+    reset_phases()
+    start = time.perf_counter_ns()
+    answers = module.main(input_file_path, **day_args)
+    elapsed_ms = (time.perf_counter_ns() - start) / 1_000_000
+    phases = {name: ns / 1_000_000 for name, ns in collect_phases().items()}
+    return answers, elapsed_ms, phases
+
+
+def format_result(
+    day: str,
+    answers: Dict[str, Any],
+    elapsed_ms: float,
+    phases: Dict[str, float],
+    engine: Optional[str] = None,
+) -> str:
+    timings = ", ".join(f"{name} {ms:.3f}" for name, ms in phases.items())
+    label = f"{day} [{engine}]" if engine else day
+    lines = [f"{label} ({elapsed_ms:.3f} ms: {timings})"]
+    lines.extend(f"  {part}: {answer}" for part, answer in answers.items())
+    return "\n".join(lines)
+
+
+def list_days(days: List[str]) -> str:
+    lines = []
+    for day in days:
+        module = import_day(day)
+        parameters = list(inspect.signature(module.main).parameters)[1:]
+        line = f"{day}  parameters: {', '.join(parameters) or '-'}"
+        if engines(module):
+            line += f"  engines: {', '.join(engines(module))}"
+        lines.append(line)
+    return "\n".join(lines)
+
+
+def parse_args(argv: List[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m aoc", description="Solve Advent of Code days"
+    )
+    parser.add_argument("days", nargs="*", help="days, e.g. 2024_07 or 7; default all")
+    parser.add_argument(
+        "--part",
+        type=int,
+        choices=[1, 2],
+        help="only print, and where possible only solve, this part",
+    )
+    parser.add_argument(
+        "--engine",
+        help="implementation to use, see --list; by default the autotuned one",
+    )
+    inputs = parser.add_mutually_exclusive_group()
+    inputs.add_argument("--input", help="input file, for a single day")
+    inputs.add_argument(
+        "--test", action="store_true", help="solve the day's example input"
+    )
+    inputs.add_argument(
+        "--scale", type=float, help="solve a generated input of this relative size"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="seed for --scale inputs")
+    parser.add_argument(
+        "--arg",
+        dest="overrides",
+        type=parse_override,
+        action="append",
+        default=[],
+        metavar="KEY=VALUE",
+        help="override a day parameter, e.g. --arg threshhold=50",
+    )
+    parser.add_argument("--json", action="store_true", help="print JSON lines")
+    parser.add_argument(
+        "--list", action="store_true", help="list days, parameters and engines"
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    available = find_days()
+    try:
+        days = [resolve_day(name, available) for name in args.days] or available
+    except ValueError as e:
+        sys.exit(str(e))
+    if args.list:
+        print(list_days(days))
+        return 0
+    if args.input and len(days) != 1:
+        sys.exit("--input needs exactly one day")
+
+    failed = 0
+    for day in days:
+        module = import_day(day)
+        if args.input:
+            path, day_args = args.input, DAY_ARGS.get(day, {})
+        elif args.test:
+            path = test_input_path(day)
+            day_args = {**DAY_ARGS.get(day, {}), **TEST_DAY_ARGS.get(day, {})}
+        else:
+            path, day_args = workload(day, args.scale, args.seed)
+        engine = args.engine
+        if engine in (None, AUTO_ENGINE):
+            # Days without engines have nothing to choose between.
+            engine = choose_engine(day, path) if engines(module) else None
+        try:
+            day_args = {**day_args, **dict(args.overrides)}
+            day_args = solver_arguments(day, module, day_args, args.part, engine)
+            answers, elapsed_ms, phases = run_day(module, path, day_args)
+        except Exception as e:
+            failed += 1
+            print(f"{day}: {type(e).__name__}: {e}", file=sys.stderr)
+            continue
+        if args.part:
+            answers = {PARTS[args.part - 1]: answers.get(PARTS[args.part - 1])}
+        if args.json:
+            result = {"day": day, "engine": engine, "answers": answers}
+            print(json.dumps({**result, "elapsed_ms": elapsed_ms, "phases": phases}))
+        else:
+            print(format_result(day, answers, elapsed_ms, phases, engine))
+    return 1 if failed else 0
@@ -0,0 +1,59 @@
+from typing import NamedTuple
+
+
+class Coord(NamedTuple):
+    """A (col, row) position or offset.
+
+    Being a tuple, a Coord has no `__dict__` and hashes and compares in C.
+    `+`, `-` and `*` do vector maths instead of tuple concatenation and
+    repetition. Each allocates a Coord, so hot loops unpack coords into
+    local ints or work on `pack`ed ones.
+    """
+
+    col: int
+    row: int
+
+    def add(self, other: "Coord", times: int = 1) -> "Coord":
+        """`self + times * other`."""
+        return Coord(self.col + times * other.col, self.row + times * other.row)
+
+    def __add__(self, other: "Coord") -> "Coord":
+        if not isinstance(other, Coord):
+            return NotImplemented
+        return Coord(self.col + other.col, self.row + other.row)
+
+    def __sub__(self, other: "Coord") -> "Coord":
+        if not isinstance(other, Coord):
+            return NotImplemented
+        return Coord(self.col - other.col, self.row - other.row)
+
+    def __mul__(self, times: int) -> "Coord":
+        if not isinstance(times, int):
+            return NotImplemented
+        return Coord(self.col * times, self.row * times)
+
+    __rmul__ = __mul__
+
+    # A tuple on the left would otherwise concatenate; as a tuple subclass,
+    # Coord's reflected methods are tried first and can refuse.
+    def __radd__(self, other: tuple) -> "Coord":
+        raise TypeError(f"cannot add Coord to {type(other).__name__}")
+
+    def __rsub__(self, other: tuple) -> "Coord":
+        raise TypeError(f"cannot subtract Coord from {type(other).__name__}")
+
+    def in_bounds(self, width: int, height: int) -> bool:
+        return 0 <= self.col < width and 0 <= self.row < height
+
+    def pack(self, width: int) -> int:
+        return self.row * width + self.col
+
+
+def pack(col: int, row: int, width: int) -> int:
+    """A position in a `width` wide area as one int, `row * width + col`."""
+    return row * width + col
+
+
+def unpack(packed: int, width: int) -> Coord:
+    row, col = divmod(packed, width)
+    return Coord(col, row)
@@ -0,0 +1,248 @@
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional
+
+from .bench import percentile
+from .days import DAY_ARGS, find_days, import_day, input_path
+from .engines import load_profile, tuned_day_args
+from .parse_cache import PARSE_CACHE_ENV
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8024
+# Latency samples kept per day for the `/latency` endpoint.
+LATENCY_WINDOW = 1000
+# JSON types of the fields of a `/solve` request; only "day" is required.
+SOLVE_FIELDS = {"day": str, "input": str, "content": str, "day_args": dict}
+
+
+def latency_stats(samples_ms: List[float]) -> Dict[str, float]:
+    return {
+        "count": len(samples_ms),
+        "median_ms": statistics.median(samples_ms),
+        "p95_ms": percentile(samples_ms, 95),
+        "max_ms": max(samples_ms),
+    }
+
+
+class SolverDaemon:
+    """Keeps every day imported, and its caches warm, between solve requests.
+
+    Solves run one at a time, as phase timings and some solver caches are
+    module globals, while the server keeps answering other endpoints.
+    """
+
+    def __init__(self, days: Optional[List[str]] = None, warm: bool = False):
+        self.modules = {day: import_day(day) for day in days or find_days()}
+        # Read once; restart the daemon to pick up a new tuning.
+        self.profile = load_profile()
+        self.lock = threading.Lock()
+        self.latency_lock = threading.Lock()
+        # Per day: (time spent handling the request, time spent in `main()`).
+        self.latencies: Dict[str, List[Any]] = {}
+        if warm:
+            for day in self.modules:
+                if os.path.isfile(input_path(day)):
+                    self.solve(day, input_file_path=input_path(day))
+
+    def solve(
+        self,
+        day: str,
+        input_file_path: Optional[str] = None,
+        content: Optional[str] = None,
+        day_args: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Solve a day on an input file, or on inline input `content`."""
+        if day not in self.modules:
+            raise KeyError(day)
+        if day_args is None:
+            day_args = DAY_ARGS.get(day, {})
+        temp_path = None
+        if content is not None:
+            fd, temp_path = tempfile.mkstemp(prefix=f"{day}-", suffix=".txt")
+            with os.fdopen(fd, "w") as f:
+                f.write(content)
+            input_file_path = temp_path
+        try:
+            with self.lock:
+                start = time.perf_counter_ns()
+                try:
+                    day_args = tuned_day_args(
+                        day, input_file_path, day_args, self.profile
+                    )
+                    answers = self.modules[day].main(input_file_path, **day_args)
+                    error = None
+                except Exception as e:
+                    answers, error = None, f"{type(e).__name__}: {e}"
+                elapsed_ms = (time.perf_counter_ns() - start) / 1_000_000
+        finally:
+            if temp_path:
+                os.remove(temp_path)
+        return {
+            "day": day,
+            "answers": answers,
+            "elapsed_ms": elapsed_ms,
+            "error": error,
+        }
+
+    def record_latency(self, day: str, total_ms: float, solve_ms: float) -> None:
+        with self.latency_lock:
+            samples = self.latencies.setdefault(day, [])
+            samples.append((total_ms, solve_ms))
+            del samples[:-LATENCY_WINDOW]
+
+    def latency(self) -> Dict[str, Any]:
+        """Request latency per day, split into solving and daemon overhead."""
+        with self.latency_lock:
+            latencies = {day: list(samples) for day, samples in self.latencies.items()}
+        report = {}
+        for day, samples in sorted(latencies.items()):
+            totals = [total for total, _ in samples]
+            overheads = [total - solve for total, solve in samples]
+            report[day] = {
+                **latency_stats(totals),
+                "overhead_median_ms": statistics.median(overheads),
+            }
+        return report
+
+
+class DaemonHandler(BaseHTTPRequestHandler):
+    """JSON API: `POST /solve`, `GET /latency` and `GET /days`."""
+
+    def do_GET(self):
+        daemon = self.server.daemon
+        if self.path == "/latency":
+            self.send_json(200, daemon.latency())
+        elif self.path == "/days":
+            self.send_json(200, sorted(daemon.modules))
+        else:
+            self.send_json(404, {"error": f"Unknown endpoint {self.path}"})
+
+    def do_POST(self):
+        start = time.perf_counter_ns()
+        if self.path != "/solve":
+            self.send_json(404, {"error": f"Unknown endpoint {self.path}"})
+            return
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            request = json.loads(self.rfile.read(length))
+            day = request["day"]
+            for field, expected in SOLVE_FIELDS.items():
+                if not isinstance(request.get(field, expected()), expected):
+                    raise TypeError(f"{field} must be a {expected.__name__}")
+        except (ValueError, KeyError, TypeError) as e:
+            self.send_json(400, {"error": f"Bad solve request: {e}"})
+            return
+        if "input" not in request and "content" not in request:
+            request["input"] = input_path(day)
+        try:
+            result = self.server.daemon.solve(
+                day,
+                input_file_path=request.get("input"),
+                content=request.get("content"),
+                day_args=request.get("day_args"),
+            )
+        except KeyError:
+            self.send_json(404, {"error": f"Unknown day {day}"})
+            return
+        # Recorded before replying, so the client's next /latency includes it.
+        total_ms = (time.perf_counter_ns() - start) / 1_000_000
+        self.server.daemon.record_latency(day, total_ms, result["elapsed_ms"])
+        self.send_json(200, result)
+
+    def send_json(self, status: int, payload: Any) -> None:
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def make_server(
+    daemon: SolverDaemon, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT
+) -> ThreadingHTTPServer:
+    """A localhost HTTP server for the daemon; port 0 picks a free port."""
+    DaemonHandler.protocol_version = "HTTP/1.1"
+    server = ThreadingHTTPServer((host, port), DaemonHandler)
+    server.daemon = daemon
+    return server
+
+
+def call(url: str, endpoint: str, payload: Optional[Dict[str, Any]] = None) -> Any:
+    """Send a request to a running daemon and decode its JSON reply."""
+    data = None if payload is None else json.dumps(payload).encode()
+    request = urllib.request.Request(
+        url.rstrip("/") + endpoint,
+        data=data,
+        headers={"Content-Type": "application/json"},
+    )
+    try:
+        with urllib.request.urlopen(request) as response:
+            return json.load(response)
+    except urllib.error.HTTPError as e:
+        return json.load(e)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Warm solver daemon: keeps every day imported between solves."
+    )
+    parser.add_argument(
+        "--url", default=f"http://{DEFAULT_HOST}:{DEFAULT_PORT}", help="daemon address"
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+    serve_parser = commands.add_parser("serve", help="run the daemon")
+    serve_parser.add_argument("--host", default=DEFAULT_HOST)
+    serve_parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    serve_parser.add_argument("--days", nargs="+", help="days to preload")
+    serve_parser.add_argument(
+        "--warm", action="store_true", help="solve each day's own input at startup"
+    )
+    solve_parser = commands.add_parser("solve", help="solve a day on the daemon")
+    solve_parser.add_argument("day")
+    solve_parser.add_argument(
+        "input", nargs="?", help="input path, '-' for stdin, default the day's input"
+    )
+    commands.add_parser("latency", help="show request latency per day")
+    args = parser.parse_args(argv)
+
+    if args.command == "serve":
+        # Repeat requests for an input skip parsing; AOC_PARSE_CACHE=0 opts out.
+        os.environ.setdefault(PARSE_CACHE_ENV, "1")
+        server = make_server(SolverDaemon(args.days, args.warm), args.host, args.port)
+        print(f"Serving {len(server.daemon.modules)} days on port {args.port}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+    elif args.command == "solve":
+        payload: Dict[str, Any] = {"day": args.day}
+        if args.input == "-":
+            payload["content"] = sys.stdin.read()
+        elif args.input:
+            payload["input"] = os.path.abspath(args.input)
+        start = time.perf_counter()
+        result = call(args.url, "/solve", payload)
+        round_trip_ms = (time.perf_counter() - start) * 1000
+        print(json.dumps(result))
+        print(f"Round trip {round_trip_ms:.3f} ms", file=sys.stderr)
+    else:
+        print(json.dumps(call(args.url, "/latency"), indent=2))
+
+
+if __name__ == "__main__":
+    main()
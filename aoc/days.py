@@ -0,0 +1,63 @@
+import importlib
+import os
+import re
+from functools import partial
+from types import ModuleType
+from typing import Any, Callable, Dict, List, Optional
+
+DAY_FOLDER_REGEX = re.compile(r"^(\d{4})_(\d{2})$")
+
+# Extra arguments the real puzzle inputs need on top of the input path.
+DAY_ARGS: Dict[str, Dict[str, Any]] = {
+    "2024_14": {"width": 101, "height": 103},
+    "2024_17": {"has_part_2": True},
+    "2024_18": {"dim": (70, 70), "rounds": 1024},
+    "2024_20": {"threshhold": 100},
+    "2024_23": {"has_part_2": True},
+}
+
+# Arguments for the examples in `{day}_test.txt`, where they differ.
+TEST_DAY_ARGS: Dict[str, Dict[str, Any]] = {
+    "2024_14": {"width": 11, "height": 7},
+    "2024_18": {"dim": (6, 6), "rounds": 12},
+    "2024_20": {"threshhold": 12},
+}
+
+Solver = Callable[[str], Dict[str, Any]]
+
+
+def find_days(directory: str = ".") -> List[str]:
+    return sorted(
+        folder
+        for folder in os.listdir(directory)
+        if DAY_FOLDER_REGEX.match(folder)
+        and os.path.isfile(os.path.join(directory, folder, f"aoc_{folder}.py"))
+    )
+
+
+def module_name(day: str) -> str:
+    return f"{day}.aoc_{day}"
+
+
+def script_path(day: str, directory: str = ".") -> str:
+    return os.path.join(directory, day, f"aoc_{day}.py")
+
+
+def input_path(day: str, directory: str = ".") -> str:
+    return os.path.join(directory, day, f"{day}_input.txt")
+
+
+def test_input_path(day: str, directory: str = ".") -> str:
+    return os.path.join(directory, day, f"{day}_test.txt")
+
+
+def import_day(day: str) -> ModuleType:
+    return importlib.import_module(module_name(day))
+
+
+def load_solver(day: str, day_args: Optional[Dict[str, Any]] = None) -> Solver:
+    """Return the day's `main` with the per-day arguments already bound."""
+    module = import_day(day)
+    if day_args is None:
+        day_args = DAY_ARGS.get(day, {})
+    return partial(module.main, **day_args)
@@ -0,0 +1,102 @@
+import json
+import os
+import platform
+from typing import Any, Dict, List, Optional, Tuple
+
+from .days import import_day
+
+AUTOTUNE_PROFILE = os.path.join(".aoc_cache", "autotune.json")
+
+Profile = Dict[str, Dict[str, Any]]
+# (input statistic from which the engine is fastest, engine), smallest first.
+Crossovers = List[Tuple[float, str]]
+
+
+def available_cpus() -> List[int]:
+    """The CPUs this process may run on, which affinity can restrict."""
+    if hasattr(os, "sched_getaffinity"):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
+
+def _count_lines(input_file_path: str) -> int:
+    lines = 0
+    last = b"\n"
+    with open(input_file_path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            lines += block.count(b"\n")
+            last = block[-1:]
+    return lines + (last != b"\n")
+
+
+def _grid_area(input_file_path: str) -> int:
+    with open(input_file_path, "rb") as f:
+        width = len(f.readline().rstrip(b"\r\n"))
+    return width * _count_lines(input_file_path)
+
+
+# Input statistics cheap enough to compute before every solve.
+STATISTICS = {
+    "bytes": os.path.getsize,
+    "lines": _count_lines,
+    "grid_area": _grid_area,
+}
+
+
+def input_statistic(input_file_path: str, statistic: str) -> int:
+    return STATISTICS[statistic](input_file_path)
+
+
+def engine_for(crossovers: Crossovers, size: int) -> str:
+    chosen = crossovers[0][1]
+    for threshold, engine in crossovers:
+        if size >= threshold:
+            chosen = engine
+    return chosen
+
+
+def machine() -> Dict[str, Any]:
+    """What a tuning is only valid for: the host and the CPUs we may use."""
+    return {"host": platform.node(), "cpus": len(available_cpus())}
+
+
+def load_profile(path: Optional[str] = None) -> Profile:
+    try:
+        with open(path or AUTOTUNE_PROFILE) as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def save_profile(day: str, tuning: Dict[str, Any], path: Optional[str] = None) -> None:
+    path = path or AUTOTUNE_PROFILE
+    profile = load_profile(path)
+    profile[day] = tuning
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(profile, f, indent=2)
+
+
+def choose_engine(
+    day: str, input_file_path: str, profile: Optional[Profile] = None
+) -> Optional[str]:
+    """The tuned engine for this input, or None when the day was never tuned
+    on this machine."""
+    tuning = (load_profile() if profile is None else profile).get(day)
+    if not tuning or any(tuning.get(key) != value for key, value in machine().items()):
+        return None
+    size = input_statistic(input_file_path, tuning["statistic"])
+    return engine_for([tuple(crossover) for crossover in tuning["crossovers"]], size)
+
+
+def tuned_day_args(
+    day: str,
+    input_file_path: str,
+    day_args: Dict[str, Any],
+    profile: Optional[Profile] = None,
+) -> Dict[str, Any]:
+    """`day_args` plus the tuned engine, unless they already name one."""
+    if "engine" in day_args or not getattr(import_day(day), "ENGINES", ()):
+        return day_args
+    engine = choose_engine(day, input_file_path, profile)
+    return day_args if engine is None else {**day_args, "engine": engine}
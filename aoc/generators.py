@@ -0,0 +1,636 @@
+import math
+import os
+import random
+import string
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from .days import DAY_ARGS, input_path
+
+GENERATED_DIR = "generated"
+
+# Generated text and the per-day arguments the solver needs to read it.
+GeneratedInput = Tuple[str, Dict[str, Any]]
+Generator = Callable[[random.Random, float], GeneratedInput]
+
+GENERATORS: Dict[str, Generator] = {}
+
+
+def generator(day: str) -> Callable[[Generator], Generator]:
+    def register(func: Generator) -> Generator:
+        GENERATORS[day] = func
+        return func
+
+    return register
+
+
+def scaled(size: int, scale: float) -> int:
+    """Scale a count linearly, e.g. the number of lines."""
+    return max(1, round(size * scale))
+
+
+def scaled_side(side: int, scale: float) -> int:
+    """Scale a grid side so the grid area grows linearly with the scale."""
+    return max(3, round(side * math.sqrt(scale)))
+
+
+def lines(rows: List[str]) -> str:
+    return "\n".join(rows) + "\n"
+
+
+def maze(rng: random.Random, width: int, height: int) -> List[List[str]]:
+    """Perfect maze on odd coordinates, carved with a randomized DFS."""
+    grid = [["#"] * width for _ in range(height)]
+    stack = [(1, 1)]
+    grid[1][1] = "."
+    while stack:
+        x, y = stack[-1]
+        neighbours = [
+            (x + dx, y + dy)
+            for dx, dy in ((2, 0), (-2, 0), (0, 2), (0, -2))
+            if 0 < x + dx < width - 1
+            and 0 < y + dy < height - 1
+            and grid[y + dy][x + dx] == "#"
+        ]
+        if not neighbours:
+            stack.pop()
+            continue
+        new_x, new_y = rng.choice(neighbours)
+        grid[(y + new_y) // 2][(x + new_x) // 2] = "."
+        grid[new_y][new_x] = "."
+        stack.append((new_x, new_y))
+    return grid
+
+
+def _reachable(grid: List[List[str]], start: Tuple[int, int]) -> Dict[Tuple, Any]:
+    """Open cells reachable from start, mapped to the cell they were reached from."""
+    previous: Dict[Tuple, Any] = {start: None}
+    stack = [start]
+    while stack:
+        x, y = stack.pop()
+        for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1)):
+            cell = (x + dx, y + dy)
+            if grid[cell[1]][cell[0]] != "#" and cell not in previous:
+                previous[cell] = (x, y)
+                stack.append(cell)
+    return previous
+
+
+def odd(value: int) -> int:
+    return value if value % 2 else value + 1
+
+
+@generator("2024_01")
+def location_lists(rng: random.Random, scale: float) -> GeneratedInput:
+    count = scaled(1000, scale)
+    shared = [rng.randint(10000, 99999) for _ in range(count // 2 + 1)]
+    rows = [
+        f"{rng.choice(shared)}   {rng.choice(shared + [rng.randint(10000, 99999)])}"
+        for _ in range(count)
+    ]
+    return lines(rows), {}
+
+
+@generator("2024_02")
+def reports(rng: random.Random, scale: float) -> GeneratedInput:
+    rows = []
+    for _ in range(scaled(1000, scale)):
+        level = rng.randint(1, 90)
+        sign = rng.choice((-1, 1))
+        report = [level]
+        for _ in range(rng.randint(4, 7)):
+            step = rng.choice((1, 2, 3, 3, 4)) * sign
+            if rng.random() < 0.1:
+                step = -step
+            report.append(max(1, report[-1] + step))
+        rows.append(" ".join(map(str, report)))
+    return lines(rows), {}
+
+
+@generator("2024_03")
+def corrupted_memory(rng: random.Random, scale: float) -> GeneratedInput:
+    noise = string.ascii_letters + string.digits + "!@#$%^&*()[]{}<>,;:'?+- "
+    rows = []
+    for _ in range(scaled(6, scale)):
+        tokens = []
+        while sum(map(len, tokens)) < 3000:
+            roll = rng.random()
+            if roll < 0.1:
+                tokens.append(f"mul({rng.randint(1, 999)},{rng.randint(1, 999)})")
+            elif roll < 0.12:
+                tokens.append(rng.choice(("do()", "don't()")))
+            elif roll < 0.15:
+                tokens.append(f"mul({rng.randint(1, 999)}, {rng.randint(1, 999)}]")
+            else:
+                tokens.append("".join(rng.choices(noise, k=rng.randint(1, 8))))
+        rows.append("".join(tokens))
+    return lines(rows), {}
+
+
+@generator("2024_04")
+def word_search(rng: random.Random, scale: float) -> GeneratedInput:
+    side = scaled_side(140, scale)
+    rows = ["".join(rng.choices("XMAS", k=side)) for _ in range(side)]
+    return lines(rows), {}
+
+
+@generator("2024_05")
+def print_queue(rng: random.Random, scale: float) -> GeneratedInput:
+    pages = rng.sample(range(10, 100), 49)
+    rules = [
+        f"{before}|{after}"
+        for i, before in enumerate(pages)
+        for after in pages[i + 1 :]
+    ]
+    rng.shuffle(rules)
+    updates = []
+    for _ in range(scaled(200, scale)):
+        update = rng.sample(pages, rng.randrange(5, 24, 2))
+        if rng.random() < 0.5:
+            update.sort(key=pages.index)
+        updates.append(",".join(map(str, update)))
+    return "\n".join(rules) + "\n\n" + "\n".join(updates) + "\n", {}
+
+
+@generator("2024_06")
+def guard_lab(rng: random.Random, scale: float) -> GeneratedInput:
+    """A guard spiralling outwards from the centre until it walks off the map.
+
+    Every turn is forced by an obstacle placed just past the spiral so far,
+    so the path covers a good part of the lab, as in the real inputs, and
+    blocking it creates many loops. Scattered obstacles off the path add
+    more ways to loop without changing the path itself.
+    """
+    side = scaled_side(130, scale)
+    grid = [["."] * side for _ in range(side)]
+    x = y = side // 2
+    path = {(x, y)}
+    low_x = high_x = x
+    low_y = high_y = y
+    dx, dy = 0, -1
+    while True:
+        gap = rng.randint(2, 5)
+        if dx:
+            axis, target = 0, high_x + gap if dx > 0 else low_x - gap
+        else:
+            axis, target = 1, high_y + gap if dy > 0 else low_y - gap
+        while (x, y)[axis] != target and 0 <= x + dx < side and 0 <= y + dy < side:
+            x, y = x + dx, y + dy
+            path.add((x, y))
+        obstacle_x, obstacle_y = x + dx, y + dy
+        if not (0 <= obstacle_x < side and 0 <= obstacle_y < side):
+            break
+        grid[obstacle_y][obstacle_x] = "#"
+        low_x, high_x = min(low_x, x), max(high_x, x)
+        low_y, high_y = min(low_y, y), max(high_y, y)
+        dx, dy = -dy, dx
+    for y, row in enumerate(grid):
+        for x in range(side):
+            if row[x] == "." and (x, y) not in path and rng.random() < 0.03:
+                row[x] = "#"
+    grid[side // 2][side // 2] = "^"
+    return lines(["".join(row) for row in grid]), {}
+
+
+@generator("2024_07")
+def calibrations(rng: random.Random, scale: float) -> GeneratedInput:
+    rows = []
+    for _ in range(scaled(850, scale)):
+        nums = [rng.randint(1, 999) for _ in range(rng.randint(3, 12))]
+        if rng.random() < 0.5:
+            expected = nums[0]
+            for num in nums[1:]:
+                operand = rng.choice("+*|")
+                if operand == "+":
+                    expected += num
+                elif operand == "*":
+                    expected *= num
+                else:
+                    expected = int(f"{expected}{num}")
+        else:
+            expected = rng.randint(1, 10 ** rng.randint(3, 14))
+        rows.append(f"{expected}: {' '.join(map(str, nums))}")
+    return lines(rows), {}
+
+
+@generator("2024_08")
+def antennas(rng: random.Random, scale: float) -> GeneratedInput:
+    side = scaled_side(50, scale)
+    grid = [["."] * side for _ in range(side)]
+    frequencies = string.digits + string.ascii_letters
+    for _ in range(scaled(50, scale)):
+        frequency = rng.choice(frequencies)
+        for _ in range(4):
+            grid[rng.randrange(side)][rng.randrange(side)] = frequency
+    return lines(["".join(row) for row in grid]), {}
+
+
+@generator("2024_09")
+def disk_map(rng: random.Random, scale: float) -> GeneratedInput:
+    length = odd(scaled(19999, scale))
+    digits = [
+        str(rng.randint(1, 9)) if i % 2 == 0 else str(rng.randint(0, 9))
+        for i in range(length)
+    ]
+    return "".join(digits) + "\n", {}
+
+
+@generator("2024_10")
+def topographic_map(rng: random.Random, scale: float) -> GeneratedInput:
+    side = scaled_side(50, scale)
+    grid = [[rng.randint(0, 9) for _ in range(side)] for _ in range(side)]
+    for _ in range(scaled(250, scale)):
+        x, y = rng.randrange(side), rng.randrange(side)
+        for height in range(10):
+            grid[y][x] = height
+            dx, dy = rng.choice(((1, 0), (-1, 0), (0, 1), (0, -1)))
+            x, y = min(side - 1, max(0, x + dx)), min(side - 1, max(0, y + dy))
+    return lines(["".join(map(str, row)) for row in grid]), {}
+
+
+@generator("2024_11")
+def stones(rng: random.Random, scale: float) -> GeneratedInput:
+    numbers = [rng.randint(0, 10 ** rng.randint(1, 7)) for _ in range(scaled(8, scale))]
+    return " ".join(map(str, numbers)) + "\n", {}
+
+
+@generator("2024_12")
+def garden(rng: random.Random, scale: float) -> GeneratedInput:
+    side = scaled_side(140, scale)
+    block = 6
+    plots = [
+        [rng.choice(string.ascii_uppercase) for _ in range(side // block + 1)]
+        for _ in range(side // block + 1)
+    ]
+    grid = [[plots[y // block][x // block] for x in range(side)] for y in range(side)]
+    for _ in range(side * side // 10):
+        x, y = rng.randrange(1, side), rng.randrange(1, side)
+        grid[y][x] = grid[y - rng.randint(0, 1)][x - rng.randint(0, 1)]
+    return lines(["".join(row) for row in grid]), {}
+
+
+@generator("2024_13")
+def claw_machines(rng: random.Random, scale: float) -> GeneratedInput:
+    machines = []
+    for _ in range(scaled(320, scale)):
+        while True:
+            ax, ay = rng.randint(10, 99), rng.randint(10, 99)
+            bx, by = rng.randint(10, 99), rng.randint(10, 99)
+            if ax * by != ay * bx:
+                break
+        if rng.random() < 0.6:
+            a, b = rng.randint(0, 100), rng.randint(0, 100)
+            prize = (a * ax + b * bx, a * ay + b * by)
+        else:
+            prize = (rng.randint(1000, 20000), rng.randint(1000, 20000))
+        machines.append(
+            f"Button A: X+{ax}, Y+{ay}\n"
+            f"Button B: X+{bx}, Y+{by}\n"
+            f"Prize: X={prize[0]}, Y={prize[1]}"
+        )
+    return "\n\n".join(machines) + "\n", {}
+
+
+@generator("2024_14")
+def robots(rng: random.Random, scale: float) -> GeneratedInput:
+    width, height = DAY_ARGS["2024_14"]["width"], DAY_ARGS["2024_14"]["height"]
+    tree_time = rng.randint(1000, width * height - 1)
+    rows = []
+    for i in range(scaled(500, scale)):
+        vx = rng.choice([v for v in range(-99, 100) if v])
+        vy = rng.choice([v for v in range(-99, 100) if v])
+        if i % 5 < 3:
+            # Clustered in the top left quadrant at tree_time.
+            x, y = rng.randrange(width // 2), rng.randrange(height // 2)
+        else:
+            x, y = rng.randrange(width), rng.randrange(height)
+        start_x, start_y = (x - vx * tree_time) % width, (y - vy * tree_time) % height
+        rows.append(f"p={start_x},{start_y} v={vx},{vy}")
+    return lines(rows), {"width": width, "height": height}
+
+
+@generator("2024_15")
+def warehouse(rng: random.Random, scale: float) -> GeneratedInput:
+    side = scaled_side(50, scale)
+    grid = [
+        [
+            "#"
+            if x in (0, side - 1) or y in (0, side - 1) or rng.random() < 0.05
+            else "O"
+            if rng.random() < 0.3
+            else "."
+            for x in range(side)
+        ]
+        for y in range(side)
+    ]
+    grid[side // 2][side // 2] = "@"
+    moves = "".join(rng.choices("<>^v", k=scaled(20000, scale)))
+    move_rows = [moves[i : i + 1000] for i in range(0, len(moves), 1000)]
+    return lines(["".join(row) for row in grid]) + "\n" + lines(move_rows), {}
+
+
+@generator("2024_16")
+def reindeer_maze(rng: random.Random, scale: float) -> GeneratedInput:
+    side = odd(scaled_side(141, scale))
+    start, end = (1, side - 2), (side - 2, 1)
+    while True:
+        grid = maze(rng, side, side)
+        for _ in range(side * side // 20):
+            x, y = rng.randrange(1, side - 1), rng.randrange(1, side - 1)
+            if (x + y) % 2:
+                grid[y][x] = "."
+        # The solver waits for every open side of the end to be reached, so
+        # each must be reachable without passing through the end itself.
+        grid[end[1]][end[0]] = "#"
+        reachable = _reachable(grid, start)
+        end_sides = [(end[0] - 1, end[1]), (end[0], end[1] + 1)]
+        if all(
+            side_cell in reachable
+            for side_cell in end_sides
+            if grid[side_cell[1]][side_cell[0]] != "#"
+        ):
+            break
+    grid[start[1]][start[0]] = "S"
+    grid[end[1]][end[0]] = "E"
+    return lines(["".join(row) for row in grid]), {}
+
+
+def _run_program(program: List[int], a: int) -> List[int]:
+    """Output of a day 17 program of the form `bst, ..., out, adv 3, jnz 0`."""
+    output = []
+    b = c = 0
+    while True:
+        for opcode, operand in zip(program[:-2:2], program[1:-2:2]):
+            combo = (0, 1, 2, 3, a, b, c)[operand] if operand < 7 else 0
+            if opcode == 0:
+                a >>= combo
+            elif opcode == 1:
+                b ^= operand
+            elif opcode == 2:
+                b = combo % 8
+            elif opcode == 4:
+                b ^= c
+            elif opcode == 5:
+                output.append(combo % 8)
+            elif opcode == 6:
+                b = a >> combo
+            elif opcode == 7:
+                c = a >> combo
+        if a == 0:
+            return output
+
+
+def _quine_register(program: List[int]) -> Optional[int]:
+    """The lowest A for which the program outputs itself, if there is one.
+
+    Each loop consumes three bits of A, so A is built from the last output
+    backwards, three bits at a time.
+    """
+    candidates = [0]
+    for length in range(1, len(program) + 1):
+        candidates = [
+            a * 8 + bits
+            for a in candidates
+            for bits in range(8)
+            if a * 8 + bits and _run_program(program, a * 8 + bits) == program[-length:]
+        ]
+    return min(candidates, default=None)
+
+
+@generator("2024_17")
+def chronospatial_computer(rng: random.Random, scale: float) -> GeneratedInput:
+    """A program like the real ones that has a part 2 answer.
+
+    Not every choice of constants lets the program output itself; those
+    without a quine register are drawn again.
+    """
+    a = rng.randrange(8 ** (scaled(16, scale) - 1), 8 ** scaled(16, scale))
+    while True:
+        program = [2, 4, 1, rng.randint(1, 7), 7, 5, 1, rng.randint(1, 7), 4]
+        program += [rng.randint(0, 7), 5, 5, 0, 3, 3, 0]
+        if _quine_register(program) is not None:
+            break
+    text = (
+        f"Register A: {a}\nRegister B: 0\nRegister C: 0\n\n"
+        f"Program: {','.join(map(str, program))}\n"
+    )
+    return text, {}
+
+
+def _first_blocking_byte(side: int, cells: List[Tuple[int, int]]) -> Optional[int]:
+    """Index of the first falling byte that cuts the corner-to-corner path."""
+
+    def reachable(count: int) -> bool:
+        fallen = set(cells[:count])
+        end = (side - 1, side - 1)
+        seen = {(0, 0)}
+        stack = [(0, 0)]
+        while stack:
+            x, y = stack.pop()
+            if (x, y) == end:
+                return True
+            for cell in ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)):
+                if (
+                    0 <= cell[0] < side
+                    and 0 <= cell[1] < side
+                    and cell not in fallen
+                    and cell not in seen
+                ):
+                    seen.add(cell)
+                    stack.append(cell)
+        return False
+
+    if reachable(len(cells)):
+        return None
+    low, high = 0, len(cells)
+    while low < high:
+        middle = (low + high) // 2
+        if reachable(middle + 1):
+            low = middle + 1
+        else:
+            high = middle
+    return low
+
+
+@generator("2024_18")
+def falling_bytes(rng: random.Random, scale: float) -> GeneratedInput:
+    """Maze walls with a few gaps fall first, then random bytes until the
+    path is cut, so part 1 searches a maze and part 2 has an answer."""
+    side = odd(scaled_side(71, scale))
+    # A maze one cell wider on every side, its outer walls are off the memory.
+    grid = maze(rng, side + 2, side + 2)
+    walls, free = [], []
+    for y in range(side):
+        for x in range(side):
+            (walls if grid[y + 1][x + 1] == "#" else free).append((x, y))
+    rng.shuffle(walls)
+    walls = walls[: round(len(walls) * 0.9)]
+    free.remove((0, 0))
+    free.remove((side - 1, side - 1))
+    rng.shuffle(free)
+    cells = walls + free
+    count = max(round(len(cells) * 0.7), _first_blocking_byte(side, cells) + 1)
+    rows = [f"{x},{y}" for x, y in cells[:count]]
+    return lines(rows), {"dim": (side - 1, side - 1), "rounds": len(walls)}
+
+
+@generator("2024_19")
+def towels(rng: random.Random, scale: float) -> GeneratedInput:
+    patterns: Set[str] = set()
+    while len(patterns) < 447:
+        patterns.add("".join(rng.choices("wubrg", k=rng.randint(1, 8))))
+    pattern_list = sorted(patterns)
+    designs = []
+    for _ in range(scaled(400, scale)):
+        if rng.random() < 0.6:
+            design = ""
+            while len(design) < rng.randint(20, 60):
+                design += rng.choice(pattern_list)
+        else:
+            design = "".join(rng.choices("wubrg", k=rng.randint(20, 60)))
+        designs.append(design)
+    return ", ".join(pattern_list) + "\n\n" + lines(designs), {}
+
+
+@generator("2024_20")
+def race_track(rng: random.Random, scale: float) -> GeneratedInput:
+    side = odd(scaled_side(141, scale))
+    corridors = maze(rng, side, side)
+    start, end = (1, side - 2), (side - 2, 1)
+    previous = _reachable(corridors, start)
+    grid = [["#"] * side for _ in range(side)]
+    cell: Optional[Tuple[int, int]] = end
+    while cell:
+        grid[cell[1]][cell[0]] = "."
+        cell = previous[cell]
+    grid[start[1]][start[0]] = "S"
+    grid[end[1]][end[0]] = "E"
+    return lines(["".join(row) for row in grid]), dict(DAY_ARGS["2024_20"])
+
+
+@generator("2024_21")
+def door_codes(rng: random.Random, scale: float) -> GeneratedInput:
+    codes = [f"{rng.randint(1, 999):03}A" for _ in range(scaled(5, scale))]
+    return lines(codes), {}
+
+
+@generator("2024_22")
+def secret_numbers(rng: random.Random, scale: float) -> GeneratedInput:
+    numbers = [rng.randint(1, 16777215) for _ in range(scaled(2000, scale))]
+    return lines(list(map(str, numbers))), {}
+
+
+def _computer_names(count: int) -> List[str]:
+    length = 2
+    while len(string.ascii_lowercase) ** length < count:
+        length += 1
+    names: List[str] = []
+    for i in range(count):
+        name = ""
+        for _ in range(length):
+            i, letter = divmod(i, len(string.ascii_lowercase))
+            name += string.ascii_lowercase[letter]
+        names.append(name)
+    return names
+
+
+@generator("2024_23")
+def lan_party(rng: random.Random, scale: float) -> GeneratedInput:
+    names = _computer_names(max(30, scaled(520, scale)))
+    rng.shuffle(names)
+    clique, others = names[:13], names[13:]
+    edges: Set[Tuple[str, str]] = set()
+    for i, first in enumerate(clique):
+        edges.add((first, rng.choice(others)))
+        for second in clique[i + 1 :]:
+            edges.add((first, second))
+    # Every other computer gets about 13 connections, like the real input.
+    target = len(edges) + min(len(others) * 13 // 2, len(others) ** 2 // 8)
+    while len(edges) < target:
+        first, second = rng.sample(others, 2)
+        if (second, first) not in edges:
+            edges.add((first, second))
+    rows = [f"{first}-{second}" for first, second in edges]
+    rows.sort()
+    rng.shuffle(rows)
+    return lines(rows), dict(DAY_ARGS["2024_23"])
+
+
+@generator("2024_24")
+def adder_gates(rng: random.Random, scale: float) -> GeneratedInput:
+    bits = scaled(45, scale)
+    used: Set[str] = set()
+
+    def wire() -> str:
+        while True:
+            name = "".join(rng.choices(string.ascii_lowercase, k=3))
+            if name not in used and name[0] not in "xyz":
+                used.add(name)
+                return name
+
+    def bit(prefix: str, index: int) -> str:
+        return f"{prefix}{str(index).zfill(2)}"
+
+    gates = [f"{bit('x', 0)} XOR {bit('y', 0)} -> {bit('z', 0)}"]
+    carry = bit("z", 1) if bits == 1 else wire()
+    gates.append(f"{bit('x', 0)} AND {bit('y', 0)} -> {carry}")
+    for i in range(1, bits):
+        half_sum, half_carry, carry_through = wire(), wire(), wire()
+        out = bit("z", bits) if i == bits - 1 else wire()
+        gates += [
+            f"{bit('x', i)} XOR {bit('y', i)} -> {half_sum}",
+            f"{carry} XOR {half_sum} -> {bit('z', i)}",
+            f"{bit('y', i)} AND {bit('x', i)} -> {half_carry}",
+            f"{half_sum} AND {carry} -> {carry_through}",
+            f"{half_carry} OR {carry_through} -> {out}",
+        ]
+        carry = out
+    rng.shuffle(gates)
+    initial = [f"{bit('x', i)}: {rng.randint(0, 1)}" for i in range(bits)]
+    initial += [f"{bit('y', i)}: {rng.randint(0, 1)}" for i in range(bits)]
+    return "\n".join(initial) + "\n\n" + lines(gates), {}
+
+
+@generator("2024_25")
+def locks_and_keys(rng: random.Random, scale: float) -> GeneratedInput:
+    schematics = []
+    for i in range(scaled(500, scale)):
+        heights = [rng.randint(0, 5) for _ in range(5)]
+        rows = [
+            "".join("#" if height >= level else "." for height in heights)
+            for level in range(1, 6)
+        ]
+        if i % 2:
+            schematic = ["#####"] + rows + ["....."]
+        else:
+            schematic = ["....."] + rows[::-1] + ["#####"]
+        schematics.append("\n".join(schematic))
+    return "\n\n".join(schematics) + "\n", {}
+
+
+def generated_path(
+    day: str, scale: float, seed: int, directory: str = GENERATED_DIR
+) -> str:
+    return os.path.join(directory, f"{day}_x{scale:g}_seed{seed}.txt")
+
+
+def generate_input(
+    day: str, scale: float, seed: int = 0, directory: str = GENERATED_DIR
+) -> Tuple[str, Dict[str, Any]]:
+    """Write a generated input for the day and return its path and day arguments."""
+    if day not in GENERATORS:
+        raise ValueError(f"No input generator for {day}")
+    text, day_args = GENERATORS[day](random.Random(f"{day}-{seed}"), scale)
+    os.makedirs(directory, exist_ok=True)
+    path = generated_path(day, scale, seed, directory)
+    with open(path, "w") as f:
+        f.write(text)
+    return path, {**DAY_ARGS.get(day, {}), **day_args}
+
+
+def workload(
+    day: str, scale: Optional[float] = None, seed: int = 0
+) -> Tuple[str, Dict[str, Any]]:
+    """Input path and day arguments: the real input, or a generated one at `scale`."""
+    if scale is None:
+        return input_path(day), DAY_ARGS.get(day, {})
+    return generate_input(day, scale, seed)
@@ -0,0 +1,116 @@
+from typing import Iterable, List, Tuple
+
+# Value of the sentinel cells around the grid; no puzzle character is NUL.
+BORDER = 0
+
+# Indices into `Grid.offsets`, clockwise so that turning right is `+ 1`.
+UP, RIGHT, DOWN, LEFT = range(4)
+
+
+class Grid:
+    """Character grid stored row by row in one flat bytearray.
+
+    Cells are addressed by integer index and hold the character's byte value.
+    The grid is padded with `border` cells of BORDER on every side, so stepping
+    up to `border` cells off the edge lands on a sentinel instead of wrapping
+    into another row: hot loops compare with BORDER instead of checking bounds.
+    """
+
+    __slots__ = ("width", "height", "border", "stride", "cells", "offsets")
+
+    def __init__(self, width: int, height: int, fill: str = ".", border: int = 1):
+        self.width = width
+        self.height = height
+        self.border = border
+        self.stride = width + 2 * border
+        self.cells = bytearray(self.stride * (height + 2 * border))
+        # Index steps for UP, RIGHT, DOWN and LEFT.
+        self.offsets = (-self.stride, 1, self.stride, -1)
+        row = fill.encode() * width
+        for y in range(height):
+            start = self.index(0, y)
+            self.cells[start : start + width] = row
+
+    @classmethod
+    def from_lines(cls, lines: Iterable[str], border: int = 1) -> "Grid":
+        rows = [line.strip() for line in lines]
+        return cls.from_rows([row.encode() for row in rows if row], border)
+
+    @classmethod
+    def from_rows(cls, rows: List[bytes], border: int = 1) -> "Grid":
+        width = len(rows[0])
+        if any(len(row) != width for row in rows):
+            raise ValueError("Grid rows must all have the same length")
+        grid = cls(width, len(rows), border=border)
+        for y, row in enumerate(rows):
+            start = grid.index(0, y)
+            grid.cells[start : start + width] = row
+        return grid
+
+    @classmethod
+    def from_file(cls, input_file_path: str, border: int = 1) -> "Grid":
+        with open(input_file_path) as f:
+            return cls.from_lines(f, border)
+
+    def index(self, x: int, y: int) -> int:
+        return (y + self.border) * self.stride + x + self.border
+
+    def coords(self, index: int) -> Tuple[int, int]:
+        y, x = divmod(index, self.stride)
+        return x - self.border, y - self.border
+
+    def get(self, x: int, y: int) -> str:
+        return chr(self.cells[self.index(x, y)])
+
+    def set(self, x: int, y: int, char: str) -> None:
+        self.cells[self.index(x, y)] = ord(char)
+
+    def indices(self) -> List[int]:
+        """Indices of all cells inside the border, row by row."""
+        first_row, end = self.index(0, 0), self.index(0, self.height)
+        return [
+            start + x
+            for start in range(first_row, end, self.stride)
+            for x in range(self.width)
+        ]
+
+    def find(self, char: str) -> int:
+        """Index of the first `char`; raises ValueError if there is none."""
+        return self.cells.index(ord(char))
+
+    def find_all(self, char: str) -> List[int]:
+        value = ord(char)
+        found = []
+        index = self.cells.find(value)
+        while index != -1:
+            found.append(index)
+            index = self.cells.find(value, index + 1)
+        return found
+
+    def count(self, char: str) -> int:
+        return self.cells.count(ord(char))
+
+    def lines(self, step: int) -> List[bytes]:
+        """Every cell sequence along `step`, e.g. 1 for rows or `stride` for columns.
+
+        Consecutive lines are separated by BORDER bytes, so substring counts
+        never match across an edge.
+        """
+        return [bytes(self.cells[start::step]) for start in range(abs(step))]
+
+    def row(self, y: int) -> str:
+        start = self.index(0, y)
+        return self.cells[start : start + self.width].decode()
+
+    def rows(self) -> List[str]:
+        return [self.row(y) for y in range(self.height)]
+
+    def copy(self) -> "Grid":
+        grid = Grid.__new__(Grid)
+        for name in Grid.__slots__:
+            setattr(grid, name, getattr(self, name))
+        grid.cells = bytearray(self.cells)
+        return grid
+
+    def __str__(self):
+        return "\n".join(self.rows())
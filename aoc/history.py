@@ -0,0 +1,188 @@
+import json
+import platform
+import subprocess
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Set
+
+from .bench import Timing
+
+HISTORY_FILE = ".aoc_history.jsonl"
+# Settings that change what a median means; runs differing in them are not
+# compared. The repeat count only changes how many samples there are.
+COMPARED_SETTINGS = ("scale", "seed", "warmup", "budget", "parse_cache")
+
+Run = Dict[str, Any]
+
+
+@dataclass
+class Change:
+    day: str
+    metric: str
+    baseline_ms: float
+    current_ms: float
+
+    @property
+    def change_percent(self) -> float:
+        return (self.current_ms - self.baseline_ms) * 100 / self.baseline_ms
+
+    @property
+    def is_regression(self) -> bool:
+        return self.current_ms > self.baseline_ms
+
+    def __str__(self):
+        label = "REGRESSION" if self.is_regression else "improvement"
+        return (
+            f"{label}: {self.day} {self.metric} "
+            f"{self.baseline_ms:.3f} ms -> {self.current_ms:.3f} ms "
+            f"({self.change_percent:+.1f}%)"
+        )
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_metadata() -> Dict[str, Any]:
+    return {
+        # Microseconds, so runs started within the same second stay distinct.
+        "run_id": datetime.now(timezone.utc).isoformat(timespec="microseconds"),
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "host": platform.node(),
+    }
+
+
+def append_run(
+    timings: List[Timing],
+    settings: Optional[Dict[str, Any]] = None,
+    path: str = HISTORY_FILE,
+) -> Optional[Run]:
+    """Record the timings and the measurement settings they were taken with.
+
+    Timings replayed from the result cache were not measured in this run,
+    so they are left out of it; a run with nothing measured is not recorded
+    and None is returned.
+    """
+    measured = [timing.to_dict() for timing in timings if not timing.cached]
+    if not measured:
+        return None
+    run = run_metadata()
+    run["settings"] = settings or {}
+    run["timings"] = measured
+    with open(path, "a") as f:
+        f.write(json.dumps(run) + "\n")
+    return run
+
+
+def load_runs(path: str = HISTORY_FILE) -> List[Run]:
+    try:
+        with open(path) as f:
+            return [json.loads(line) for line in f if line.strip()]
+    except FileNotFoundError:
+        return []
+
+
+def measured_days(run: Run) -> Set[str]:
+    """Days the run has a successful timing for."""
+    return {timing["day"] for timing in run["timings"] if timing["error"] is None}
+
+
+def find_run(runs: List[Run], ref: str) -> Run:
+    """Find a run by "latest", "previous", run id or commit prefix.
+
+    "latest" and "previous" skip runs without a successful timing.
+    """
+    if ref in ("latest", "previous"):
+        runs = [run for run in runs if measured_days(run)]
+        if ref == "latest" and runs:
+            return runs[-1]
+        if ref == "previous" and len(runs) > 1:
+            return runs[-2]
+    for run in reversed(runs):
+        if run["run_id"] == ref or (run["commit"] or "").startswith(ref):
+            return run
+    raise ValueError(f"No recorded run matches {ref}")
+
+
+def matches(run: Run, settings: Dict[str, Any]) -> bool:
+    """Whether the run was measured with these settings; runs recorded before
+    settings were stored match none."""
+    recorded = run.get("settings")
+    return recorded is not None and all(
+        recorded.get(key) == value for key, value in settings.items()
+    )
+
+
+def comparable(baseline: Run, current: Run) -> bool:
+    settings = current.get("settings") or {}
+    return matches(baseline, {key: settings.get(key) for key in COMPARED_SETTINGS})
+
+
+def latest_medians(
+    runs: List[Run], settings: Optional[Dict[str, Any]] = None
+) -> Dict[str, float]:
+    """Each day's most recent median, from runs `matches`ing `settings` if given."""
+    medians = {}
+    for run in runs:
+        if settings is not None and not matches(run, settings):
+            continue
+        for timing in run["timings"]:
+            if timing["error"] is None:
+                medians[timing["day"]] = timing["median_ms"]
+    return medians
+
+
+def _metrics(timing: Dict[str, Any]) -> Dict[str, float]:
+    metrics = {"total": timing["median_ms"]}
+    metrics.update(timing.get("phases", {}))
+    return metrics
+
+
+def compare_runs(
+    baseline: Run, current: Run, threshold_percent: float, min_delta_ms: float = 0.0
+) -> List[Change]:
+    """Days and phases whose median moved more than the threshold.
+
+    Changes smaller than `min_delta_ms` are ignored so sub-millisecond days do
+    not get flagged for jitter. Runs measured with different settings, e.g.
+    on inputs of another scale, or without a day measured in both raise
+    ValueError.
+    """
+    if not comparable(baseline, current):
+        raise ValueError(
+            f"Run {baseline['run_id']} was measured with different settings "
+            f"({baseline.get('settings')}) than run {current['run_id']} "
+            f"({current.get('settings')})"
+        )
+    if not measured_days(baseline) & measured_days(current):
+        raise ValueError(
+            f"Runs {baseline['run_id']} and {current['run_id']} have no day "
+            "measured in both"
+        )
+    baseline_timings = {
+        timing["day"]: timing
+        for timing in baseline["timings"]
+        if timing["error"] is None
+    }
+    changes = []
+    for timing in current["timings"]:
+        if timing["error"] is not None or timing["day"] not in baseline_timings:
+            continue
+        baseline_metrics = _metrics(baseline_timings[timing["day"]])
+        for metric, current_ms in _metrics(timing).items():
+            baseline_ms = baseline_metrics.get(metric)
+            if not baseline_ms:
+                continue
+            change = Change(timing["day"], metric, baseline_ms, current_ms)
+            if (
+                abs(change.change_percent) > threshold_percent
+                and abs(current_ms - baseline_ms) >= min_delta_ms
+            ):
+                changes.append(change)
+    return changes
@@ -0,0 +1,91 @@
+import subprocess
+import sys
+from dataclasses import dataclass
+from typing import List, Optional
+
+from .days import module_name
+
+IMPORT_TIME_PREFIX = "import time:"
+
+
+@dataclass
+class ImportTime:
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+@dataclass
+class DayImportCost:
+    day: str
+    cumulative_us: int
+    imports: List[ImportTime]
+    error: Optional[str] = None
+
+    def heaviest(self, top: int) -> List[ImportTime]:
+        return sorted(self.imports, key=lambda entry: -entry.self_us)[:top]
+
+
+def parse_importtime(output: str) -> List[ImportTime]:
+    """Parse `python -X importtime` lines, in the order the imports finished."""
+    entries = []
+    for line in output.splitlines():
+        if not line.startswith(IMPORT_TIME_PREFIX):
+            continue
+        self_us, cumulative_us, name = line[len(IMPORT_TIME_PREFIX) :].split("|")
+        if not self_us.strip().isdigit():
+            continue
+        depth = (len(name) - len(name.lstrip(" ")) - 1) // 2
+        entries.append(
+            ImportTime(name.strip(), int(self_us), int(cumulative_us), depth)
+        )
+    return entries
+
+
+def subtree(entries: List[ImportTime], module: str) -> List[ImportTime]:
+    """The entry for `module` and everything it imported that was not loaded yet.
+
+    Children are printed before their parent with a greater depth.
+    """
+    for index in range(len(entries) - 1, -1, -1):
+        if entries[index].module == module:
+            root = entries[index]
+            start = index
+            while start > 0 and entries[start - 1].depth > root.depth:
+                start -= 1
+            return entries[start : index + 1]
+    return []
+
+
+def day_import_cost(day: str) -> DayImportCost:
+    """Import a day module in a fresh interpreter with `-X importtime`.
+
+    `importlib.import_module` bypasses the import timer, so the child uses
+    `__import__` instead.
+    """
+    module = module_name(day)
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"__import__({module!r})"],
+        capture_output=True,
+        text=True,
+    )
+    entries = subtree(parse_importtime(completed.stderr), module)
+    if completed.returncode != 0 or not entries:
+        error = completed.stderr.strip().splitlines()[-1:] or ["import failed"]
+        return DayImportCost(day, 0, entries, error[0])
+    return DayImportCost(day, entries[-1].cumulative_us, entries)
+
+
+def import_report(costs: List[DayImportCost], top: int = 3) -> str:
+    rows = [f"{'day':<10} {'import ms':>10}  heaviest imports (self ms)"]
+    for cost in sorted(costs, key=lambda cost: -cost.cumulative_us):
+        if cost.error:
+            rows.append(f"{cost.day:<10} {'error':>10}  {cost.error}")
+            continue
+        heaviest = ", ".join(
+            f"{entry.module} {entry.self_us / 1000:.2f}"
+            for entry in cost.heaviest(top)
+        )
+        rows.append(f"{cost.day:<10} {cost.cumulative_us / 1000:>10.2f}  {heaviest}")
+    return "\n".join(rows)
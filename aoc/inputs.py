@@ -0,0 +1,154 @@
+import mmap
+import os
+import re
+from typing import Iterator, List, Optional, Sequence, Tuple, Union
+
+from .grid import Grid
+
+# How much of the mapping `lines()` copies out and splits at a time.
+CHUNK_BYTES = 1 << 20
+
+
+INTEGER = re.compile(rb"-?\d+")
+BLANK_LINE = re.compile(rb"\r?\n\r?\n")
+# Maps every byte that cannot be part of an integer to a space, keeping newlines.
+_NON_NUMERIC = bytes(
+    byte if byte in b"-0123456789\n" else ord(" ") for byte in range(256)
+)
+
+
+def _numeric_lines(buffer: bytes) -> Iterator[bytes]:
+    """Runs of whole lines with every non-numeric byte blanked out.
+
+    Translates a chunk at a time, cut after its last newline, so a mapped
+    file is never copied whole. Translating is idempotent, so the carried
+    over, already translated, unfinished line is simply translated again.
+    """
+    carry = b""
+    for start in range(0, len(buffer), CHUNK_BYTES):
+        chunk = (carry + buffer[start : start + CHUNK_BYTES]).translate(_NON_NUMERIC)
+        cut = chunk.rfind(b"\n")
+        if cut < 0:
+            carry = chunk
+            continue
+        carry = chunk[cut + 1 :]
+        yield chunk[:cut]
+    if carry:
+        yield carry
+
+
+def integers(buffer: bytes) -> List[int]:
+    """Every signed integer in `buffer`, in order, e.g. -3 and 4 in b"v=-3,4".
+
+    Blanking out everything else and splitting runs in C, about twice as
+    fast as the equivalent `INTEGER.findall`. That regex is still the
+    fallback for a "-" that is not a sign, as in b"a - b". Like the regex,
+    a "-" between digits is read as a sign: b"1-2" holds 1 and -2.
+    """
+    values: List[int] = []
+    try:
+        for words in _numeric_lines(buffer):
+            values.extend(map(int, words.split()))
+    except ValueError:
+        return list(map(int, INTEGER.findall(buffer)))
+    return values
+
+
+def records(values: Sequence[int], width: int) -> List[Tuple[int, ...]]:
+    """`values` as consecutive tuples of `width` values."""
+    if len(values) % width:
+        raise ValueError(f"{len(values)} values do not split into records of {width}")
+    return list(zip(*[iter(values)] * width))
+
+
+def _strip_returns(rows: List[bytes]) -> List[bytes]:
+    if rows and rows[0].endswith(b"\r"):
+        return [row.rstrip(b"\r") for row in rows]
+    return rows
+
+
+class InputFile:
+    """An input file mapped into memory, read through lazy views.
+
+    `lines()` and `blocks()` copy records out of the mapping as they are
+    consumed, so a large input is never held whole in a list of strings.
+    Use it as a context manager; records already produced stay valid after
+    closing.
+    """
+
+    def __init__(self, input_file_path: str):
+        self._file = open(input_file_path, "rb")
+        self.buffer: Union[mmap.mmap, bytes] = b""
+        try:
+            # Empty files cannot be mapped.
+            if os.fstat(self._file.fileno()).st_size:
+                fileno = self._file.fileno()
+                self.buffer = mmap.mmap(fileno, 0, access=mmap.ACCESS_READ)
+        except BaseException:
+            self._file.close()
+            raise
+
+    def __enter__(self) -> "InputFile":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if isinstance(self.buffer, mmap.mmap):
+            self.buffer.close()
+        self._file.close()
+
+    def __len__(self) -> int:
+        return len(self.buffer)
+
+    def lines(self) -> Iterator[bytes]:
+        """Every line without its line ending; a final newline adds no line."""
+        buffer = self.buffer
+        carry = b""
+        # Split a chunk at a time, in C, carrying its unfinished last line over.
+        for start in range(0, len(buffer), CHUNK_BYTES):
+            rows = (carry + buffer[start : start + CHUNK_BYTES]).split(b"\n")
+            carry = rows.pop()
+            yield from _strip_returns(rows)
+        if carry:
+            yield from _strip_returns([carry])
+
+    def integers(
+        self, width: Optional[int] = None
+    ) -> Union[List[int], List[Tuple[int, ...]]]:
+        """All integers in the file, as `records` of `width` if given."""
+        values = integers(self.buffer)
+        return values if width is None else records(values, width)
+
+    def integer_rows(self) -> List[List[int]]:
+        """The integers on each line, for lines holding varying numbers of them."""
+        try:
+            return [
+                list(map(int, row.split()))
+                for words in _numeric_lines(self.buffer)
+                for row in words.split(b"\n")
+            ]
+        except ValueError:
+            return [integers(line) for line in self.lines()]
+
+    def blocks(self) -> Iterator[bytes]:
+        """Blank-line separated blocks, without the newlines around them.
+
+        Lines inside a block end in `\n`, also when the file uses CRLF.
+        """
+        buffer = self.buffer
+        bounds = [0]
+        for separator in BLANK_LINE.finditer(buffer):
+            bounds += [separator.start(), separator.end()]
+        bounds.append(len(buffer))
+        for start, stop in zip(bounds[::2], bounds[1::2]):
+            block = buffer[start:stop].replace(b"\r\n", b"\n").strip(b"\r\n")
+            if block:
+                yield block
+
+    def grid(self, border: int = 1) -> Grid:
+        return Grid.from_rows([line for line in self.lines() if line], border)
+
+    def text(self) -> str:
+        return self.buffer[:].decode()
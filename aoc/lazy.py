@@ -0,0 +1,34 @@
+import importlib.util
+import sys
+from types import ModuleType
+
+
+class MissingModule(ModuleType):
+    """Stand-in for an optional dependency that is not installed.
+
+    Importing succeeds so the rest of a day still runs; touching the module
+    raises the usual `ModuleNotFoundError`.
+    """
+
+    def __getattr__(self, attribute: str):
+        raise ModuleNotFoundError(
+            f"No module named '{self.__name__}'", name=self.__name__
+        )
+
+
+def lazy_import(name: str) -> ModuleType:
+    """Return `name` as a module that is only executed on first attribute access.
+
+    Use it for heavy or optional dependencies, e.g. `pygame = lazy_import("pygame")`.
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        return MissingModule(name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
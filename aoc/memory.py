@@ -0,0 +1,112 @@
+import os
+import tracemalloc
+from typing import Any, Dict, List, Optional, Tuple
+
+from .days import Solver
+from .phases import add_listener, remove_listener
+
+KIB = 1024
+
+MemoryReport = Dict[str, Any]
+Snapshot = tracemalloc.Snapshot
+
+
+def _filtered(snapshot: tracemalloc.Snapshot) -> tracemalloc.Snapshot:
+    return snapshot.filter_traces(
+        [
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+        ]
+    )
+
+
+def _site(traceback: tracemalloc.Traceback) -> str:
+    return f"{os.path.relpath(traceback[0].filename)}:{traceback[0].lineno}"
+
+
+def top_sites(
+    snapshot: tracemalloc.Snapshot,
+    top: int,
+    since: Optional[tracemalloc.Snapshot] = None,
+) -> List[Dict[str, Any]]:
+    """Largest live allocation sites, or the ones that grew most `since`."""
+    if since is None:
+        return [
+            {"site": _site(stat.traceback), "kib": stat.size / KIB, "count": stat.count}
+            for stat in _filtered(snapshot).statistics("lineno")[:top]
+        ]
+    return [
+        {
+            "site": _site(stat.traceback),
+            "kib": stat.size_diff / KIB,
+            "count": stat.count_diff,
+        }
+        for stat in _filtered(snapshot).compare_to(_filtered(since), "lineno")[:top]
+        if stat.size_diff > 0
+    ]
+
+
+class PhaseMemoryTracker:
+    """Phase listener recording peak and net traced memory of every phase.
+
+    A snapshot is taken at the end of each phase, while the solver's locals
+    built in that phase are still alive, and compared to the one of the phase
+    before. Sites are resolved after tracing stops so that the filtering does
+    not show up in the traces.
+    """
+
+    def __init__(self):
+        self.peak = 0
+        self.phases: Dict[str, MemoryReport] = {}
+        self.snapshots: Dict[str, Tuple[Snapshot, Optional[Snapshot]]] = {}
+        self._last_snapshot: Optional[tracemalloc.Snapshot] = None
+        self.largest_snapshot: Optional[tracemalloc.Snapshot] = None
+        self._largest_size = 0
+        self._phase_start: Dict[str, int] = {}
+
+    def enter(self, name: str) -> None:
+        current, peak = tracemalloc.get_traced_memory()
+        self.peak = max(self.peak, peak)
+        tracemalloc.reset_peak()
+        self._phase_start[name] = current
+
+    def exit(self, name: str) -> None:
+        current, peak = tracemalloc.get_traced_memory()
+        self.peak = max(self.peak, peak)
+        start = self._phase_start.pop(name)
+        snapshot = tracemalloc.take_snapshot()
+        self.snapshots[name] = (snapshot, self._last_snapshot)
+        self._last_snapshot = snapshot
+        if current > self._largest_size:
+            self._largest_size = current
+            self.largest_snapshot = snapshot
+
+        report = self.phases.setdefault(name, {"peak_kib": 0.0, "net_kib": 0.0})
+        report["peak_kib"] = max(report["peak_kib"], (peak - start) / KIB)
+        report["net_kib"] += (current - start) / KIB
+
+
+def trace_solver(solver: Solver, input_file_path: str, top: int = 5) -> MemoryReport:
+    """Run the solver once under tracemalloc and report its memory use."""
+    tracker = PhaseMemoryTracker()
+    add_listener(tracker)
+    tracemalloc.start()
+    try:
+        baseline, _ = tracemalloc.get_traced_memory()
+        solver(input_file_path)
+        current, peak = tracemalloc.get_traced_memory()
+        if tracker.largest_snapshot is None:
+            tracker.largest_snapshot = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+        remove_listener(tracker)
+
+    for name, (snapshot, previous) in tracker.snapshots.items():
+        tracker.phases[name]["top_sites"] = top_sites(snapshot, top, previous)
+    return {
+        "peak_kib": (max(peak, tracker.peak) - baseline) / KIB,
+        "net_kib": (current - baseline) / KIB,
+        "top_sites": top_sites(tracker.largest_snapshot, top),
+        "phases": tracker.phases,
+    }
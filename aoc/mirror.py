@@ -0,0 +1,121 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from typing import Any, Dict, Optional
+
+MIRROR_ENV = "AOC_INPUT_MIRROR"
+DEFAULT_MIRROR_DIR = os.path.join("~", ".cache", "aoc", "inputs")
+
+Entry = Dict[str, Any]
+
+
+def default_mirror_dir() -> str:
+    return os.path.expanduser(os.getenv(MIRROR_ENV) or DEFAULT_MIRROR_DIR)
+
+
+def _replace_atomically(path: str, write) -> None:
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+    os.close(fd)
+    try:
+        write(temp_path)
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.lexists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+class InputMirror:
+    """Content-addressed store of puzzle inputs shared by every checkout.
+
+    Each input is kept once under `objects/<sha256>`; `index.json` maps a date
+    such as "2024-01" to its hash and the HTTP validators (ETag and
+    Last-Modified) needed to revalidate it with a conditional GET.
+    """
+
+    def __init__(self, directory: Optional[str] = None):
+        self.directory = directory or default_mirror_dir()
+        self.index_path = os.path.join(self.directory, "index.json")
+        self._lock = threading.Lock()
+
+    def object_path(self, digest: str) -> str:
+        return os.path.join(self.directory, "objects", digest)
+
+    def _load_index(self) -> Dict[str, Entry]:
+        try:
+            with open(self.index_path) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+
+    def lookup(self, date: str) -> Optional[Entry]:
+        """The index entry for a date, if its object is present and intact."""
+        entry = self._load_index().get(date)
+        if entry is None or not self.verify(entry["sha256"]):
+            return None
+        return entry
+
+    def verify(self, digest: str) -> bool:
+        try:
+            with open(self.object_path(digest), "rb") as f:
+                return hashlib.sha256(f.read()).hexdigest() == digest
+        except FileNotFoundError:
+            return False
+
+    def store(
+        self,
+        date: str,
+        content: bytes,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> Entry:
+        digest = hashlib.sha256(content).hexdigest()
+        object_path = self.object_path(digest)
+        if not self.verify(digest):
+
+            def write(temp_path: str) -> None:
+                with open(temp_path, "wb") as f:
+                    f.write(content)
+                # Objects are shared through hardlinks, so guard them from edits.
+                os.chmod(temp_path, 0o444)
+
+            _replace_atomically(object_path, write)
+
+        entry = {"sha256": digest, "etag": etag, "last_modified": last_modified}
+        with self._lock:
+            index = self._load_index()
+            index[date] = entry
+
+            def write_index(temp_path: str) -> None:
+                with open(temp_path, "w") as f:
+                    json.dump(index, f, indent=2, sort_keys=True)
+
+            _replace_atomically(self.index_path, write_index)
+        return entry
+
+    def conditional_headers(self, entry: Optional[Entry]) -> Dict[str, str]:
+        headers = {}
+        if entry and entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry and entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def link(self, entry: Entry, target: str) -> None:
+        """Hardlink the object to `target`, or symlink across filesystems."""
+        source = self.object_path(entry["sha256"])
+        if os.path.exists(target) and os.path.samefile(source, target):
+            return
+
+        def make_link(temp_path: str) -> None:
+            os.remove(temp_path)
+            try:
+                os.link(source, temp_path)
+            except OSError:
+                os.symlink(os.path.abspath(source), temp_path)
+
+        _replace_atomically(target, make_link)
@@ -0,0 +1,69 @@
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional
+
+from .bench import Timing, measure_day
+from .budget import Budget, measure_day_within_budget
+from .engines import available_cpus
+from .history import latest_medians, load_runs
+
+
+def order_slowest_first(days: List[str], last_timings: Dict[str, float]) -> List[str]:
+    """Longest-processing-time-first; days without a record are assumed slow."""
+    return sorted(days, key=lambda day: -last_timings.get(day, float("inf")))
+
+
+def _pin_worker(cpus: multiprocessing.Queue) -> None:
+    cpu = cpus.get()
+    if hasattr(os, "sched_setaffinity"):
+        os.sched_setaffinity(0, {cpu})
+
+
+def run_parallel(
+    days: List[str],
+    repeat: int,
+    warmup: int,
+    jobs: Optional[int] = None,
+    memory: bool = False,
+    scale: Optional[float] = None,
+    seed: int = 0,
+    budgets: Optional[Dict[str, Budget]] = None,
+) -> List[Timing]:
+    """Measure days on a pool with one worker pinned per CPU.
+
+    Concurrency never exceeds the CPUs we may run on, so each day gets a core
+    to itself and its timings are not skewed by sharing it with another day.
+    With `budgets`, each worker measures its day in a child process held to
+    the day's budget; the child inherits the worker's CPU.
+    """
+    cpus = available_cpus()
+    jobs = min(jobs or len(cpus), len(cpus), len(days)) or 1
+    cpu_queue = multiprocessing.Queue()
+    for cpu in cpus[:jobs]:
+        cpu_queue.put(cpu)
+
+    last_timings = latest_medians(load_runs(), {"scale": scale, "seed": seed})
+    ordered = order_slowest_first(days, last_timings)
+    with ProcessPoolExecutor(
+        max_workers=jobs, initializer=_pin_worker, initargs=(cpu_queue,)
+    ) as pool:
+        futures = {}
+        for day in ordered:
+            if budgets is None:
+                futures[day] = pool.submit(
+                    measure_day, day, repeat, warmup, memory, scale, seed
+                )
+            else:
+                futures[day] = pool.submit(
+                    measure_day_within_budget,
+                    day,
+                    repeat,
+                    warmup,
+                    memory,
+                    scale,
+                    seed,
+                    budgets[day],
+                )
+        timings = {day: future.result() for day, future in futures.items()}
+    return [timings[day] for day in days]
@@ -0,0 +1,113 @@
+import functools
+import hashlib
+import inspect
+import os
+import pickle
+import tempfile
+from collections import OrderedDict
+from typing import Any, Callable, Optional
+
+PARSE_CACHE_DIR = os.path.join(".aoc_cache", "parsed")
+# Set to "1" to cache parses. Off by default, so tests and timed runs parse;
+# the daemon and batch runs, which parse many inputs, turn it on.
+PARSE_CACHE_ENV = "AOC_PARSE_CACHE"
+# Pickles kept in memory, least recently used dropped first, so long-running
+# processes such as the daemon do not grow with every input they see.
+MEMORY_ENTRIES = 32
+# What loading a truncated, corrupt or outdated pickle raises.
+UNPICKLING_ERRORS = (pickle.UnpicklingError, EOFError, AttributeError, ImportError)
+
+Parser = Callable[[str], Any]
+
+_memory: OrderedDict[str, bytes] = OrderedDict()
+
+
+def cache_enabled() -> bool:
+    return os.getenv(PARSE_CACHE_ENV, "0") == "1"
+
+
+def source_digest(parse: Parser) -> str:
+    """Hash of the file defining the parser, which usually also defines the
+    classes it returns, so any edit to it invalidates its cached parses."""
+    with open(inspect.getfile(inspect.unwrap(parse)), "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()[:16]
+
+
+def cache_key(parse: Parser, source: str, content: bytes) -> str:
+    """Input hash plus the parser's identity and `source_digest`.
+
+    The module name is part of the key because pickles made under `__main__`
+    (a day run as a script) cannot be loaded from the imported module.
+    """
+    digest = hashlib.sha256(content).hexdigest()
+    return f"{parse.__module__}.{parse.__qualname__}-{source}-{digest}"
+
+
+def _load(path: str) -> Optional[bytes]:
+    try:
+        with open(path, "rb") as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+
+
+def _remember(key: str, data: bytes) -> None:
+    _memory[key] = data
+    _memory.move_to_end(key)
+    while len(_memory) > MEMORY_ENTRIES:
+        _memory.popitem(last=False)
+
+
+def _forget(key: str, path: str) -> None:
+    _memory.pop(key, None)
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def _store(path: str, data: bytes) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".tmp-")
+    with os.fdopen(fd, "wb") as f:
+        f.write(data)
+    os.replace(temp_path, path)
+
+
+def cached_parse(directory: Optional[str] = None):
+    """Cache what `parse(input_file_path)` returns, pickled, in memory and on disk.
+
+    Only when `cache_enabled`. Every call returns a fresh unpickled copy, so
+    solvers may mutate it. Entries are keyed on the parser's source as it was
+    when imported; edits to other modules it depends on are not seen.
+    """
+
+    def decorate(parse: Parser) -> Parser:
+        source = source_digest(parse)
+
+        @functools.wraps(parse)
+        def wrapper(input_file_path: str):
+            if not cache_enabled():
+                return parse(input_file_path)
+            with open(input_file_path, "rb") as f:
+                key = cache_key(parse, source, f.read())
+            path = os.path.join(directory or PARSE_CACHE_DIR, f"{key}.pickle")
+
+            data = _memory.get(key) or _load(path)
+            if data is not None:
+                try:
+                    parsed = pickle.loads(data)
+                except UNPICKLING_ERRORS:
+                    _forget(key, path)
+                else:
+                    _remember(key, data)
+                    return parsed
+            parsed = parse(input_file_path)
+            data = pickle.dumps(parsed, protocol=pickle.HIGHEST_PROTOCOL)
+            _remember(key, data)
+            _store(path, data)
+            return parsed
+
+        return wrapper
+
+    return decorate
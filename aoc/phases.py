@@ -0,0 +1,48 @@
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List
+
+_phase_times_ns: Dict[str, int] = {}
+_listeners: List[Any] = []
+
+
+@contextmanager
+def phase(name: str) -> Iterator[None]:
+    """Time a section of a solver, e.g. `with phase("parse"):`.
+
+    Also usable as a decorator: `@phase("part_1")`. Re-entering a phase adds
+    to its total, so a phase can be split over several blocks.
+    """
+    for listener in _listeners:
+        listener.enter(name)
+    start = time.perf_counter_ns()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter_ns() - start
+        _phase_times_ns[name] = _phase_times_ns.get(name, 0) + elapsed
+        for listener in _listeners:
+            listener.exit(name)
+
+
+def add_listener(listener: Any) -> None:
+    """Call `listener.enter(name)`/`listener.exit(name)` around every phase.
+
+    Listeners run outside the timed section, so they do not skew phase times.
+    """
+    _listeners.append(listener)
+
+
+def remove_listener(listener: Any) -> None:
+    _listeners.remove(listener)
+
+
+def reset_phases() -> None:
+    _phase_times_ns.clear()
+
+
+def collect_phases() -> Dict[str, int]:
+    """Return the phase times recorded since the last reset and reset them."""
+    collected = dict(_phase_times_ns)
+    _phase_times_ns.clear()
+    return collected
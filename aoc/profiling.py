@@ -0,0 +1,99 @@
+import cProfile
+import io
+import os
+import pstats
+from collections import defaultdict
+from typing import Dict, List, Optional, Set, Tuple
+
+from .days import load_solver
+from .engines import tuned_day_args
+from .generators import workload
+
+PROFILE_DIR = "profiles"
+MIN_STACK_SECONDS = 1e-6
+
+Func = Tuple[str, int, str]
+
+
+def func_label(func: Func) -> str:
+    file_name, line, name = func
+    if file_name == "~":
+        return name.replace(";", ",")
+    return f"{name} ({os.path.basename(file_name)}:{line})".replace(";", ",")
+
+
+def collapsed_stacks(stats: pstats.Stats) -> Dict[str, int]:
+    """Fold the profile into `a;b;c microseconds` stacks for flamegraph tools.
+
+    cProfile only keeps caller/callee edges, so the time of a function is split
+    over its call paths in proportion to the cumulative time of each edge.
+    Recursive calls are folded into the outermost frame.
+    """
+    callees: Dict[Func, Dict[Func, tuple]] = defaultdict(dict)
+    roots: List[Func] = []
+    for func, (_, _, _, _, callers) in stats.stats.items():
+        if not callers:
+            roots.append(func)
+        for caller, edge in callers.items():
+            callees[caller][func] = edge
+
+    stacks: Dict[str, float] = defaultdict(float)
+
+    def walk(func: Func, path: List[str], on_path: Set[Func], share: float):
+        _, _, own_time, cumulative_time, _ = stats.stats[func]
+        if cumulative_time <= 0:
+            return
+        fraction = min(1.0, share / cumulative_time)
+        path = path + [func_label(func)]
+        stacks[";".join(path)] += own_time * fraction
+        for callee, (_, _, _, edge_cumulative) in callees[func].items():
+            callee_share = edge_cumulative * fraction
+            if callee in on_path or callee_share < MIN_STACK_SECONDS:
+                continue
+            walk(callee, path, on_path | {callee}, callee_share)
+
+    for root in roots:
+        walk(root, [], {root}, stats.stats[root][3])
+    return {
+        stack: round(seconds * 1_000_000)
+        for stack, seconds in stacks.items()
+        if round(seconds * 1_000_000) > 0
+    }
+
+
+def hot_function_table(stats: pstats.Stats, top: int) -> str:
+    stream = io.StringIO()
+    stats.stream = stream
+    stats.sort_stats(pstats.SortKey.TIME, pstats.SortKey.CUMULATIVE).print_stats(top)
+    return stream.getvalue()
+
+
+def profile_day(
+    day: str,
+    output_dir: str = PROFILE_DIR,
+    top: int = 25,
+    scale: Optional[float] = None,
+    seed: int = 0,
+) -> str:
+    """Run a day once under cProfile and write `.pstats`, `.collapsed` and `.txt`.
+
+    Returns the hot-function table.
+    """
+    input_file_path, day_args = workload(day, scale, seed)
+    solver = load_solver(day, tuned_day_args(day, input_file_path, day_args))
+    profiler = cProfile.Profile()
+    profiler.runcall(solver, input_file_path)
+
+    os.makedirs(output_dir, exist_ok=True)
+    base_path = os.path.join(output_dir, day)
+    profiler.dump_stats(f"{base_path}.pstats")
+
+    stats = pstats.Stats(profiler)
+    with open(f"{base_path}.collapsed", "w") as f:
+        for stack, microseconds in sorted(collapsed_stacks(stats).items()):
+            f.write(f"{stack} {microseconds}\n")
+
+    table = hot_function_table(stats, top)
+    with open(f"{base_path}.txt", "w") as f:
+        f.write(table)
+    return table
@@ -0,0 +1,124 @@
+import ast
+import hashlib
+import json
+import os
+import platform
+from typing import Any, Dict, List, Optional, Set
+
+from .bench import Timing
+from .days import input_path, script_path
+from .engines import load_profile
+
+RESULT_CACHE_DIR = os.path.join(".aoc_cache", "results")
+AOC_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Harness modules whose changes alter every result: day arguments, timing,
+# engine choice and the default budget limits.
+HARNESS_MODULES = ["days", "bench", "engines", "budget"]
+
+
+def _aoc_imports(path: str) -> Set[str]:
+    """Names of the `aoc` modules imported by the file at `path`."""
+    with open(path) as f:
+        tree = ast.parse(f.read(), path)
+    in_aoc = os.path.dirname(os.path.abspath(path)) == AOC_DIR
+    modules = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            modules.update(
+                alias.name.split(".")[1]
+                for alias in node.names
+                if alias.name.startswith("aoc.")
+            )
+        elif isinstance(node, ast.ImportFrom):
+            if node.level == 0:
+                package, _, module = (node.module or "").partition(".")
+            elif node.level == 1 and in_aoc:
+                package, module = "aoc", node.module or ""
+            else:
+                continue
+            if package != "aoc":
+                continue
+            if module:
+                modules.add(module.split(".")[0])
+            else:
+                modules.update(alias.name for alias in node.names)
+    return {
+        module
+        for module in modules
+        if os.path.isfile(os.path.join(AOC_DIR, f"{module}.py"))
+    }
+
+
+def source_files(day: str, generated: bool = False) -> List[str]:
+    """The day's own modules plus every `aoc` module they import, transitively."""
+    day_dir = os.path.dirname(os.path.abspath(script_path(day)))
+    files = [
+        os.path.join(day_dir, name)
+        for name in os.listdir(day_dir)
+        if name.endswith(".py") and not name.startswith("test_")
+    ]
+    pending = HARNESS_MODULES + (["generators"] if generated else [])
+    for path in files:
+        pending.extend(_aoc_imports(path))
+    seen: Set[str] = set()
+    while pending:
+        module = pending.pop()
+        if module in seen:
+            continue
+        seen.add(module)
+        path = os.path.join(AOC_DIR, f"{module}.py")
+        files.append(path)
+        pending.extend(_aoc_imports(path))
+    return sorted(files)
+
+
+def cache_key(day: str, settings: Dict[str, Any]) -> str:
+    """Hash of the day's sources, its input and the measurement settings.
+
+    A generated input (`settings["scale"]` set) is determined by the
+    generator source, the scale and the seed, so it is not read. The day's
+    entry in the autotune profile picks the engine that gets measured.
+    """
+    generated = settings.get("scale") is not None
+    digest = hashlib.sha256()
+    for path in source_files(day, generated):
+        digest.update(os.path.relpath(path, os.path.dirname(AOC_DIR)).encode())
+        with open(path, "rb") as f:
+            digest.update(hashlib.sha256(f.read()).digest())
+    if not generated:
+        with open(input_path(day), "rb") as f:
+            digest.update(hashlib.sha256(f.read()).digest())
+    context = {
+        **settings,
+        "day": day,
+        "tuning": load_profile().get(day),
+        "python": platform.python_version(),
+        "host": platform.node(),
+    }
+    digest.update(json.dumps(context, sort_keys=True).encode())
+    return digest.hexdigest()
+
+
+def _path(key: str, directory: Optional[str]) -> str:
+    return os.path.join(directory or RESULT_CACHE_DIR, f"{key}.json")
+
+
+def load_result(key: str, directory: Optional[str] = None) -> Optional[Timing]:
+    try:
+        with open(_path(key, directory)) as f:
+            timing = Timing(**json.load(f))
+    except (FileNotFoundError, json.JSONDecodeError, TypeError):
+        return None
+    timing.cached = True
+    return timing
+
+
+def store_result(key: str, timing: Timing, directory: Optional[str] = None) -> None:
+    """Remember a successful measurement; errors are always re-run."""
+    if timing.error is not None:
+        return
+    path = _path(key, directory)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        json.dump({**timing.to_dict(), "cached": False}, f)
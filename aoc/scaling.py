@@ -0,0 +1,133 @@
+import math
+import os
+import statistics
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Tuple
+
+from .bench import sample_solver
+from .days import load_solver
+from .engines import tuned_day_args
+from .generators import generate_input
+
+# Complexity classes fitted as t = c * f(n).
+COMPLEXITIES: Dict[str, Callable[[float], float]] = {
+    "n": lambda n: n,
+    "n log n": lambda n: n * math.log(n),
+    "n^2": lambda n: n * n,
+    "n^3": lambda n: n**3,
+}
+EXPONENTIAL = "exponential"
+DEFAULT_SCALING_SCALES = [0.125, 0.25, 0.5, 1.0]
+
+
+@dataclass
+class ScalingPoint:
+    """Median runtime at a scale; `size` is the scale times the scale-1 input bytes.
+
+    Generators grow the variable part of an input linearly with the scale,
+    while fixed parts (e.g. day 05's rules) would bend a raw byte count.
+    """
+
+    scale: float
+    size: int
+    median_ms: float
+
+
+@dataclass
+class Fit:
+    complexity: str
+    error: float
+    predict: Callable[[float], float]
+
+
+def _linear_regression(xs: List[float], ys: List[float]) -> Tuple[float, float]:
+    """Least squares `y = slope * x + intercept`."""
+    mean_x, mean_y = statistics.fmean(xs), statistics.fmean(ys)
+    variance = sum((x - mean_x) ** 2 for x in xs)
+    slope = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / variance
+    return slope, mean_y - slope * mean_x
+
+
+def _rms(values: List[float]) -> float:
+    return math.sqrt(statistics.fmean(value * value for value in values))
+
+
+def fit_complexities(points: List[ScalingPoint]) -> List[Fit]:
+    """Fit every complexity class in log space, best fit first.
+
+    The error is the RMS of the log residuals, i.e. the typical factor by
+    which the model misses a measurement.
+    """
+    sizes = [float(point.size) for point in points]
+    log_times = [math.log(point.median_ms) for point in points]
+    fits = []
+    for name, func in COMPLEXITIES.items():
+        log_f = [math.log(func(size)) for size in sizes]
+        log_c = statistics.fmean(t - f for t, f in zip(log_times, log_f))
+        residuals = [t - f - log_c for t, f in zip(log_times, log_f)]
+        fits.append(
+            Fit(name, _rms(residuals), lambda n, c=log_c, f=func: math.exp(c) * f(n))
+        )
+
+    slope, intercept = _linear_regression(sizes, log_times)
+    residuals = [t - (slope * n + intercept) for n, t in zip(sizes, log_times)]
+    fits.append(
+        Fit(
+            EXPONENTIAL,
+            _rms(residuals),
+            lambda n: math.exp(min(700.0, slope * n + intercept)),
+        )
+    )
+    return sorted(fits, key=lambda fit: fit.error)
+
+
+def power_law_exponent(points: List[ScalingPoint]) -> float:
+    """Exponent k of the best `t = c * n^k` fit."""
+    slope, _ = _linear_regression(
+        [math.log(point.size) for point in points],
+        [math.log(point.median_ms) for point in points],
+    )
+    return slope
+
+
+def measure_scaling(
+    day: str, scales: List[float], repeat: int, warmup: int, seed: int = 0
+) -> List[ScalingPoint]:
+    reference_path, _ = generate_input(day, 1.0, seed)
+    reference_size = os.path.getsize(reference_path)
+    points = []
+    for scale in scales:
+        input_file_path, day_args = generate_input(day, scale, seed)
+        # Each size is solved with the engine tuned for it.
+        solver = load_solver(day, tuned_day_args(day, input_file_path, day_args))
+        samples, _, _ = sample_solver(solver, input_file_path, repeat, warmup)
+        points.append(
+            ScalingPoint(
+                scale,
+                round(scale * reference_size),
+                statistics.median(samples) / 1_000_000,
+            )
+        )
+    return points
+
+
+def scaling_report(points: List[ScalingPoint], target_scale: float) -> str:
+    rows = [f"{'scale':>10} {'size':>12} {'median ms':>12}"]
+    rows += [
+        f"{point.scale:>10g} {point.size:>12} {point.median_ms:>12.3f}"
+        for point in points
+    ]
+    fits = fit_complexities(points)
+    rows.append("")
+    rows += [f"{fit.complexity:>10} log error {fit.error:.3f}" for fit in fits]
+
+    largest = max(points, key=lambda point: point.scale)
+    target_size = largest.size / largest.scale * target_scale
+    rows.append("")
+    rows.append(f"Best fit: {fits[0].complexity}")
+    rows.append(f"Power law exponent: {power_law_exponent(points):.2f}")
+    rows.append(
+        f"Projected at scale {target_scale:g} (size {target_size:.0f}): "
+        f"{fits[0].predict(target_size) / 1000:.3f} seconds"
+    )
+    return "\n".join(rows)
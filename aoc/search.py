@@ -0,0 +1,224 @@
+from collections import deque
+from dataclasses import dataclass
+from heapq import heapify, heappop, heappush
+from typing import Callable, Iterable, List, Optional, Set, Tuple
+
+from .grid import BORDER, Grid
+
+# Distance of nodes the search did not reach.
+UNREACHED = -1
+
+# Nodes are integers in `range(size)`, e.g. grid indices or `index * 4 + direction`.
+Neighbors = Callable[[int], Iterable[int]]
+WeightedNeighbors = Callable[[int], Iterable[Tuple[int, int]]]
+Heuristic = Callable[[int], int]
+
+
+@dataclass
+class SearchResult:
+    """Distances from the start nodes and, when requested, every predecessor
+    on a shortest path to each node."""
+
+    distances: List[int]
+    predecessors: Optional[List[List[int]]] = None
+
+    def distance(self, node: int) -> Optional[int]:
+        distance = self.distances[node]
+        return None if distance == UNREACHED else distance
+
+    def _require_predecessors(self) -> List[List[int]]:
+        if self.predecessors is None:
+            raise ValueError("search ran without predecessors")
+        return self.predecessors
+
+    def path(self, target: int) -> List[int]:
+        """One shortest path from a start node to `target`, both included."""
+        predecessors = self._require_predecessors()
+        if self.distances[target] == UNREACHED:
+            return []
+        path = [target]
+        while predecessors[path[-1]]:
+            path.append(predecessors[path[-1]][0])
+        return path[::-1]
+
+    def on_shortest_paths(self, targets: Iterable[int]) -> Set[int]:
+        """All nodes on any shortest path to any of `targets`."""
+        predecessors = self._require_predecessors()
+        seen = set(targets)
+        stack = list(seen)
+        while stack:
+            for predecessor in predecessors[stack.pop()]:
+                if predecessor not in seen:
+                    seen.add(predecessor)
+                    stack.append(predecessor)
+        return seen
+
+
+def _start(starts: Iterable[int], size: int, predecessors: bool):
+    distances = [UNREACHED] * size
+    starts = list(starts)
+    for start in starts:
+        distances[start] = 0
+    return starts, distances, [[] for _ in range(size)] if predecessors else None
+
+
+def bfs(
+    starts: Iterable[int],
+    neighbors: Neighbors,
+    size: int,
+    target: Optional[int] = None,
+    predecessors: bool = False,
+) -> SearchResult:
+    """Unweighted shortest paths, stopping once `target` is reached."""
+    frontier, distances, preds = _start(starts, size, predecessors)
+    depth = 0
+    while frontier and (target is None or distances[target] == UNREACHED):
+        depth += 1
+        next_frontier = []
+        for node in frontier:
+            for neighbor in neighbors(node):
+                if distances[neighbor] == UNREACHED:
+                    distances[neighbor] = depth
+                    next_frontier.append(neighbor)
+                    if preds is not None:
+                        preds[neighbor].append(node)
+                elif preds is not None and distances[neighbor] == depth:
+                    preds[neighbor].append(node)
+        frontier = next_frontier
+    return SearchResult(distances, preds)
+
+
+def grid_bfs(
+    grid: Grid,
+    starts: Iterable[int],
+    walls: str = "#",
+    target: Optional[int] = None,
+    predecessors: bool = False,
+) -> SearchResult:
+    """`bfs` over grid indices, walking the grid offsets inline.
+
+    Cells holding one of `walls`, and the border, are not entered.
+    """
+    cells, offsets = grid.cells, grid.offsets
+    blocked = bytearray(256)
+    blocked[BORDER] = 1
+    for wall in walls:
+        blocked[ord(wall)] = 1
+    frontier, distances, preds = _start(starts, len(cells), predecessors)
+    depth = 0
+    while frontier and (target is None or distances[target] == UNREACHED):
+        depth += 1
+        next_frontier = []
+        for node in frontier:
+            for offset in offsets:
+                neighbor = node + offset
+                if distances[neighbor] == UNREACHED:
+                    if not blocked[cells[neighbor]]:
+                        distances[neighbor] = depth
+                        next_frontier.append(neighbor)
+                        if preds is not None:
+                            preds[neighbor].append(node)
+                elif preds is not None and distances[neighbor] == depth:
+                    preds[neighbor].append(node)
+        frontier = next_frontier
+    return SearchResult(distances, preds)
+
+
+def zero_one_bfs(
+    starts: Iterable[int],
+    neighbors: WeightedNeighbors,
+    size: int,
+    target: Optional[int] = None,
+    predecessors: bool = False,
+) -> SearchResult:
+    """Shortest paths when every edge weighs 0 or 1, using a deque."""
+    starts, distances, preds = _start(starts, size, predecessors)
+    queue = deque((0, start) for start in starts)
+    while queue:
+        distance, node = queue.popleft()
+        if distance > distances[node]:
+            continue
+        if node == target:
+            break
+        for neighbor, weight in neighbors(node):
+            new_distance = distance + weight
+            old_distance = distances[neighbor]
+            if old_distance == UNREACHED or new_distance < old_distance:
+                distances[neighbor] = new_distance
+                if weight:
+                    queue.append((new_distance, neighbor))
+                else:
+                    queue.appendleft((new_distance, neighbor))
+                if preds is not None:
+                    preds[neighbor] = [node]
+            elif preds is not None and new_distance == old_distance:
+                preds[neighbor].append(node)
+    return SearchResult(distances, preds)
+
+
+def dijkstra(
+    starts: Iterable[int],
+    neighbors: WeightedNeighbors,
+    size: int,
+    target: Optional[int] = None,
+    predecessors: bool = False,
+) -> SearchResult:
+    """Shortest paths with non-negative integer weights.
+
+    With zero-weight edges, stopping at `target` may miss predecessors that
+    are as far away as the target itself.
+    """
+    starts, distances, preds = _start(starts, size, predecessors)
+    heap = [(0, start) for start in starts]
+    heapify(heap)
+    while heap:
+        distance, node = heappop(heap)
+        if distance > distances[node]:
+            continue
+        if node == target:
+            break
+        for neighbor, weight in neighbors(node):
+            new_distance = distance + weight
+            old_distance = distances[neighbor]
+            if old_distance == UNREACHED or new_distance < old_distance:
+                distances[neighbor] = new_distance
+                heappush(heap, (new_distance, neighbor))
+                if preds is not None:
+                    preds[neighbor] = [node]
+            elif preds is not None and new_distance == old_distance:
+                preds[neighbor].append(node)
+    return SearchResult(distances, preds)
+
+
+def a_star(
+    starts: Iterable[int],
+    neighbors: WeightedNeighbors,
+    size: int,
+    target: int,
+    heuristic: Heuristic,
+    predecessors: bool = False,
+) -> SearchResult:
+    """`dijkstra` towards `target`, ordered by distance plus a consistent
+    (never overestimating, monotone) heuristic."""
+    starts, distances, preds = _start(starts, size, predecessors)
+    heap = [(heuristic(start), 0, start) for start in starts]
+    heapify(heap)
+    while heap:
+        _, distance, node = heappop(heap)
+        if distance > distances[node]:
+            continue
+        if node == target:
+            break
+        for neighbor, weight in neighbors(node):
+            new_distance = distance + weight
+            old_distance = distances[neighbor]
+            if old_distance == UNREACHED or new_distance < old_distance:
+                distances[neighbor] = new_distance
+                heappush(
+                    heap, (new_distance + heuristic(neighbor), new_distance, neighbor)
+                )
+                if preds is not None:
+                    preds[neighbor] = [node]
+            elif preds is not None and new_distance == old_distance:
+                preds[neighbor].append(node)
+    return SearchResult(distances, preds)
@@ -0,0 +1,78 @@
+import math
+import os
+import tempfile
+import unittest
+
+from .autotune import PRUNE_FACTOR, crossovers, prune
+from .engines import (
+    choose_engine,
+    engine_for,
+    input_statistic,
+    load_profile,
+    machine,
+    save_profile,
+    tuned_day_args,
+)
+
+
+class TestAutotune(unittest.TestCase):
+    def test_crossovers_between_measured_sizes(self):
+        points = [(10_000, "pool"), (100, "serial"), (1_000, "serial")]
+        table = crossovers(points)
+        # The switch happens between 1000 and 10000 lines: at their geometric mean.
+        self.assertEqual(table, [(0, "serial"), (math.sqrt(10_000_000), "pool")])
+        self.assertEqual(engine_for(table, 50), "serial")
+        self.assertEqual(engine_for(table, 3_000), "serial")
+        self.assertEqual(engine_for(table, 4_000), "pool")
+
+    def test_prune_keeps_parallel_and_improving_engines(self):
+        slow = PRUNE_FACTOR * 2
+        medians = {"serial": 1.0, "pool": slow, "dfs": slow}
+        # A trend needs two sizes, so nothing is dropped after the first.
+        kept, ratios = prune(medians, {}, parallel=("pool",))
+        self.assertEqual(kept, ["serial", "pool", "dfs"])
+
+        medians = {"serial": 1.0, "pool": slow * 2, "dfs": slow, "bfs": slow * 2}
+        kept, _ = prune(medians, {**ratios, "bfs": slow}, parallel=("pool",))
+        # dfs is not catching up and bfs is falling behind; pool is parallel.
+        self.assertEqual(kept, ["serial", "pool"])
+
+        kept, _ = prune({"serial": 1.0, "dfs": slow}, {"dfs": slow * 2})
+        self.assertEqual(kept, ["serial", "dfs"])
+
+    def test_statistics_and_choice(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "input.txt")
+            with open(path, "w") as f:
+                f.write("abc\ndef\nghi")
+            self.assertEqual(input_statistic(path, "bytes"), 11)
+            self.assertEqual(input_statistic(path, "lines"), 3)
+            self.assertEqual(input_statistic(path, "grid_area"), 9)
+
+            profile_path = os.path.join(directory, "autotune.json")
+            tuning = {"statistic": "lines", "crossovers": [[0, "serial"], [2, "pool"]]}
+            save_profile("2024_07", {**tuning, **machine()}, profile_path)
+            profile = load_profile(profile_path)
+            self.assertEqual(choose_engine("2024_07", path, profile), "pool")
+            self.assertIsNone(choose_engine("2024_08", path, profile))
+
+            # A tuning from another machine, or with other CPUs, does not apply.
+            other = {**tuning, **machine(), "cpus": machine()["cpus"] + 1}
+            self.assertIsNone(choose_engine("2024_07", path, {"2024_07": other}))
+
+    def test_tuned_day_args(self):
+        path = "2024_07/2024_07_test.txt"
+        tuning = {"statistic": "lines", "crossovers": [[0, "breadth_first_search"]]}
+        profile = {"2024_07": {**tuning, **machine()}}
+        self.assertEqual(
+            tuned_day_args("2024_07", path, {}, profile),
+            {"engine": "breadth_first_search"},
+        )
+        # An engine asked for, and days without engines, are left alone.
+        chosen = {"engine": "backtrace"}
+        self.assertEqual(tuned_day_args("2024_07", path, chosen, profile), chosen)
+        self.assertEqual(tuned_day_args("2024_01", path, {}, profile), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
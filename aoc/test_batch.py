@@ -0,0 +1,42 @@
+import os
+import tempfile
+import unittest
+
+from .batch import expand_inputs, run_batch
+
+
+class TestBatch(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        inputs = {"a.txt": "3   4\n1   3\n", "b.txt": "1   1\n", "c.in": ""}
+        for name, text in inputs.items():
+            with open(os.path.join(self.directory.name, name), "w") as f:
+                f.write(text)
+
+    def test_expand_directory_and_glob(self):
+        root = self.directory.name
+        self.assertEqual(
+            [os.path.basename(path) for path in expand_inputs(root)],
+            ["a.txt", "b.txt", "c.in"],
+        )
+        self.assertEqual(
+            [os.path.basename(path) for path in expand_inputs(f"{root}/*.txt")],
+            ["a.txt", "b.txt"],
+        )
+
+    def test_run_batch_reports_answers_and_errors(self):
+        inputs = expand_inputs(self.directory.name)
+        results = {
+            os.path.basename(result["input"]): result
+            for result in run_batch("2024_01", inputs, jobs=2)
+        }
+        self.assertEqual(results["a.txt"]["answers"], {"part_1": 3, "part_2": 3})
+        self.assertEqual(results["b.txt"]["answers"], {"part_1": 0, "part_2": 1})
+        self.assertIsNone(results["a.txt"]["error"])
+        self.assertIsNotNone(results["c.in"]["error"])
+        self.assertIsNone(results["c.in"]["answers"])
+
+
+if __name__ == "__main__":
+    unittest.main()
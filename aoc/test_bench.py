@@ -0,0 +1,23 @@
+import unittest
+
+from .bench import percentile, summarize
+
+
+class TestBench(unittest.TestCase):
+    def test_percentile(self):
+        samples = list(range(1, 101))
+        self.assertEqual(percentile(samples, 95), 95)
+        self.assertEqual(percentile(samples, 50), 50)
+        self.assertEqual(percentile([7], 95), 7)
+
+    def test_summarize(self):
+        timing = summarize("2024_01", [3_000_000, 1_000_000, 2_000_000])
+        self.assertEqual(timing.runs, 3)
+        self.assertEqual(timing.min_ms, 1.0)
+        self.assertEqual(timing.median_ms, 2.0)
+        self.assertEqual(timing.p95_ms, 3.0)
+        self.assertEqual(timing.stddev_ms, 1.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+import signal
+import unittest
+from unittest import mock
+
+from .bench import Timing
+from .budget import Budget, budget_for, measure_day_within_budget
+from .days import test_input_path
+
+
+def _ignore_sigxcpu_and_spin(*args):
+    signal.signal(signal.SIGXCPU, signal.SIG_IGN)
+    while True:
+        pass
+
+
+def _fail_to_map(day, *args):
+    error = "ImportError: libfoo.so: failed to map segment from shared object"
+    return Timing(day, 0, 0.0, 0.0, 0.0, 0.0, error=error)
+
+
+class TestBudget(unittest.TestCase):
+    def test_budget_for_merges_overrides(self):
+        self.assertEqual(budget_for("2024_01"), Budget())
+        self.assertEqual(budget_for("2024_22").wall_s, 120.0)
+        overrides = {"default": {"rss_mib": 512}, "2024_22": {"cpu_s": None}}
+        budget = budget_for("2024_22", overrides)
+        self.assertEqual(budget, Budget(wall_s=120.0, cpu_s=None, rss_mib=512))
+        # Overriding one field keeps the day's other allowances.
+        budget = budget_for("2024_22", {"2024_22": {"rss_mib": 512}})
+        self.assertEqual(budget, Budget(wall_s=120.0, cpu_s=120.0, rss_mib=512))
+
+    # Real inputs are not committed; the forked child sees the patch.
+    @mock.patch("aoc.generators.input_path", test_input_path)
+    def test_within_budget(self):
+        timing = measure_day_within_budget("2024_01", 2, 0)
+        self.assertIsNone(timing.error)
+        self.assertEqual(timing.runs, 2)
+        self.assertEqual(timing.answers, {"part_1": 11, "part_2": 31})
+
+    def test_over_wall_time_budget(self):
+        budget = Budget(wall_s=0.0, startup_s=0.0)
+        timing = measure_day_within_budget("2024_01", 2, 0, budget=budget)
+        self.assertTrue(timing.error.startswith("over budget: wall time"))
+        self.assertEqual(timing.runs, 0)
+
+    # Children are forked, so they see the patched measure_day.
+    @mock.patch("aoc.budget.measure_day", _ignore_sigxcpu_and_spin)
+    def test_killed_at_hard_cpu_limit_is_over_cpu_budget(self):
+        budget = Budget(wall_s=None, cpu_s=0.0, startup_s=1.0)
+        timing = measure_day_within_budget("2024_01", 1, 0, budget=budget)
+        self.assertTrue(timing.error.startswith("over budget: CPU time"))
+
+    @mock.patch("aoc.budget.measure_day", _fail_to_map)
+    def test_failed_mapping_is_over_memory_budget(self):
+        timing = measure_day_within_budget("2024_01", 1, 0)
+        self.assertTrue(timing.error.startswith("over budget: memory"))
+        unlimited = Budget(rss_mib=None)
+        timing = measure_day_within_budget("2024_01", 1, 0, budget=unlimited)
+        self.assertTrue(timing.error.startswith("ImportError"))
+
+
+if __name__ == "__main__":
+    unittest.main()
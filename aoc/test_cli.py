@@ -0,0 +1,54 @@
+import contextlib
+import io
+import json
+import unittest
+
+from .cli import main, parse_override, resolve_day, solver_arguments
+from .days import import_day
+
+DAYS = ["2024_01", "2024_07", "2024_10"]
+
+
+class TestCli(unittest.TestCase):
+    def test_resolve_day(self):
+        self.assertEqual(resolve_day("7", DAYS), "2024_07")
+        self.assertEqual(resolve_day("07", DAYS), "2024_07")
+        self.assertEqual(resolve_day("2024_10", DAYS), "2024_10")
+        with self.assertRaises(ValueError):
+            resolve_day("8", DAYS)
+
+    def test_parse_override(self):
+        self.assertEqual(parse_override("dim=[6,6]"), ("dim", [6, 6]))
+        self.assertEqual(parse_override("name=abc"), ("name", "abc"))
+
+    def test_solver_arguments(self):
+        day_07 = import_day("2024_07")
+        self.assertEqual(
+            solver_arguments("2024_07", day_07, {}, part=1, engine="backtrace"),
+            {"has_part_2": False, "engine": "backtrace"},
+        )
+        # Day 10 solves both parts together, so there is nothing to skip.
+        self.assertEqual(solver_arguments("2024_10", import_day("2024_10"), {}, 1), {})
+        with self.assertRaises(ValueError):
+            solver_arguments("2024_07", day_07, {}, engine="guessing")
+
+    def test_main_prints_selected_part(self):
+        stdout = io.StringIO()
+        with contextlib.redirect_stdout(stdout):
+            argv = ["7", "--test", "--part", "2", "--engine", "depth_first_search"]
+            self.assertEqual(main(argv + ["--json"]), 0)
+        result = json.loads(stdout.getvalue())
+        self.assertEqual(result["answers"], {"part_2": 11387})
+        self.assertIn("part_2", result["phases"])
+
+    def test_auto_engine_on_days_without_engines(self):
+        stdout = io.StringIO()
+        with contextlib.redirect_stdout(stdout):
+            self.assertEqual(main(["1", "--test", "--engine", "auto", "--json"]), 0)
+        result = json.loads(stdout.getvalue())
+        self.assertIsNone(result["engine"])
+        self.assertEqual(result["answers"], {"part_1": 11, "part_2": 31})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,39 @@
+import unittest
+
+from .coords import Coord, pack, unpack
+
+
+class TestCoords(unittest.TestCase):
+    def test_vector_maths(self):
+        coord, vector = Coord(2, 3), Coord(1, -2)
+        self.assertEqual(coord.add(vector), Coord(3, 1))
+        self.assertEqual(coord.add(vector, -2), Coord(0, 7))
+        self.assertEqual(coord - vector, Coord(1, 5))
+        self.assertTrue(coord.in_bounds(3, 4))
+        self.assertFalse(coord.add(vector, 2).in_bounds(5, 5))
+
+    def test_operators_are_vector_maths(self):
+        coord, vector = Coord(2, 3), Coord(1, -2)
+        self.assertEqual(coord + vector, Coord(3, 1))
+        self.assertEqual(coord - vector, Coord(1, 5))
+        self.assertEqual(coord + 2 * vector, coord.add(vector, 2))
+        self.assertEqual(vector * -2, Coord(-2, 4))
+        self.assertIsInstance(coord + vector, Coord)
+        with self.assertRaises(TypeError):
+            coord + (1, 2)
+        with self.assertRaises(TypeError):
+            (1, 2) + coord
+        with self.assertRaises(TypeError):
+            (1, 2) - coord
+        with self.assertRaises(TypeError):
+            coord * 1.5
+
+    def test_coords_are_plain_tuples(self):
+        self.assertEqual(Coord(1, 2), (1, 2))
+        self.assertEqual(hash(Coord(1, 2)), hash((1, 2)))
+        self.assertFalse(hasattr(Coord(1, 2), "__dict__"))
+
+    def test_pack(self):
+        self.assertEqual(pack(3, 2, 10), 23)
+        self.assertEqual(Coord(3, 2).pack(10), 23)
+        self.assertEqual(unpack(23, 10), Coord(3, 2))
@@ -0,0 +1,46 @@
+import threading
+import unittest
+
+from .daemon import SolverDaemon, call, make_server
+
+
+class TestDaemon(unittest.TestCase):
+    def setUp(self):
+        self.server = make_server(SolverDaemon(["2024_01"]), port=0)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_solve_inline_content_and_report_latency(self):
+        result = call(self.url, "/solve", {"day": "2024_01", "content": "3   4\n"})
+        self.assertEqual(result["answers"], {"part_1": 1, "part_2": 0})
+        self.assertIsNone(result["error"])
+        call(self.url, "/solve", {"day": "2024_01", "content": "1   1\n"})
+
+        latency = call(self.url, "/latency")
+        self.assertEqual(latency["2024_01"]["count"], 2)
+        self.assertGreaterEqual(latency["2024_01"]["overhead_median_ms"], 0)
+
+    def test_errors(self):
+        self.assertIn("error", call(self.url, "/solve", {"day": "2024_99"}))
+        result = call(self.url, "/solve", {"day": "2024_01", "content": "3\n"})
+        self.assertIsNone(result["answers"])
+        self.assertTrue(result["error"].startswith("ValueError"))
+        self.assertEqual(call(self.url, "/days"), ["2024_01"])
+
+    def test_badly_typed_requests(self):
+        for payload in (
+            {"day": "2024_01", "content": 5},
+            {"day": ["2024_01"]},
+            {"day": "2024_01", "day_args": []},
+            ["2024_01"],
+        ):
+            result = call(self.url, "/solve", payload)
+            self.assertTrue(result["error"].startswith("Bad solve request"), payload)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,41 @@
+import random
+import tempfile
+import unittest
+
+from .days import find_days, load_solver
+from .generators import GENERATORS, generate_input
+
+
+class TestGenerators(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+
+    def solve(self, day: str, scale: float = 0.05, seed: int = 0):
+        path, day_args = generate_input(day, scale, seed, self.directory)
+        return load_solver(day, day_args)(path)
+
+    def test_every_day_has_a_deterministic_generator(self):
+        self.assertEqual(sorted(GENERATORS), find_days("."))
+        for day, generate in GENERATORS.items():
+            first = generate(random.Random(day), 0.05)
+            second = generate(random.Random(day), 0.05)
+            self.assertEqual(first, second, day)
+
+    def test_generated_inputs_solve(self):
+        for day in ["2024_05", "2024_09", "2024_16", "2024_18", "2024_20", "2024_24"]:
+            result = self.solve(day)
+            self.assertIsNotNone(result["part_1"], day)
+
+    def test_generated_inputs_are_not_degenerate(self):
+        for seed in range(4):
+            result = self.solve("2024_18", 0.2, seed)
+            self.assertIsNotNone(result["part_1"], seed)
+            self.assertIsNotNone(result["part_2"], seed)
+            self.assertIsNotNone(self.solve("2024_17", 0.2, seed)["part_2"], seed)
+            self.assertGreater(self.solve("2024_06", 0.2, seed)["part_2"], 10, seed)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+import pickle
+import unittest
+
+from .grid import BORDER, DOWN, LEFT, RIGHT, UP, Grid
+
+
+class TestGrid(unittest.TestCase):
+    def setUp(self):
+        self.grid = Grid.from_lines(["#.S\n", "E.#\n"])
+
+    def test_index_round_trip(self):
+        index = self.grid.index(2, 0)
+        self.assertEqual(self.grid.coords(index), (2, 0))
+        self.assertEqual(self.grid.get(2, 0), "S")
+        self.assertEqual(self.grid.find("E"), self.grid.index(0, 1))
+
+    def test_border_is_sentinel(self):
+        cells, offsets = self.grid.cells, self.grid.offsets
+        top_left = self.grid.index(0, 0)
+        self.assertEqual(cells[top_left + offsets[UP]], BORDER)
+        self.assertEqual(cells[top_left + offsets[LEFT]], BORDER)
+        self.assertEqual(chr(cells[top_left + offsets[RIGHT]]), ".")
+        self.assertEqual(chr(cells[top_left + offsets[DOWN]]), "E")
+
+    def test_wide_border_does_not_wrap(self):
+        grid = Grid.from_lines(["ab", "cd"], border=3)
+        for x in range(-3, 5):
+            for y in range(-3, 5):
+                inside = 0 <= x < 2 and 0 <= y < 2
+                self.assertEqual(grid.cells[grid.index(x, y)] != BORDER, inside)
+
+    def test_find_count_and_rows(self):
+        self.assertEqual(self.grid.count("#"), 2)
+        self.assertEqual(
+            [self.grid.coords(index) for index in self.grid.find_all("#")],
+            [(0, 0), (2, 1)],
+        )
+        self.assertEqual(len(self.grid.indices()), 6)
+        self.assertEqual(str(self.grid), "#.S\nE.#")
+
+    def test_lines_are_separated_at_edges(self):
+        grid = Grid.from_lines(["XM", "AS"])
+        columns = b"|".join(grid.lines(grid.stride))
+        self.assertIn(b"XA", columns)
+        self.assertNotIn(b"MA", columns)
+        diagonals = grid.lines(grid.stride + 1)
+        self.assertEqual(sum(line.count(b"XS") for line in diagonals), 1)
+
+    def test_copy_and_pickle(self):
+        copy = self.grid.copy()
+        copy.set(1, 0, "#")
+        self.assertEqual(self.grid.get(1, 0), ".")
+        self.assertEqual(str(pickle.loads(pickle.dumps(self.grid))), str(self.grid))
+
+    def test_ragged_rows(self):
+        with self.assertRaises(ValueError):
+            Grid.from_lines(["ab", "c"])
+
+
+if __name__ == "__main__":
+    unittest.main()
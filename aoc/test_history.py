@@ -0,0 +1,116 @@
+import unittest
+
+import os
+import tempfile
+from unittest import mock
+
+from .bench import Timing
+from .history import (
+    append_run,
+    compare_runs,
+    find_run,
+    latest_medians,
+    load_runs,
+    run_metadata,
+)
+
+
+def make_run(run_id, commit, medians, scale=None):
+    return {
+        "run_id": run_id,
+        "commit": commit,
+        "settings": {"scale": scale, "seed": 0, "warmup": 1},
+        "timings": [
+            {"day": day, "median_ms": total, "error": None, "phases": phases}
+            for day, (total, phases) in medians.items()
+        ],
+    }
+
+
+class TestHistory(unittest.TestCase):
+    def setUp(self):
+        self.baseline = make_run(
+            "1", "abc123", {"2024_09": (100.0, {"part_1": 20.0, "part_2": 80.0})}
+        )
+        self.current = make_run(
+            "2", "def456", {"2024_09": (125.0, {"part_1": 20.0, "part_2": 105.0})}
+        )
+
+    def test_compare_flags_day_and_phase(self):
+        changes = compare_runs(self.baseline, self.current, 10.0)
+        self.assertEqual(
+            [(change.day, change.metric) for change in changes],
+            [("2024_09", "total"), ("2024_09", "part_2")],
+        )
+        self.assertTrue(all(change.is_regression for change in changes))
+
+    def test_compare_ignores_small_deltas(self):
+        self.assertEqual(compare_runs(self.baseline, self.current, 10.0, 30.0), [])
+
+    def test_runs_with_other_settings_are_not_compared(self):
+        scaled = make_run("3", "fed789", {"2024_09": (900.0, {})}, scale=10.0)
+        with self.assertRaises(ValueError):
+            compare_runs(self.baseline, scaled, 10.0)
+        legacy = dict(self.baseline)
+        del legacy["settings"]
+        with self.assertRaises(ValueError):
+            compare_runs(legacy, self.current, 10.0)
+
+        runs = [self.baseline, self.current, scaled]
+        self.assertEqual(latest_medians(runs, {"scale": None}), {"2024_09": 125.0})
+        self.assertEqual(latest_medians(runs, {"scale": 10.0}), {"2024_09": 900.0})
+
+    def test_append_run_records_settings(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "history.jsonl")
+            timing = Timing("2024_01", 3, 1.0, 1.0, 1.0, 0.0)
+            append_run([timing], {"scale": 2.0, "seed": 1}, path)
+            (run,) = load_runs(path)
+        self.assertEqual(run["settings"], {"scale": 2.0, "seed": 1})
+
+    def test_append_run_leaves_out_replayed_timings(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "history.jsonl")
+            measured = Timing("2024_01", 3, 1.0, 1.0, 1.0, 0.0)
+            replayed = Timing("2024_02", 3, 1.0, 1.0, 1.0, 0.0, cached=True)
+            append_run([measured, replayed], {}, path)
+            (run,) = load_runs(path)
+        self.assertEqual([timing["day"] for timing in run["timings"]], ["2024_01"])
+
+    def test_fully_replayed_run_is_not_recorded(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "history.jsonl")
+            replayed = Timing("2024_01", 3, 1.0, 1.0, 1.0, 0.0, cached=True)
+            self.assertIsNone(append_run([replayed], {}, path))
+            self.assertEqual(load_runs(path), [])
+
+    def test_runs_without_shared_days(self):
+        empty = make_run("3", "fed789", {})
+        runs = [self.baseline, self.current, empty]
+        self.assertIs(find_run(runs, "latest"), self.current)
+        self.assertIs(find_run(runs, "previous"), self.baseline)
+        other_day = make_run("4", "0a1b2c", {"2024_01": (1.0, {})})
+        with self.assertRaisesRegex(ValueError, "no day measured in both"):
+            compare_runs(self.baseline, other_day, 10.0)
+
+    def test_find_run(self):
+        runs = [self.baseline, self.current]
+        self.assertIs(find_run(runs, "latest"), self.current)
+        self.assertIs(find_run(runs, "previous"), self.baseline)
+        self.assertIs(find_run(runs, "abc"), self.baseline)
+        with self.assertRaises(ValueError):
+            find_run(runs, "missing")
+
+    def test_run_ids_have_sub_second_resolution(self):
+        with mock.patch("aoc.history.git_commit", return_value=None):
+            run_id = run_metadata()["run_id"]
+        # e.g. 2024-12-01T05:00:00.123456+00:00
+        self.assertRegex(run_id, r"T\d\d:\d\d:\d\d\.\d{6}\+")
+
+    def test_latest_medians(self):
+        runs = [self.baseline, self.current]
+        self.assertEqual(latest_medians(runs), {"2024_09": 125.0})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,39 @@
+import unittest
+
+from .imports import day_import_cost, parse_importtime, subtree
+
+OUTPUT = """\
+import time: self [us] | cumulative | imported package
+import time:      1659 |      43319 | site
+import time:       261 |        261 |   2024_21
+import time:       226 |        226 |     aoc
+import time:       837 |       1062 |   aoc.phases
+import time:     10728 |      12051 | 2024_21.aoc_2024_21
+"""
+
+
+class TestImports(unittest.TestCase):
+    def test_parse_importtime(self):
+        entries = parse_importtime(OUTPUT)
+        self.assertEqual([entry.module for entry in entries][:2], ["site", "2024_21"])
+        self.assertEqual([entry.depth for entry in entries], [0, 1, 2, 1, 0])
+        self.assertEqual(entries[-1].cumulative_us, 12051)
+
+    def test_subtree_excludes_interpreter_startup(self):
+        modules = [
+            entry.module
+            for entry in subtree(parse_importtime(OUTPUT), "2024_21.aoc_2024_21")
+        ]
+        self.assertEqual(
+            modules, ["2024_21", "aoc", "aoc.phases", "2024_21.aoc_2024_21"]
+        )
+
+    def test_day_import_cost(self):
+        cost = day_import_cost("2024_01")
+        self.assertIsNone(cost.error)
+        self.assertEqual(cost.imports[-1].module, "2024_01.aoc_2024_01")
+        self.assertGreater(cost.cumulative_us, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
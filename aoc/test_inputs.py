@@ -0,0 +1,89 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from . import inputs
+from .inputs import InputFile, integers, records
+
+
+class TestInputFile(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+
+    def write(self, content: bytes) -> str:
+        path = os.path.join(self.directory, "input.txt")
+        with open(path, "wb") as f:
+            f.write(content)
+        return path
+
+    def test_lines(self):
+        with InputFile(self.write(b"1 2\n\n3 4\n")) as data:
+            self.assertEqual(list(data.lines()), [b"1 2", b"", b"3 4"])
+        with InputFile(self.write(b"1 2\r\n3 4")) as data:
+            self.assertEqual(list(data.lines()), [b"1 2", b"3 4"])
+
+    def test_lines_across_chunks(self):
+        content = b"".join(b"%d\n" % i for i in range(1000))
+        with mock.patch.object(inputs, "CHUNK_BYTES", 7):
+            with InputFile(self.write(content)) as data:
+                self.assertEqual(list(data.lines()), content.splitlines())
+
+    def test_blocks(self):
+        with InputFile(self.write(b"a\nb\n\nc\n\n\nd\n")) as data:
+            self.assertEqual(list(data.blocks()), [b"a\nb", b"c", b"d"])
+        with InputFile(self.write(b"a\r\nb\r\n\r\nc\r\n\r\n\r\nd\r\n")) as data:
+            self.assertEqual(list(data.blocks()), [b"a\nb", b"c", b"d"])
+
+    def test_closes_the_file_when_mapping_fails(self):
+        path = self.write(b"1\n")
+        opened = []
+
+        def tracking_open(*args):
+            opened.append(open(*args))
+            return opened[-1]
+
+        with mock.patch.object(inputs, "open", tracking_open, create=True):
+            with mock.patch.object(inputs.mmap, "mmap", side_effect=OSError):
+                with self.assertRaises(OSError):
+                    InputFile(path)
+        self.assertTrue(opened[0].closed)
+
+    def test_grid_and_text(self):
+        with InputFile(self.write(b"ab\ncd\n")) as data:
+            grid = data.grid(border=0)
+            self.assertEqual(data.text(), "ab\ncd\n")
+        self.assertEqual((grid.width, grid.height), (2, 2))
+
+    def test_integers(self):
+        self.assertEqual(integers(b"p=0,4 v=-3,+2\n"), [0, 4, -3, 2])
+        self.assertEqual(integers(b"1-2 - 3"), [1, -2, 3])
+        self.assertEqual(records([1, 2, 3, 4], 2), [(1, 2), (3, 4)])
+        with self.assertRaises(ValueError):
+            records([1, 2, 3], 2)
+        machine = b"Button A: X+94, Y+34\nPrize: X=8400, Y=-5\n"
+        with InputFile(self.write(machine)) as data:
+            self.assertEqual(data.integers(2), [(94, 34), (8400, -5)])
+
+    def test_integer_rows(self):
+        with InputFile(self.write(b"190: 10 19\n\n-1 2 - 3\n")) as data:
+            self.assertEqual(data.integer_rows(), [[190, 10, 19], [], [-1, 2, 3]])
+
+    def test_integers_across_chunks(self):
+        rows = [[i, -i, i * 1000003] for i in range(200)]
+        content = b"".join(b"a=%d, b=%d: %d\n" % tuple(row) for row in rows)
+        with mock.patch.object(inputs, "CHUNK_BYTES", 7):
+            with InputFile(self.write(content)) as data:
+                self.assertEqual(data.integers(3), [tuple(row) for row in rows])
+                self.assertEqual(data.integer_rows(), rows)
+            # A number longer than a chunk is carried over whole.
+            self.assertEqual(integers(b"123456789012 1"), [123456789012, 1])
+
+    def test_empty_file(self):
+        with InputFile(self.write(b"")) as data:
+            self.assertEqual(len(data), 0)
+            self.assertEqual(list(data.lines()), [])
+            self.assertEqual(list(data.blocks()), [])
+            self.assertEqual(data.integer_rows(), [])
@@ -0,0 +1,22 @@
+import sys
+import unittest
+
+from .lazy import lazy_import
+
+
+class TestLazy(unittest.TestCase):
+    def test_module_runs_on_first_use(self):
+        sys.modules.pop("colorsys", None)
+        colorsys = lazy_import("colorsys")
+        # object.__getattribute__ peeks without triggering the lazy load.
+        self.assertNotIn("rgb_to_hsv", object.__getattribute__(colorsys, "__dict__"))
+        self.assertEqual(colorsys.rgb_to_hsv(1.0, 0.0, 0.0), (0.0, 1.0, 1.0))
+
+    def test_missing_module_fails_on_use(self):
+        missing = lazy_import("aoc_module_that_does_not_exist")
+        with self.assertRaises(ModuleNotFoundError):
+            missing.init()
+
+
+if __name__ == "__main__":
+    unittest.main()
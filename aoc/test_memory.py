@@ -0,0 +1,29 @@
+import unittest
+
+from .memory import trace_solver
+from .phases import phase
+
+
+def solver(input_file_path):
+    with phase("parse"):
+        data = [bytearray(1024) for _ in range(100)]
+    with phase("part_1"):
+        part_1 = len(data)
+    return {"part_1": part_1, "part_2": None}
+
+
+class TestMemory(unittest.TestCase):
+    def test_trace_solver(self):
+        report = trace_solver(solver, "unused.txt", top=3)
+        self.assertGreater(report["peak_kib"], 100)
+        self.assertEqual(sorted(report["phases"]), ["parse", "part_1"])
+        self.assertGreater(report["phases"]["parse"]["net_kib"], 100)
+        self.assertLess(report["phases"]["part_1"]["peak_kib"], 10)
+        self.assertTrue(
+            report["top_sites"][0]["site"].endswith("test_memory.py:9"),
+            report["top_sites"],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,50 @@
+import os
+import tempfile
+import unittest
+
+from .mirror import InputMirror
+
+
+class TestMirror(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.mirror = InputMirror(os.path.join(self.directory.name, "mirror"))
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_identical_inputs_are_stored_once(self):
+        first = self.mirror.store("2024-01", b"1 2\n", etag='"a"')
+        second = self.mirror.store("2023-01", b"1 2\n")
+        self.assertEqual(first["sha256"], second["sha256"])
+        objects = os.listdir(os.path.join(self.mirror.directory, "objects"))
+        self.assertEqual(objects, [first["sha256"]])
+        self.assertEqual(self.mirror.lookup("2024-01")["etag"], '"a"')
+        self.assertEqual(
+            self.mirror.conditional_headers(self.mirror.lookup("2024-01")),
+            {"If-None-Match": '"a"'},
+        )
+
+    def test_corrupted_object_is_not_used(self):
+        entry = self.mirror.store("2024-01", b"1 2\n")
+        path = self.mirror.object_path(entry["sha256"])
+        os.chmod(path, 0o644)
+        with open(path, "wb") as f:
+            f.write(b"tampered\n")
+        self.assertIsNone(self.mirror.lookup("2024-01"))
+
+    def test_link_replaces_existing_file(self):
+        entry = self.mirror.store("2024-01", b"1 2\n")
+        target = os.path.join(self.directory.name, "2024_01", "2024_01_input.txt")
+        os.makedirs(os.path.dirname(target))
+        with open(target, "w") as f:
+            f.write("old\n")
+        self.mirror.link(entry, target)
+        source = self.mirror.object_path(entry["sha256"])
+        self.assertTrue(os.path.samefile(target, source))
+        with open(target) as f:
+            self.assertEqual(f.read(), "1 2\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
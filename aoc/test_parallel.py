@@ -0,0 +1,17 @@
+import unittest
+
+from .parallel import order_slowest_first
+
+
+class TestParallel(unittest.TestCase):
+    def test_order_slowest_first(self):
+        last_timings = {"2024_01": 1.0, "2024_20": 50.0, "2024_21": 120.0}
+        days = ["2024_01", "2024_02", "2024_20", "2024_21"]
+        self.assertEqual(
+            order_slowest_first(days, last_timings),
+            ["2024_02", "2024_21", "2024_20", "2024_01"],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+import hashlib
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from . import parse_cache
+from .parse_cache import PARSE_CACHE_ENV, cached_parse
+
+
+class TestParseCache(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.input_path = os.path.join(self.directory.name, "input.txt")
+        self.write_input("1 2\n3 4\n")
+        self.calls = 0
+        parse_cache._memory.clear()
+        patcher = mock.patch.dict(os.environ, {PARSE_CACHE_ENV: "1"})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self.directory.cleanup()
+        parse_cache._memory.clear()
+
+    def write_input(self, text):
+        with open(self.input_path, "w") as f:
+            f.write(text)
+
+    def make_parser(self, source="v1"):
+        with mock.patch.object(parse_cache, "source_digest", return_value=source):
+            return self._make_parser()
+
+    def _make_parser(self):
+        @cached_parse(os.path.join(self.directory.name, "cache"))
+        def parse(input_file_path):
+            self.calls += 1
+            with open(input_file_path) as f:
+                return [list(map(int, line.split())) for line in f]
+
+        return parse
+
+    def test_second_parse_comes_from_cache(self):
+        parse = self.make_parser()
+        first = parse(self.input_path)
+        first[0][0] = 99
+        self.assertEqual(parse(self.input_path), [[1, 2], [3, 4]])
+        self.assertEqual(self.calls, 1)
+
+        parse_cache._memory.clear()
+        self.assertEqual(parse(self.input_path), [[1, 2], [3, 4]])
+        self.assertEqual(self.calls, 1)
+
+    def test_content_and_source_invalidate(self):
+        self.make_parser()(self.input_path)
+        self.write_input("5 6\n")
+        self.assertEqual(self.make_parser()(self.input_path), [[5, 6]])
+        self.make_parser(source="v2")(self.input_path)
+        self.assertEqual(self.calls, 3)
+
+    def test_source_digest_follows_the_parser_file(self):
+        with open(__file__, "rb") as f:
+            expected = hashlib.sha256(f.read()).hexdigest()[:16]
+        self.assertEqual(parse_cache.source_digest(self._make_parser()), expected)
+
+    def test_corrupt_pickle_is_reparsed_and_replaced(self):
+        parse = self.make_parser()
+        parse(self.input_path)
+        parse_cache._memory.clear()
+        cache = os.path.join(self.directory.name, "cache")
+        (name,) = os.listdir(cache)
+        with open(os.path.join(cache, name), "wb") as f:
+            f.write(b"\x80\x05truncated")
+        self.assertEqual(parse(self.input_path), [[1, 2], [3, 4]])
+        self.assertEqual(self.calls, 2)
+        parse_cache._memory.clear()
+        parse(self.input_path)
+        self.assertEqual(self.calls, 2)
+
+    def test_memory_is_bounded(self):
+        parse = self.make_parser()
+        with mock.patch.object(parse_cache, "MEMORY_ENTRIES", 2):
+            for value in range(3):
+                self.write_input(f"{value}\n")
+                parse(self.input_path)
+        self.assertEqual(len(parse_cache._memory), 2)
+
+    def test_disabled_by_default(self):
+        parse = self.make_parser()
+        with mock.patch.dict(os.environ):
+            del os.environ[PARSE_CACHE_ENV]
+            parse(self.input_path)
+            parse(self.input_path)
+        self.assertEqual(self.calls, 2)
+        self.assertFalse(os.path.exists(os.path.join(self.directory.name, "cache")))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,32 @@
+import unittest
+
+from .phases import collect_phases, phase, reset_phases
+
+
+class TestPhases(unittest.TestCase):
+    def test_phases_are_collected_and_reset(self):
+        reset_phases()
+        with phase("parse"):
+            pass
+        with phase("part_1"):
+            pass
+        with phase("part_1"):
+            pass
+        collected = collect_phases()
+        self.assertEqual(sorted(collected), ["parse", "part_1"])
+        self.assertTrue(all(elapsed >= 0 for elapsed in collected.values()))
+        self.assertEqual(collect_phases(), {})
+
+    def test_phase_as_decorator(self):
+        reset_phases()
+
+        @phase("part_2")
+        def solve():
+            return 42
+
+        self.assertEqual(solve(), 42)
+        self.assertIn("part_2", collect_phases())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,29 @@
+import cProfile
+import pstats
+import unittest
+
+from .profiling import collapsed_stacks
+
+
+def leaf(n):
+    return sum(range(n))
+
+
+def root():
+    return leaf(10_000) + leaf(20_000)
+
+
+class TestProfiling(unittest.TestCase):
+    def test_collapsed_stacks(self):
+        profiler = cProfile.Profile()
+        profiler.runcall(root)
+        stacks = collapsed_stacks(pstats.Stats(profiler))
+        leaf_stacks = [stack for stack in stacks if stack.endswith("sum>")]
+        self.assertEqual(len(leaf_stacks), 1)
+        self.assertTrue(leaf_stacks[0].startswith("root (test_profiling.py"))
+        self.assertIn(";leaf (test_profiling.py", leaf_stacks[0])
+        self.assertTrue(all(value > 0 for value in stacks.values()))
+
+
+if __name__ == "__main__":
+    unittest.main()
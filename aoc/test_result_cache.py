@@ -0,0 +1,67 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from .bench import Timing
+from .days import test_input_path
+from .result_cache import cache_key, load_result, source_files, store_result
+
+SETTINGS = {"repeat": 5, "warmup": 1, "memory": False, "scale": None, "seed": 0}
+
+
+class TestResultCache(unittest.TestCase):
+    def setUp(self):
+        # Real inputs are not committed; key on the committed test inputs.
+        patcher = mock.patch("aoc.result_cache.input_path", test_input_path)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_sources_follow_aoc_imports(self):
+        names = {
+            os.path.relpath(path, os.path.dirname(os.path.dirname(path)))
+            for path in source_files("2024_18")
+        }
+        self.assertIn(os.path.join("2024_18", "aoc_2024_18.py"), names)
+        self.assertIn(os.path.join("aoc", "search.py"), names)
+        # aoc.search imports aoc.grid.
+        self.assertIn(os.path.join("aoc", "grid.py"), names)
+        self.assertNotIn(os.path.join("2024_18", "test_2024_18.py"), names)
+
+    def test_key_depends_on_settings_and_day(self):
+        key = cache_key("2024_01", SETTINGS)
+        self.assertEqual(key, cache_key("2024_01", dict(SETTINGS)))
+        self.assertNotEqual(key, cache_key("2024_01", {**SETTINGS, "repeat": 3}))
+        self.assertNotEqual(key, cache_key("2024_02", SETTINGS))
+        self.assertNotEqual(
+            key, cache_key("2024_01", {**SETTINGS, "budget": {"2024_01": {}}})
+        )
+
+    def test_key_depends_on_tuning(self):
+        with mock.patch("aoc.result_cache.load_profile", return_value={}):
+            untuned = cache_key("2024_07", SETTINGS)
+        profile = {"2024_07": {"crossovers": [[0, "backtrace"]]}}
+        with mock.patch("aoc.result_cache.load_profile", return_value=profile):
+            tuned = cache_key("2024_07", SETTINGS)
+        self.assertNotEqual(untuned, tuned)
+
+    def test_sources_include_engines_and_budget(self):
+        names = {os.path.basename(path) for path in source_files("2024_01")}
+        self.assertTrue({"engines.py", "budget.py"} <= names)
+
+    def test_store_and_replay(self):
+        with tempfile.TemporaryDirectory() as directory:
+            timing = Timing("2024_01", 5, 1.0, 2.0, 3.0, 0.5, answers={"part_1": 11})
+            store_result("key", timing, directory)
+            replayed = load_result("key", directory)
+            self.assertTrue(replayed.cached)
+            self.assertEqual(replayed.answers, {"part_1": 11})
+            self.assertEqual(replayed.median_ms, 2.0)
+
+            failed = Timing("2024_02", 0, 0.0, 0.0, 0.0, 0.0, error="ValueError: x")
+            store_result("failed", failed, directory)
+            self.assertIsNone(load_result("failed", directory))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,33 @@
+import unittest
+
+from .scaling import ScalingPoint, fit_complexities, power_law_exponent, scaling_report
+
+
+def make_points(func):
+    return [
+        ScalingPoint(scale, int(scale * 1000), func(scale * 1000))
+        for scale in (0.25, 0.5, 1.0, 2.0, 4.0)
+    ]
+
+
+class TestScaling(unittest.TestCase):
+    def test_quadratic_fit(self):
+        points = make_points(lambda n: 1e-4 * n * n)
+        self.assertEqual(fit_complexities(points)[0].complexity, "n^2")
+        self.assertAlmostEqual(power_law_exponent(points), 2.0, places=3)
+
+    def test_linear_fit_predicts_target(self):
+        points = make_points(lambda n: 0.01 * n)
+        best = fit_complexities(points)[0]
+        self.assertEqual(best.complexity, "n")
+        self.assertAlmostEqual(best.predict(100_000), 1000.0, places=3)
+
+    def test_report_projects_target_scale(self):
+        report = scaling_report(make_points(lambda n: 0.01 * n), 100)
+        self.assertIn("Best fit: n\n", report)
+        self.assertIn("size 100000", report)
+        self.assertIn("1.000 seconds", report)
+
+
+if __name__ == "__main__":
+    unittest.main()
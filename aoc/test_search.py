@@ -0,0 +1,70 @@
+import unittest
+
+from .grid import Grid
+from .search import UNREACHED, a_star, bfs, dijkstra, grid_bfs, zero_one_bfs
+
+MAZE = [
+    "S..#",
+    ".#..",
+    "...E",
+]
+
+# 0 -> 1 -> 3 costs 2, 0 -> 2 -> 3 costs 2, 0 -> 3 costs 5; 4 is unreachable.
+EDGES = {0: [(1, 1), (2, 1), (3, 5)], 1: [(3, 1)], 2: [(3, 1)], 3: [], 4: [(0, 1)]}
+
+
+class TestSearch(unittest.TestCase):
+    def setUp(self):
+        self.grid = Grid.from_lines(MAZE)
+        self.start, self.end = self.grid.find("S"), self.grid.find("E")
+
+    def test_grid_bfs_distances_and_paths(self):
+        result = grid_bfs(self.grid, [self.start], predecessors=True)
+        self.assertEqual(result.distance(self.end), 5)
+        self.assertEqual(result.distance(self.grid.index(3, 0)), None)
+        path = result.path(self.end)
+        self.assertEqual((path[0], path[-1], len(path)), (self.start, self.end, 6))
+        # The three shortest routes together cover all 10 open cells.
+        self.assertEqual(len(result.on_shortest_paths([self.end])), 10)
+
+    def test_paths_need_predecessors(self):
+        result = grid_bfs(self.grid, [self.start])
+        with self.assertRaisesRegex(ValueError, "without predecessors"):
+            result.path(self.end)
+        with self.assertRaisesRegex(ValueError, "without predecessors"):
+            result.on_shortest_paths([self.end])
+
+    def test_grid_bfs_multi_source_and_target(self):
+        result = grid_bfs(self.grid, [self.start, self.end], target=self.end)
+        self.assertEqual(result.distance(self.end), 0)
+        # The search stops before expanding anything once the target is a start.
+        self.assertIsNone(result.distance(self.grid.index(2, 0)))
+
+    def test_bfs_matches_grid_bfs(self):
+        cells, offsets = self.grid.cells, self.grid.offsets
+
+        def neighbors(node):
+            return [
+                node + offset
+                for offset in offsets
+                if cells[node + offset] not in (0, ord("#"))
+            ]
+
+        expected = grid_bfs(self.grid, [self.start]).distances
+        self.assertEqual(bfs([self.start], neighbors, len(cells)).distances, expected)
+
+    def test_weighted_searches_agree(self):
+        def neighbors(node):
+            return EDGES[node]
+
+        for search in (dijkstra, zero_one_bfs):
+            result = search([0], neighbors, 5, predecessors=True)
+            self.assertEqual(result.distances, [0, 1, 1, 2, UNREACHED])
+            self.assertEqual(result.on_shortest_paths([3]), {0, 1, 2, 3})
+
+        result = a_star([0], neighbors, 5, 3, lambda node: 0 if node == 3 else 1)
+        self.assertEqual(result.distance(3), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
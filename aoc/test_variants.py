@@ -0,0 +1,70 @@
+import importlib
+import os
+import tempfile
+import unittest
+
+from .variants import VariantRegistry, compare_variants, variant_report
+
+
+def read_numbers(path):
+    with open(path) as f:
+        return [int(line) for line in f]
+
+
+class TestVariants(unittest.TestCase):
+    def setUp(self):
+        self.registry = VariantRegistry(read_numbers)
+        self.registry.register("part_1", "builtin", sum)
+
+        @self.registry.register("part_1", "loop")
+        def loop(numbers):
+            total = 0
+            for number in numbers:
+                total += number
+            return total
+
+        self.registry.register("part_1", "off_by_one", lambda numbers: sum(numbers) + 1)
+
+    def test_register(self):
+        self.assertEqual(
+            self.registry.names("part_1"), ["builtin", "loop", "off_by_one"]
+        )
+        self.assertIs(self.registry.get("part_1", "builtin"), sum)
+        with self.assertRaises(ValueError):
+            self.registry.register("part_1", "builtin", max)
+        with self.assertRaises(ValueError):
+            self.registry.get("part_2", "builtin")
+
+    def test_compare_flags_mismatches(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "input.txt")
+            with open(path, "w") as f:
+                f.write("1\n2\n3\n")
+            results = compare_variants("test", self.registry, [path], repeat=2)
+        by_name = {result.name: result for result in results}
+        self.assertTrue(by_name["builtin"].reference)
+        self.assertEqual(by_name["loop"].answers, [6])
+        self.assertEqual(by_name["loop"].mismatches, [])
+        self.assertEqual(by_name["off_by_one"].mismatches, [path])
+        self.assertEqual(by_name["loop"].timing.runs, 2)
+
+        report = variant_report(results)
+        self.assertIn("reference", report)
+        self.assertIn("MISMATCH on 1 inputs", report)
+
+    def test_day_07_variants_agree(self):
+        day_07 = importlib.import_module("2024_07.aoc_2024_07")
+        results = compare_variants(
+            "2024_07", day_07.VARIANTS, ["./2024_07/2024_07_test.txt"], repeat=1
+        )
+        self.assertEqual(len(results), 2 * len(day_07.ENGINES))
+        for result in results:
+            self.assertEqual(result.mismatches, [])
+        self.assertEqual(
+            {result.part: result.answers for result in results},
+            {"part_1": [3749], "part_2": [11387]},
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
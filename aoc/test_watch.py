@@ -0,0 +1,53 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from .bench import Timing
+from .watch import changed_files, format_delta, run_once, snapshot, watched_files
+
+
+class TestWatch(unittest.TestCase):
+    def test_snapshot_detects_changes(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "input.txt")
+            missing = os.path.join(directory, "missing.txt")
+            with open(path, "w") as f:
+                f.write("1\n")
+            before = snapshot([path, missing])
+            self.assertEqual(list(before), [path])
+            self.assertEqual(changed_files(before, snapshot([path])), [])
+            os.utime(path, ns=(0, before[path] + 1_000_000))
+            self.assertEqual(changed_files(before, snapshot([path])), [path])
+            self.assertEqual(changed_files(before, {}), [path])
+
+    def test_watched_files_include_tests_and_shared_modules(self):
+        names = {
+            os.path.relpath(path, os.path.dirname(os.path.dirname(path)))
+            for path in watched_files("2024_18", "2024_18/2024_18_input.txt")
+        }
+        self.assertIn(os.path.join("2024_18", "test_2024_18.py"), names)
+        self.assertIn(os.path.join("2024_18", "2024_18_input.txt"), names)
+        self.assertIn(os.path.join("aoc", "search.py"), names)
+
+    def test_run_once_and_delta(self):
+        timing = run_once("2024_01", "2024_01/2024_01_test.txt", {}, 2, tests=True)
+        self.assertEqual(timing.answers, {"part_1": 11, "part_2": 31})
+        self.assertEqual(timing.runs, 2)
+
+        with mock.patch(
+            "aoc.watch.tuned_day_args", return_value={"engine": "backtrace"}
+        ) as tuned:
+            run_once("2024_07", "2024_07/2024_07_test.txt", {}, 1, tests=False)
+        tuned.assert_called_once_with("2024_07", "2024_07/2024_07_test.txt", {})
+
+        previous = Timing("2024_01", 3, 1.0, 2.0, 2.0, 0.0)
+        timing = Timing("2024_01", 3, 1.0, 1.5, 2.0, 0.0, phases={"parse": 0.5})
+        self.assertEqual(
+            format_delta(timing, previous),
+            "2024_01: 1.500 ms (-0.500 ms, -25.0%) [parse 0.500]",
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,135 @@
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+from .bench import Timing, summarize
+
+Parser = Callable[[str], Any]
+Implementation = Callable[[Any], Any]
+
+
+class VariantRegistry:
+    """Named implementations of a day's parts, run on one shared parsed input.
+
+    A day declares `VARIANTS = VariantRegistry(parse)` and registers each way
+    of solving a part; the first one registered for a part is its reference.
+    Implementations must not mutate the parsed input, which they share.
+    """
+
+    def __init__(self, parse: Parser):
+        self.parse = parse
+        self.parts: Dict[str, Dict[str, Implementation]] = {}
+
+    def register(
+        self, part: str, name: str, implementation: Optional[Implementation] = None
+    ):
+        """Register `implementation`, or decorate one, as `name` for `part`."""
+
+        def add(implementation: Implementation) -> Implementation:
+            implementations = self.parts.setdefault(part, {})
+            if name in implementations:
+                raise ValueError(f"{part} already has a variant {name}")
+            implementations[name] = implementation
+            return implementation
+
+        return add if implementation is None else add(implementation)
+
+    def names(self, part: str) -> List[str]:
+        return list(self.parts.get(part, {}))
+
+    def get(self, part: str, name: str) -> Implementation:
+        try:
+            return self.parts[part][name]
+        except KeyError:
+            available = ", ".join(self.names(part)) or "none"
+            message = f"No {part} variant {name}, available: {available}"
+            raise ValueError(message) from None
+
+
+@dataclass
+class VariantResult:
+    part: str
+    name: str
+    timing: Timing
+    answers: List[Any]
+    reference: bool = False
+    # Inputs where the answer differs from the reference variant's.
+    mismatches: List[str] = field(default_factory=list)
+
+
+def compare_variants(
+    day: str,
+    registry: VariantRegistry,
+    input_paths: List[str],
+    repeat: int = 5,
+    warmup: int = 1,
+    parts: Optional[List[str]] = None,
+) -> List[VariantResult]:
+    """Time every variant on the same parsed inputs and cross-check answers.
+
+    A sample is one pass over all inputs. The answers of the first, untimed
+    run are compared with those of the part's reference variant.
+    """
+    parsed = [registry.parse(path) for path in input_paths]
+    results = []
+    for part in parts or list(registry.parts):
+        reference = None
+        for name, implementation in registry.parts[part].items():
+            answers = [implementation(data) for data in parsed]
+            for _ in range(warmup - 1):
+                for data in parsed:
+                    implementation(data)
+            samples = []
+            for _ in range(repeat):
+                start = time.perf_counter_ns()
+                for data in parsed:
+                    implementation(data)
+                samples.append(time.perf_counter_ns() - start)
+            result = VariantResult(part, name, summarize(day, samples), answers)
+            if reference is None:
+                reference = result
+                result.reference = True
+            else:
+                result.mismatches = [
+                    path
+                    for path, answer, expected in zip(
+                        input_paths, answers, reference.answers
+                    )
+                    if answer != expected
+                ]
+            results.append(result)
+    return results
+
+
+def variant_report(results: List[VariantResult]) -> str:
+    """Variants ranked by median time within each part, fastest first."""
+    rows = []
+    for part in dict.fromkeys(result.part for result in results):
+        ranked = sorted(
+            (result for result in results if result.part == part),
+            key=lambda result: result.timing.median_ms,
+        )
+        fastest = ranked[0].timing.median_ms or float("nan")
+        if rows:
+            rows.append("")
+        rows.append(part)
+        rows.append(
+            f"{'rank':<6} {'variant':<28} {'median ms':>10} {'min ms':>10} "
+            f"{'p95 ms':>10} {'stddev':>8} {'relative':>9}  answers"
+        )
+        for rank, result in enumerate(ranked, 1):
+            timing = result.timing
+            if result.mismatches:
+                check = (
+                    f"MISMATCH on {len(result.mismatches)} inputs, "
+                    f"e.g. {result.mismatches[0]}"
+                )
+            else:
+                check = "reference" if result.reference else "ok"
+            rows.append(
+                f"{rank:<6} {result.name:<28} {timing.median_ms:>10.3f} "
+                f"{timing.min_ms:>10.3f} {timing.p95_ms:>10.3f} "
+                f"{timing.stddev_ms:>8.3f} {timing.median_ms / fastest:>8.2f}x  "
+                + check
+            )
+    return "\n".join(rows)
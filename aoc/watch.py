@@ -0,0 +1,158 @@
+import argparse
+import io
+import os
+import sys
+import time
+import unittest
+from typing import Dict, List, Optional, Set
+
+from .bench import Timing, sample_solver, summarize
+from .days import load_solver, module_name, script_path
+from .engines import tuned_day_args
+from .generators import workload
+from .parse_cache import PARSE_CACHE_ENV
+from .result_cache import source_files
+
+Snapshot = Dict[str, int]
+
+
+def watched_files(day: str, input_file_path: str) -> List[str]:
+    """The day's sources and tests, the `aoc` modules it uses, and its input."""
+    day_dir = os.path.dirname(os.path.abspath(script_path(day)))
+    tests = [
+        os.path.join(day_dir, name)
+        for name in os.listdir(day_dir)
+        if name.startswith("test_") and name.endswith(".py")
+    ]
+    return sorted(set(source_files(day) + tests + [os.path.abspath(input_file_path)]))
+
+
+def snapshot(paths: List[str]) -> Snapshot:
+    """Modification time of each path; missing files are left out."""
+    mtimes = {}
+    for path in paths:
+        try:
+            mtimes[path] = os.stat(path).st_mtime_ns
+        except FileNotFoundError:
+            pass
+    return mtimes
+
+
+def changed_files(before: Snapshot, after: Snapshot) -> List[str]:
+    return sorted(
+        path for path in set(before) | set(after) if before.get(path) != after.get(path)
+    )
+
+
+def unload_modules(keep: Set[str]) -> None:
+    """Forget every module imported since `keep` was recorded.
+
+    That covers the day package and the shared modules only the day uses,
+    while the watcher's own modules, e.g. `aoc.phases`, stay shared.
+    """
+    for name in list(sys.modules):
+        if name not in keep:
+            del sys.modules[name]
+
+
+def run_tests(day: str) -> unittest.TestResult:
+    package = module_name(day).split(".")[0]
+    suite = unittest.defaultTestLoader.loadTestsFromName(f"{package}.test_{day}")
+    stream = io.StringIO()
+    result = unittest.TextTestRunner(stream=stream, verbosity=0).run(suite)
+    if not result.wasSuccessful():
+        print(stream.getvalue(), end="")
+    return result
+
+
+def format_delta(timing: Timing, previous: Optional[Timing]) -> str:
+    line = f"{timing.day}: {timing.median_ms:.3f} ms"
+    if previous is not None and previous.median_ms:
+        delta = timing.median_ms - previous.median_ms
+        line += f" ({delta:+.3f} ms, {100 * delta / previous.median_ms:+.1f}%)"
+    phases = ", ".join(f"{name} {ms:.3f}" for name, ms in timing.phases.items())
+    if phases:
+        line += f" [{phases}]"
+    return line
+
+
+def run_once(
+    day: str, input_file_path: str, day_args: dict, repeat: int, tests: bool
+) -> Optional[Timing]:
+    """Run the tests and time `main()`; None when either fails."""
+    try:
+        if tests and not run_tests(day).wasSuccessful():
+            print(f"{day}: tests failed")
+            return None
+        solver = load_solver(day, tuned_day_args(day, input_file_path, day_args))
+        samples, phase_samples, answers = sample_solver(
+            solver, input_file_path, repeat, warmup=0
+        )
+    except Exception as e:
+        print(f"{day}: {type(e).__name__}: {e}")
+        return None
+    timing = summarize(day, samples, phase_samples)
+    timing.answers = answers or {}
+    return timing
+
+
+def watch(
+    day: str,
+    scale: Optional[float] = None,
+    seed: int = 0,
+    repeat: int = 3,
+    tests: bool = True,
+    interval: float = 0.2,
+) -> None:
+    """Re-run a day whenever one of its files changes, until interrupted."""
+    input_file_path, day_args = workload(day, scale, seed)
+    keep = set(sys.modules)
+    previous = None
+    mtimes: Snapshot = {}
+    while True:
+        paths = watched_files(day, input_file_path)
+        current = snapshot(paths)
+        changed = changed_files(mtimes, current)
+        if changed:
+            if mtimes:
+                names = ", ".join(os.path.relpath(path) for path in changed)
+                print(f"Changed: {names}")
+            mtimes = current
+            unload_modules(keep)
+            timing = run_once(day, input_file_path, day_args, repeat, tests)
+            if timing is not None:
+                print(format_delta(timing, previous), timing.answers)
+                previous = timing
+        time.sleep(interval)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Re-run a day's tests and re-time it whenever its files change."
+    )
+    parser.add_argument("day", help="day to watch, e.g. 2024_07")
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per change")
+    parser.add_argument("--scale", type=float, help="time on a generated input")
+    parser.add_argument("--seed", type=int, default=0, help="generated input seed")
+    parser.add_argument("--no-tests", action="store_true", help="skip the day's tests")
+    parser.add_argument(
+        "--interval", type=float, default=0.2, help="seconds between file polls"
+    )
+    args = parser.parse_args(argv)
+    # Time the parser on every run rather than an unpickle.
+    os.environ[PARSE_CACHE_ENV] = "0"
+    try:
+        watch(
+            args.day,
+            args.scale,
+            args.seed,
+            args.repeat,
+            tests=not args.no_tests,
+            interval=args.interval,
+        )
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,18 @@
+import argparse
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
 import requests
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from aoc.mirror import InputMirror
+
+BASE_URL = "https://adventofcode.com"
+DEFAULT_WORKERS = 5
+RETRY_STATUSES = (429, 500, 502, 503, 504)
 
 def read_template(template_name):
     try:
@@ -10,47 +21,190 @@ def read_template(template_name):
     except FileNotFoundError:
         sys.exit(f"Template file {template_name} not found.")
 
-def create_file(file_path, content=""):
+def create_file(file_path, content="", overwrite=True):
+    if not overwrite and os.path.exists(file_path):
+        return
     try:
         with open(file_path, 'w') as file:
             file.write(content)
     except IOError as e:
         sys.exit(f"Failed to create file {file_path}: {e}")
 
-def download_input_file(url, cookies, input_file):
+def make_session(session_cookie, workers=DEFAULT_WORKERS, retries=3,
+                 backoff_factor=1.0):
+    """One keep-alive connection pool shared by all downloads, with retry/backoff
+    on throttling and server errors."""
+    session = requests.Session()
+    session.cookies.set('session', session_cookie or '')
+    retry = Retry(
+        total=retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=["GET"],
+    )
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=workers, max_retries=retry)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+def input_url(year, day, base_url=BASE_URL):
+    return f"{base_url}/{year}/day/{int(day)}/input"
+
+def input_file_path(year, day, directory="."):
+    return os.path.join(directory, f"{year}_{day}", f"{year}_{day}_input.txt")
+
+def fetch_input(session, url, input_file, mirror=None, date=None, refresh=False,
+                offline=False):
+    """Download one input unless it is already present.
+
+    With a mirror the input is linked from it when known, revalidated with a
+    conditional GET on refresh, and taken from it when the network is down.
+    Returns "skipped", "fetched", "mirrored", "not modified" or "offline".
+    """
+    if not refresh and os.path.exists(input_file) and os.path.getsize(input_file) > 0:
+        return "skipped"
+    entry = mirror.lookup(date) if mirror else None
+    if entry and (offline or not refresh):
+        mirror.link(entry, input_file)
+        return "offline" if offline else "mirrored"
+    if offline:
+        return "failed: not in the mirror"
+
+    headers = mirror.conditional_headers(entry) if mirror else {}
+    try:
+        response = session.get(url, headers=headers, timeout=30)
+    except requests.ConnectionError:
+        if entry is None:
+            raise
+        mirror.link(entry, input_file)
+        return "offline"
+    if response.status_code == 304 and entry:
+        mirror.link(entry, input_file)
+        return "not modified"
+    response.raise_for_status()
+
+    if mirror:
+        entry = mirror.store(
+            date,
+            response.content,
+            response.headers.get('ETag'),
+            response.headers.get('Last-Modified'),
+        )
+        mirror.link(entry, input_file)
+    else:
+        os.makedirs(os.path.dirname(input_file), exist_ok=True)
+        with open(input_file, 'wb') as file:
+            file.write(response.content)
+    return "fetched"
+
+def download_input_file(url, cookies, input_file, mirror=None, date=None,
+                        refresh=False, offline=False):
     try:
-        response = requests.get(url, cookies=cookies)
-        response.raise_for_status()
-        with open(input_file, 'w') as file:
-            file.write(response.text)
+        session = make_session(cookies['session'])
+        status = fetch_input(session, url, input_file, mirror, date, refresh,
+                             offline)
     except requests.RequestException as e:
         sys.exit(f"Failed to download input file: {e}")
+    if status.startswith("failed"):
+        sys.exit(f"Failed to download input file: {status}")
 
-def initialize_day(date):
-    load_dotenv()
-    year, day = date.split('-')
+def fetch_inputs(dates, session, base_url=BASE_URL, workers=DEFAULT_WORKERS,
+                 directory=".", mirror=None, refresh=False, offline=False):
+    """Fetch the inputs of several (year, day) pairs concurrently.
+
+    Returns {date: status}, where status is one of the `fetch_input` results
+    or the error.
+    """
+    results = {}
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {
+            pool.submit(
+                fetch_input,
+                session,
+                input_url(year, day, base_url),
+                input_file_path(year, day, directory),
+                mirror,
+                f"{year}-{day}",
+                refresh,
+                offline,
+            ): f"{year}-{day}"
+            for year, day in dates
+        }
+        for future in as_completed(futures):
+            try:
+                results[futures[future]] = future.result()
+            except requests.RequestException as e:
+                results[futures[future]] = f"failed: {e}"
+    return results
+
+def parse_dates(date_range):
+    """Parse `YYYY-dd` or `YYYY-dd..YYYY-dd` into (year, day) pairs."""
+    first, _, last = date_range.partition('..')
+    year, start = first.split('-')
+    end_year, end = (last or first).split('-')
+    if end_year != year:
+        raise ValueError(f"Range {date_range} spans more than one year")
+    return [(year, f"{day:02d}") for day in range(int(start), int(end) + 1)]
+
+def scaffold_day(year, day, overwrite=True):
     day_folder = f"{year}_{day}"
     os.makedirs(day_folder, exist_ok=True)
 
     init_file = os.path.join(day_folder, '__init__.py')
     main_file = os.path.join(day_folder, f"aoc_{year}_{day}.py")
     test_file = os.path.join(day_folder, f"test_{year}_{day}.py")
-    input_file = os.path.join(day_folder, f"{year}_{day}_input.txt")
     test_input_file = os.path.join(day_folder, f"{year}_{day}_test.txt")
 
     main_template = read_template('main_template.txt')
     test_template = read_template('test_template.txt')
 
-    create_file(init_file)
-    create_file(main_file, main_template.format(year=year, day=day))
-    create_file(test_file, test_template.format(year=year, day=day))
-    create_file(test_input_file)
+    create_file(init_file, overwrite=overwrite)
+    create_file(main_file, main_template.format(year=year, day=day), overwrite)
+    create_file(test_file, test_template.format(year=year, day=day), overwrite)
+    create_file(test_input_file, overwrite=overwrite)
 
-    url = f"https://adventofcode.com/{year}/day/{int(day)}/input"
+def initialize_day(date, mirror=None, refresh=False, offline=False):
+    load_dotenv()
+    year, day = date.split('-')
+    scaffold_day(year, day)
+
+    url = input_url(year, day)
     cookies = {'session': os.getenv('SESSION_COOKIE')}
-    download_input_file(url, cookies, input_file)    
+    download_input_file(url, cookies, input_file_path(year, day), mirror, date,
+                        refresh, offline)
+
+def initialize_days(date_range, workers=DEFAULT_WORKERS, mirror=None, refresh=False,
+                    offline=False):
+    """Scaffold missing days without touching existing solutions and fetch
+    all missing inputs over one pooled session."""
+    load_dotenv()
+    dates = parse_dates(date_range)
+    for year, day in dates:
+        scaffold_day(year, day, overwrite=False)
+
+    with make_session(os.getenv('SESSION_COOKIE'), workers) as session:
+        results = fetch_inputs(dates, session, workers=workers, mirror=mirror,
+                               refresh=refresh, offline=offline)
+    for date in sorted(results):
+        print(f"{date}: {results[date]}")
+    if any(status.startswith("failed") for status in results.values()):
+        sys.exit("Some inputs could not be downloaded.")
 
 if __name__ == "__main__":
-    if len(sys.argv) != 2:
-        sys.exit("Usage: python init_day.py YYYY-dd")
-    initialize_day(sys.argv[1])
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Set up Advent of Code days")
+    parser.add_argument('date', help="YYYY-dd, or YYYY-dd..YYYY-dd to fetch a range")
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS,
+                        help="concurrent downloads for a range")
+    parser.add_argument('--mirror', help="input mirror directory "
+                        "(default $AOC_INPUT_MIRROR or ~/.cache/aoc/inputs)")
+    parser.add_argument('--no-mirror', action='store_true',
+                        help="download without the mirror")
+    parser.add_argument('--refresh', action='store_true',
+                        help="revalidate inputs with a conditional GET")
+    parser.add_argument('--offline', action='store_true', help="only use the mirror")
+    args = parser.parse_args()
+    mirror = None if args.no_mirror else InputMirror(args.mirror)
+    if '..' in args.date:
+        initialize_days(args.date, args.workers, mirror, args.refresh, args.offline)
+    else:
+        initialize_day(args.date, mirror, args.refresh, args.offline)
@@ -1,12 +1,40 @@
+import argparse
+import csv
+import json
 import os
 import time
 import subprocess
 import sys
+from typing import Any, Dict, List
+
+from aoc.autotune import tune_day, tuning_report
+from aoc.batch import expand_inputs, run_batch
+from aoc.bench import Timing, measure_day
+from aoc.budget import budget_for, load_budgets, measure_day_within_budget
+from aoc.days import find_days, import_day
+from aoc.engines import save_profile
+from aoc.generators import workload
+from aoc.history import (
+    append_run,
+    comparable,
+    compare_runs,
+    find_run,
+    load_runs,
+    measured_days,
+)
+from aoc.imports import day_import_cost, import_report
+from aoc.parallel import run_parallel
+from aoc.parse_cache import PARSE_CACHE_ENV
+from aoc.profiling import PROFILE_DIR, profile_day
+from aoc.result_cache import cache_key, load_result, store_result
+from aoc.scaling import DEFAULT_SCALING_SCALES, measure_scaling, scaling_report
+from aoc.variants import compare_variants, variant_report
 
 
 def measure_execution_time(script):
+    module = os.path.splitext(os.path.relpath(script))[0].replace(os.sep, ".")
     start_time = time.time()
-    subprocess.run([sys.executable, script], check=True)
+    subprocess.run([sys.executable, "-m", module], check=True)
     end_time = time.time()
     return end_time - start_time
 
@@ -24,7 +52,38 @@ def find_scripts(directory):
     return scripts
 
 
-def main():
+def flatten_row(row: dict) -> dict:
+    answers = row.pop("answers")
+    row.update({f"answer_{name}": value for name, value in answers.items()})
+    phases = row.pop("phases")
+    row.update({f"{name}_ms": value for name, value in phases.items()})
+    memory = row.pop("memory")
+    if memory:
+        row["peak_kib"] = memory["peak_kib"]
+        row["net_kib"] = memory["net_kib"]
+        row.update(
+            {
+                f"{name}_peak_kib": phase_memory["peak_kib"]
+                for name, phase_memory in memory["phases"].items()
+            }
+        )
+    return row
+
+
+def write_timings(timings: List[Timing], output_format: str, stream) -> None:
+    rows = [timing.to_dict() for timing in timings]
+    if output_format == "json":
+        json.dump(rows, stream, indent=2)
+        stream.write("\n")
+    else:
+        rows = [flatten_row(row) for row in rows]
+        fieldnames = list(dict.fromkeys(key for row in rows for key in row))
+        writer = csv.DictWriter(stream, fieldnames=fieldnames)
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def run_subprocesses():
     scripts = find_scripts(".")
     results = []
 
@@ -40,5 +99,351 @@ def main():
         print(f"{script}: {exec_time} seconds")
 
 
+def measurement_settings(args: argparse.Namespace) -> Dict[str, Any]:
+    """What a run was measured with, recorded in the history and result cache.
+
+    `budget` is None when unbudgeted, else the per-day overrides in force.
+    """
+    budget = None
+    if args.budget or args.budgets:
+        budget = load_budgets(args.budgets) if args.budgets else {}
+    return {
+        "repeat": args.repeat,
+        "warmup": args.warmup,
+        "memory": args.memory,
+        "scale": args.scale,
+        "seed": args.seed,
+        "budget": budget,
+        "parse_cache": args.parse_cache,
+    }
+
+
+def measure_days(days: List[str], args: argparse.Namespace) -> List[Timing]:
+    budgets = None
+    if args.budget or args.budgets:
+        overrides = load_budgets(args.budgets) if args.budgets else None
+        budgets = {day: budget_for(day, overrides) for day in days}
+    if args.jobs == 1:
+        measure_args = (args.repeat, args.warmup, args.memory, args.scale, args.seed)
+        if budgets is None:
+            return [measure_day(day, *measure_args) for day in days]
+        return [
+            measure_day_within_budget(day, *measure_args, budget=budgets[day])
+            for day in days
+        ]
+    return run_parallel(
+        days,
+        args.repeat,
+        args.warmup,
+        args.jobs,
+        args.memory,
+        args.scale,
+        args.seed,
+        budgets,
+    )
+
+
+def measure_changed_days(days: List[str], args: argparse.Namespace) -> List[Timing]:
+    """Replay cached results of days whose sources and input are unchanged."""
+    settings = measurement_settings(args)
+    keys = {}
+    for day in days:
+        try:
+            keys[day] = cache_key(day, settings)
+        except (OSError, SyntaxError):
+            keys[day] = None
+    timings = {}
+    if not args.force:
+        for day, key in keys.items():
+            cached = load_result(key) if key else None
+            if cached is not None:
+                timings[day] = cached
+    if timings:
+        print(f"Replayed {len(timings)} unchanged days", file=sys.stderr)
+
+    for timing in measure_days([day for day in days if day not in timings], args):
+        if keys[timing.day]:
+            store_result(keys[timing.day], timing)
+        timings[timing.day] = timing
+    return [timings[day] for day in days]
+
+
+def run_in_process(args: argparse.Namespace):
+    days = args.days or find_days(".")
+    suite_start = time.perf_counter()
+    timings = measure_changed_days(days, args)
+    suite_time = time.perf_counter() - suite_start
+    print(f"Suite time: {suite_time:.3f} seconds", file=sys.stderr)
+    if not args.no_history:
+        run = append_run(timings, measurement_settings(args))
+        if run is None:
+            print("Nothing was measured, no run recorded", file=sys.stderr)
+        else:
+            print(f"Recorded run {run['run_id']} ({run['commit']})", file=sys.stderr)
+    if args.output:
+        with open(args.output, "w", newline="") as f:
+            write_timings(timings, args.format, f)
+    else:
+        write_timings(timings, args.format, sys.stdout)
+
+
+def run_compare(args: argparse.Namespace) -> int:
+    runs = load_runs()
+    try:
+        current = find_run(runs, args.current)
+    except ValueError as e:
+        sys.exit(str(e))
+    try:
+        # Among runs measured the same way and sharing a day with the current
+        # one, so "previous" skips other scales and runs of other days.
+        baseline = find_run(
+            [
+                run
+                for run in runs
+                if comparable(run, current)
+                and measured_days(run) & measured_days(current)
+            ],
+            args.compare,
+        )
+    except ValueError:
+        # Look further only to report why the run cannot be compared.
+        try:
+            baseline = find_run(runs, args.compare)
+        except ValueError as e:
+            sys.exit(str(e))
+    try:
+        changes = compare_runs(baseline, current, args.threshold, args.min_delta_ms)
+    except ValueError as e:
+        sys.exit(str(e))
+    print(f"Baseline {baseline['run_id']} ({baseline['commit']})")
+    print(f"Current  {current['run_id']} ({current['commit']})")
+    for change in changes:
+        print(change)
+    regressions = [change for change in changes if change.is_regression]
+    if not changes:
+        print(f"No day moved more than {args.threshold}%")
+    return 1 if regressions else 0
+
+
+def run_profile(args: argparse.Namespace):
+    print(
+        profile_day(args.profile, args.profile_dir, args.top, args.scale, args.seed)
+    )
+    print(f"Profile written to {os.path.join(args.profile_dir, args.profile)}.*")
+
+
+def run_scaling(args: argparse.Namespace):
+    points = measure_scaling(
+        args.scaling,
+        args.scales or DEFAULT_SCALING_SCALES,
+        args.repeat,
+        args.warmup,
+        args.seed,
+    )
+    print(scaling_report(points, args.target_scale))
+
+
+def run_batch_mode(args: argparse.Namespace):
+    inputs = expand_inputs(args.inputs)
+    if not inputs:
+        sys.exit(f"No inputs match {args.inputs}")
+    stream = open(args.output, "w") if args.output else sys.stdout
+    start = time.perf_counter()
+    errors = 0
+    try:
+        for result in run_batch(args.batch, inputs, args.jobs or None):
+            errors += result["error"] is not None
+            stream.write(json.dumps(result) + "\n")
+            stream.flush()
+    finally:
+        if args.output:
+            stream.close()
+    elapsed = time.perf_counter() - start
+    print(
+        f"Solved {len(inputs)} inputs ({errors} errors) in {elapsed:.3f} seconds: "
+        f"{len(inputs) / elapsed:.1f} inputs/s",
+        file=sys.stderr,
+    )
+
+
+def run_variants(args: argparse.Namespace) -> int:
+    registry = getattr(import_day(args.variants), "VARIANTS", None)
+    if registry is None:
+        sys.exit(f"{args.variants} registers no variants")
+    if args.inputs:
+        inputs = expand_inputs(args.inputs)
+    else:
+        inputs = [workload(args.variants, args.scale, args.seed)[0]]
+    results = compare_variants(
+        args.variants, registry, inputs, args.repeat, args.warmup
+    )
+    print(variant_report(results))
+    return 1 if any(result.mismatches for result in results) else 0
+
+
+def run_autotune(args: argparse.Namespace):
+    tuning = tune_day(args.autotune, args.scales, args.repeat, args.warmup, args.seed)
+    save_profile(args.autotune, tuning)
+    print(tuning_report(args.autotune, tuning))
+
+
+def run_import_times(args: argparse.Namespace):
+    days = args.days or find_days(".")
+    print(import_report([day_import_cost(day) for day in days]))
+
+
+def parse_args(argv: List[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Measure Advent of Code solutions")
+    parser.add_argument(
+        "--in-process",
+        action="store_true",
+        help="import each day and time main() repeatedly instead of spawning scripts",
+    )
+    parser.add_argument("--days", nargs="*", help="day folders, e.g. 2024_07")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="parallel workers for --in-process and --batch, 0 means one per CPU",
+    )
+    parser.add_argument(
+        "--memory",
+        action="store_true",
+        help="trace one extra run per day with tracemalloc for peak memory and sites",
+    )
+    parser.add_argument(
+        "--scale",
+        type=float,
+        help="run on generated inputs of this size relative to the real input",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="seed for --scale inputs")
+    parser.add_argument(
+        "--scaling",
+        metavar="DAY",
+        help="time one day over --scales and fit its runtime to complexity classes",
+    )
+    parser.add_argument(
+        "--scales",
+        type=float,
+        nargs="+",
+        help="input scales for --scaling (default 0.125 0.25 0.5 1) and "
+        "--autotune (default 0.1 1 10)",
+    )
+    parser.add_argument(
+        "--autotune",
+        metavar="DAY",
+        help="time the day's engines over --scales and store where each is fastest",
+    )
+    parser.add_argument(
+        "--target-scale",
+        type=float,
+        default=100.0,
+        help="project the --scaling runtime to this scale",
+    )
+    parser.add_argument("--format", choices=["json", "csv"], default="json")
+    parser.add_argument("--output", help="write timings to this file")
+    parser.add_argument(
+        "--no-history", action="store_true", help="do not record the run in history"
+    )
+    parser.add_argument(
+        "--budget",
+        action="store_true",
+        help="measure each day in a child process stopped when over its budget",
+    )
+    parser.add_argument(
+        "--budgets",
+        metavar="FILE",
+        help="JSON per-day budget overrides, e.g. {\"2024_23\": {\"wall_s\": 5}}; "
+        "implies --budget",
+    )
+    parser.add_argument(
+        "--parse-cache",
+        action="store_true",
+        help="let parses come from the parse cache; by default every timed run "
+        "parses, except in --batch",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="re-run days even when their sources and input are unchanged",
+    )
+    parser.add_argument(
+        "--compare",
+        metavar="BASELINE",
+        help="compare --current to this run: latest, previous, run id or commit",
+    )
+    parser.add_argument("--current", default="latest", help="run to compare")
+    parser.add_argument(
+        "--profile",
+        metavar="DAY",
+        help="run one day under cProfile and write .pstats/.collapsed/.txt files",
+    )
+    parser.add_argument("--profile-dir", default=PROFILE_DIR)
+    parser.add_argument(
+        "--batch",
+        metavar="DAY",
+        help="solve every --inputs file for one day and stream JSONL results",
+    )
+    parser.add_argument(
+        "--inputs", help="directory or glob of input files for --batch or --variants"
+    )
+    parser.add_argument(
+        "--variants",
+        metavar="DAY",
+        help="time and cross-check every registered implementation of the day",
+    )
+    parser.add_argument(
+        "--import-times",
+        action="store_true",
+        help="import each day in a fresh interpreter and report -X importtime costs",
+    )
+    parser.add_argument(
+        "--top", type=int, default=25, help="rows in the hot-function table"
+    )
+    parser.add_argument(
+        "--threshold", type=float, default=10.0, help="flag changes above this percent"
+    )
+    parser.add_argument(
+        "--min-delta-ms",
+        type=float,
+        default=0.5,
+        help="ignore changes smaller than this many milliseconds",
+    )
+    args = parser.parse_args(argv)
+    if args.scaling and args.scales and len(set(args.scales)) < 2:
+        parser.error("--scaling needs at least two distinct --scales to fit")
+    return args
+
+
+def main(argv: List[str] = None):
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    # After warmup a cached parse is an unpickle, which would be timed instead
+    # of the parser. Child processes inherit the setting.
+    if args.parse_cache:
+        os.environ[PARSE_CACHE_ENV] = "1"
+    elif not args.batch:
+        os.environ[PARSE_CACHE_ENV] = "0"
+    if args.compare:
+        sys.exit(run_compare(args))
+    elif args.profile:
+        run_profile(args)
+    elif args.scaling:
+        run_scaling(args)
+    elif args.import_times:
+        run_import_times(args)
+    elif args.batch:
+        run_batch_mode(args)
+    elif args.variants:
+        sys.exit(run_variants(args))
+    elif args.autotune:
+        run_autotune(args)
+    elif args.in_process:
+        run_in_process(args)
+    else:
+        run_subprocesses()
+
+
 if __name__ == "__main__":
     main()
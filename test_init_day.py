@@ -0,0 +1,158 @@
+import os
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from aoc.mirror import InputMirror
+from init_day import (
+    download_input_file,
+    fetch_inputs,
+    input_file_path,
+    input_url,
+    make_session,
+    parse_dates,
+)
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Serves `/2024/day/N/input` with an ETag, failing the first request for day 3."""
+
+    requests_by_path = {}
+    connections = set()
+
+    def do_GET(self):
+        with self.server.lock:
+            count = self.requests_by_path.get(self.path, 0) + 1
+            self.requests_by_path[self.path] = count
+            self.connections.add(self.client_address)
+        if self.path == "/2024/day/3/input" and count == 1:
+            self.send_response(503)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        body = f"input for {self.path}\n".encode()
+        etag = f'"{len(body)}-{self.path}"'
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestInitDay(unittest.TestCase):
+    def setUp(self):
+        StubHandler.requests_by_path = {}
+        StubHandler.connections = set()
+        StubHandler.protocol_version = "HTTP/1.1"
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+        self.server.lock = threading.Lock()
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.base_url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.directory.cleanup()
+
+    def test_parse_dates(self):
+        self.assertEqual(parse_dates("2024-09"), [("2024", "09")])
+        self.assertEqual(
+            parse_dates("2024-01..2024-03"),
+            [("2024", "01"), ("2024", "02"), ("2024", "03")],
+        )
+        with self.assertRaises(ValueError):
+            parse_dates("2023-01..2024-03")
+
+    def test_fetch_inputs_retries_and_skips_existing(self):
+        existing = os.path.join(self.directory.name, "2024_02", "2024_02_input.txt")
+        os.makedirs(os.path.dirname(existing))
+        with open(existing, "w") as f:
+            f.write("already here\n")
+
+        dates = parse_dates("2024-01..2024-06")
+        with make_session("cookie", workers=2, backoff_factor=0) as session:
+            results = fetch_inputs(
+                dates, session, self.base_url, workers=2, directory=self.directory.name
+            )
+
+        self.assertEqual(results["2024-02"], "skipped")
+        self.assertEqual(
+            sorted(date for date, status in results.items() if status == "fetched"),
+            ["2024-01", "2024-03", "2024-04", "2024-05", "2024-06"],
+        )
+        self.assertNotIn("/2024/day/2/input", StubHandler.requests_by_path)
+        self.assertEqual(StubHandler.requests_by_path["/2024/day/3/input"], 2)
+        # Keep-alive connections are reused instead of one per download.
+        self.assertLessEqual(len(StubHandler.connections), 2)
+        fetched = os.path.join(self.directory.name, "2024_03", "2024_03_input.txt")
+        with open(fetched) as f:
+            self.assertEqual(f.read(), "input for /2024/day/3/input\n")
+
+    def fetch(self, checkout, **options):
+        with make_session("cookie", workers=2, backoff_factor=0) as session:
+            return fetch_inputs(
+                parse_dates("2024-01..2024-02"),
+                session,
+                self.base_url,
+                workers=2,
+                directory=os.path.join(self.directory.name, checkout),
+                mirror=self.mirror,
+                **options,
+            )
+
+    def test_mirror_shares_inputs_between_checkouts(self):
+        self.mirror = InputMirror(os.path.join(self.directory.name, "mirror"))
+        self.assertEqual(set(self.fetch("first").values()), {"fetched"})
+        self.assertEqual(set(self.fetch("second").values()), {"mirrored"})
+        self.assertEqual(StubHandler.requests_by_path["/2024/day/1/input"], 1)
+
+        first, second = (
+            os.path.join(self.directory.name, checkout, "2024_01", "2024_01_input.txt")
+            for checkout in ("first", "second")
+        )
+        self.assertTrue(os.path.samefile(first, second))
+
+    def test_mirror_revalidates_and_works_offline(self):
+        self.mirror = InputMirror(os.path.join(self.directory.name, "mirror"))
+        self.fetch("first")
+        refreshed = self.fetch("first", refresh=True)
+        self.assertEqual(set(refreshed.values()), {"not modified"})
+        self.assertEqual(set(self.fetch("second", offline=True).values()), {"offline"})
+
+        self.server.shutdown()
+        self.server.server_close()
+        self.assertEqual(set(self.fetch("third", refresh=True).values()), {"offline"})
+
+    def test_single_day_download_honours_refresh_and_offline(self):
+        mirror = InputMirror(os.path.join(self.directory.name, "mirror"))
+        url = input_url("2024", "01", self.base_url)
+        input_file = input_file_path("2024", "01", self.directory.name)
+        cookies = {"session": "cookie"}
+        download_input_file(url, cookies, input_file, mirror, "2024-01")
+        download_input_file(url, cookies, input_file, mirror, "2024-01", refresh=True)
+        self.assertEqual(StubHandler.requests_by_path["/2024/day/1/input"], 2)
+
+        with self.assertRaises(SystemExit):
+            download_input_file(
+                input_url("2024", "02", self.base_url),
+                cookies,
+                input_file_path("2024", "02", self.directory.name),
+                mirror,
+                "2024-02",
+                offline=True,
+            )
+        self.assertNotIn("/2024/day/2/input", StubHandler.requests_by_path)
+
+
+if __name__ == "__main__":
+    unittest.main()